@@ -3,30 +3,51 @@ from typing import Optional
 
 import click
 
-from dnastack.cli.auth.command import auth
-from dnastack.cli.config.commands import config_command_group
-from dnastack.cli.collections import collection_command_group
-from dnastack.cli.config.context import context_command_group, ContextCommandHandler
-from dnastack.cli.data_connect.commands import data_connect_command_group
-from dnastack.cli.drs import drs_command_group
-from dnastack.alpha.cli.commands import alpha_command_group
 from dnastack.cli.helpers.command.decorator import command
 from dnastack.cli.helpers.command.spec import ArgumentSpec
-from dnastack.cli.helpers.command.group import AliasedGroup
-from dnastack.cli.workbench.commands import workbench_command_group
+from dnastack.cli.helpers.command.group import LazyAliasedGroup
 from dnastack.common.logger import get_logger
 from dnastack.constants import __version__
-
-APP_NAME = sys.argv[0]
-
-__library_version = __version__
-__python_version = str(sys.version).replace("\n", " ")
-__app_signature = f'{APP_NAME} {__library_version} with Python {__python_version}'
-
-_context_command_handler = ContextCommandHandler()
-
-
-@click.group(APP_NAME, cls=AliasedGroup)
+from dnastack.feature_flags import dev_mode
+
+# NOTE: The sub-command groups are only imported when they are invoked so that the CLI does not pay the import cost of
+#       every client and model just to show the version or the help message.
+_LAZY_SUBCOMMANDS = {
+    'alpha': 'dnastack.alpha.cli.commands:alpha_command_group',
+    'auth': 'dnastack.cli.auth.command:auth',
+    'collections': 'dnastack.cli.collections:collection_command_group',
+    'config': 'dnastack.cli.config.commands:config_command_group',
+    'contexts': 'dnastack.cli.config.context:context_command_group',
+    'data-connect': 'dnastack.cli.data_connect.commands:data_connect_command_group',
+    'files': 'dnastack.cli.drs:drs_command_group',
+    'workbench': 'dnastack.cli.workbench.commands:workbench_command_group',
+}
+
+_LAZY_SUBCOMMAND_ALIASES = {
+    'collections': ['cs'],
+    'data-connect': ['dataconnect', 'dc'],
+    'files': ['drs'],
+}
+
+# NOTE: The help of each sub-command group is declared here so that the help message does not import every group.
+#       It has to be kept in sync with the docstring and the visibility of the group. "None" marks a hidden group.
+_LAZY_SUBCOMMAND_HELP = {
+    'alpha': 'Interact with experimental commands.',
+    'auth': 'Manage authentication and authorization',
+    'collections': 'Interact with Collection Service or Explorer Service (e.g., Viral AI)',
+    'config': 'Manage global configuration',
+    'contexts': 'Manage contexts' if dev_mode else None,
+    'data-connect': 'Interact with Data Connect Service',
+    'files': 'Interact with Data Repository Service',
+    'workbench': 'Interact with Workbench',
+}
+
+
+@click.group('dnastack',
+             cls=LazyAliasedGroup,
+             lazy_sub_commands=_LAZY_SUBCOMMANDS,
+             lazy_sub_command_help=_LAZY_SUBCOMMAND_HELP,
+             lazy_sub_aliases=_LAZY_SUBCOMMAND_ALIASES)
 @click.version_option(__version__, message="%(version)s")
 def dnastack():
     """
@@ -34,13 +55,21 @@ def dnastack():
 
     https://dnastack.com
     """
-    get_logger(APP_NAME).debug(__app_signature)
+    get_logger(click.get_current_context().info_name).debug(_get_app_signature())
+
+
+def _get_app_signature() -> str:
+    # NOTE: The program name is resolved by click when the CLI is invoked, e.g., "dnastack" from the console script
+    #       or "python -m dnastack", rather than from sys.argv at import time.
+    app_name = click.get_current_context().find_root().info_name
+    python_version = str(sys.version).replace("\n", " ")
+    return f'{app_name} {__version__} with Python {python_version}'
 
 
 @command(dnastack)
 def version():
     """ Show the version of CLI/library """
-    click.echo(__app_signature)
+    click.echo(_get_app_signature())
 
 
 @command(dnastack,
@@ -61,25 +90,9 @@ def use(registry_hostname_or_url: str, context_name: Optional[str] = None, no_au
 
     This is a shortcut to dnastack config contexts use".
     """
-    _context_command_handler.use(registry_hostname_or_url, context_name=context_name, no_auth=no_auth)
-
-
-# noinspection PyTypeChecker
-dnastack.add_command(data_connect_command_group)
-# noinspection PyTypeChecker
-dnastack.add_command(config_command_group)
-# noinspection PyTypeChecker
-dnastack.add_command(drs_command_group)
-# noinspection PyTypeChecker
-dnastack.add_command(auth)
-# noinspection PyTypeChecker
-dnastack.add_command(collection_command_group)
-# noinspection PyTypeChecker
-dnastack.add_command(context_command_group)
-# noinspection PyTypeChecker
-dnastack.add_command(alpha_command_group)
-# noinspection PyTypeChecker
-dnastack.add_command(workbench_command_group)
+    from dnastack.cli.config.context import ContextCommandHandler
+    ContextCommandHandler().use(registry_hostname_or_url, context_name=context_name, no_auth=no_auth)
+
 
 if __name__ == "__main__":
-    dnastack.main(prog_name=APP_NAME)
+    dnastack.main()
@@ -1,7 +1,8 @@
 from abc import ABC
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor, Future
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache, cached_property
 from typing import List, Optional, Any, Dict, Iterator, Iterable, Callable
 
 from pydantic import BaseModel, Field
@@ -26,26 +27,61 @@ class TooManyCollectionsError(RuntimeError):
     pass
 
 
+@lru_cache(maxsize=1)
+def _get_pandas():
+    """ Import pandas once, on the first use.
+
+        We delay the import as late as possible so that the optional dependency (pandas) does not block the other
+        functionalities of the library.
+    """
+    try:
+        import pandas
+        return pandas
+    except ImportError:
+        raise DependencyError('pandas')
+
+
 class _SearchOperation:
-    def __init__(self, dc: DataConnectClient, no_auth: bool, query: str):
+    def __init__(self, dc: DataConnectClient, no_auth: bool, query: str, parameters: Optional[List[Any]] = None):
         self._dc = dc
         self._no_auth = no_auth
         self.__query = query
+        self.__parameters = parameters
 
     def load_data(self) -> Iterator[Dict[str, Any]]:
-        return self._dc.query(self.__query, no_auth=self._no_auth)
+        return self._dc.query(self.__query, no_auth=self._no_auth, parameters=self.__parameters)
 
     def to_list(self) -> List[Dict[str, Any]]:
         return [row for row in self.load_data()]
 
     def to_data_frame(self):
-        try:
-            # We delay the import as late as possible so that the optional dependency (pandas)
-            # does not block the other functionalities of the library.
-            import pandas as pd
-            return pd.DataFrame(self.load_data())
-        except ImportError:
-            raise DependencyError('pandas')
+        pd = _get_pandas()
+
+        # NOTE: The rows are collected column by column so that pandas can build each column in one go instead of
+        #       consolidating the blocks from a list of dictionaries. Like with a list of dictionaries, the columns are
+        #       the union of the keys of every row and any missing value is set to None.
+        columns: Dict[str, List[Any]] = dict()
+        row_count = 0
+
+        for row in self.load_data():
+            for column_name, value in row.items():
+                values = columns.get(column_name)
+                if values is None:
+                    # The column first appears in this row, so it is backfilled for the previous rows.
+                    values = columns[column_name] = [None] * row_count
+                values.append(value)
+
+            row_count += 1
+
+            if len(row) < len(columns):
+                for values in columns.values():
+                    if len(values) < row_count:
+                        values.append(None)
+
+        if not row_count:
+            return pd.DataFrame()
+
+        return pd.DataFrame(columns, columns=list(columns))
 
 
 class BasicSimplifiedLibraryItem(BaseModel, ABC):
@@ -88,6 +124,7 @@ class Collection:
         self._factory = factory
         self._cs = cs
         self._collection = collection
+        self._items_query = collection.itemsQuery.strip()
         self._no_auth = no_auth
         self._dc: Optional[DataConnectClient] = None
         self._drs: DrsClient = self._factory.get_one_of(client_class=DrsClient)
@@ -95,8 +132,8 @@ class Collection:
     def get_record(self) -> CollectionModel:
         return self._collection
 
-    def query(self, query: str):
-        return _SearchOperation(self.data_connect(), self._no_auth, query)
+    def query(self, query: str, parameters: Optional[List[Any]] = None):
+        return _SearchOperation(self.data_connect(), self._no_auth, query, parameters)
 
     def list_items(self,
                    *,
@@ -104,37 +141,68 @@ class Collection:
                    kind: Optional[ItemType] = None,
                    kinds: Optional[Iterable[ItemType]] = None,
                    on_has_more_result: Optional[Callable[[int], None]] = None) -> List[BasicSimplifiedLibraryItem]:
-        # We opt for an enum on item types (kind/kinds) in this case to avoid SQL-injection attempts.
+        """ List the items of the collection
+
+            :param limit: The maximum number of items to return or ZERO for no limit. When there are more items than
+                          the limit, only the first "limit" items are returned and "on_has_more_result" is called with
+                          the number of loaded rows (limit + 1).
+            :param kind: The type of items to list
+            :param kinds: The types of items to list
+            :param on_has_more_result: The callback when there are more items than the limit
+        """
+        return list(self.iter_items(limit=limit, kind=kind, kinds=kinds, on_has_more_result=on_has_more_result))
+
+    def iter_items(self,
+                   *,
+                   limit: Optional[int],
+                   kind: Optional[ItemType] = None,
+                   kinds: Optional[Iterable[ItemType]] = None,
+                   on_has_more_result: Optional[Callable[[int], None]] = None) -> Iterator[BasicSimplifiedLibraryItem]:
+        """ Iterate the items of the collection as they are loaded """
+        # NOTE: The arguments are validated here, as the generator would only run on the first iteration.
         assert limit >= 0, 'The limit has to be ZERO (no limit) or at least 1 (to impose the limit).'
-
-        items: List[BasicSimplifiedLibraryItem] = []
-
-        items_query = self._collection.itemsQuery.strip()
+        return self.__iter_items(limit=limit, kind=kind, kinds=kinds, on_has_more_result=on_has_more_result)
+
+    def __iter_items(self,
+                     *,
+                     limit: int,
+                     kind: Optional[ItemType],
+                     kinds: Optional[Iterable[ItemType]],
+                     on_has_more_result: Optional[Callable[[int], None]]) -> Iterator[BasicSimplifiedLibraryItem]:
+        # We opt for an enum on item types (kind/kinds) in this case to avoid SQL-injection attempts.
 
         # We use +1 as an indicator whether there are more results.
-        actual_items_query = f'SELECT * FROM ({items_query})'
+        actual_items_query = f'SELECT * FROM ({self._items_query})'
+
+        item_types: List[str] = []
 
         if kind:
-            actual_items_query = f"{actual_items_query} WHERE type = '{kind.value}'"
+            item_types.append(kind.value)
 
         if kinds:
-            types = ', '.join([f"'{kind}'" for kind in kinds])
-            actual_items_query = f"{actual_items_query} WHERE type IN {types}"
+            item_types.extend([k.value for k in kinds])
+
+        if item_types:
+            placeholders = ', '.join(['?'] * len(item_types))
+            actual_items_query = f"{actual_items_query} WHERE type IN ({placeholders})"
 
-        if limit is not None and limit > 1:
+        if limit is not None and limit > 0:
             actual_items_query = f"{actual_items_query} LIMIT {limit + 1}"
 
-        items.extend([
-            self.__simplify_item(i)
-            for i in self.data_connect().query(actual_items_query, no_auth=self._no_auth)
-        ])
+        row_count = 0
 
-        row_count = len(items)
+        for row in self.data_connect().query(actual_items_query,
+                                             no_auth=self._no_auth,
+                                             parameters=item_types or None):
+            row_count += 1
 
-        if 0 < limit < row_count and on_has_more_result and callable(on_has_more_result):
-            on_has_more_result(row_count)
+            if 0 < limit < row_count:
+                # The extra row is only the indicator of more results.
+                if on_has_more_result and callable(on_has_more_result):
+                    on_has_more_result(row_count)
+                return
 
-        return items
+            yield self.__simplify_item(row)
 
     def data_connect(self):
         if not self._dc:
@@ -143,21 +211,10 @@ class Collection:
             proposed_data_connect_endpoint = self._cs.data_connect_endpoint(self._collection.slugName,
                                                                             no_auth=self._no_auth)
 
-            target_endpoint: Optional[ServiceEndpoint] = None
-
             # Look up for any similar registered service endpoint.
-            for endpoint in self._factory.all(client_class=DataConnectClient):
-                proposed_data_connect_endpoint_url = proposed_data_connect_endpoint.url
-                if not proposed_data_connect_endpoint_url.endswith('/'):
-                    proposed_data_connect_endpoint_url += '/'
-
-                reference_data_connect_endpoint_url = endpoint.url
-                if not reference_data_connect_endpoint_url.endswith('/'):
-                    reference_data_connect_endpoint_url += '/'
-
-                if proposed_data_connect_endpoint_url == reference_data_connect_endpoint_url:
-                    target_endpoint = endpoint
-                    break
+            target_endpoint: Optional[ServiceEndpoint] = self._data_connect_endpoints_by_url.get(
+                self.__normalize_url(proposed_data_connect_endpoint.url)
+            )
 
             if not target_endpoint:
                 target_endpoint = proposed_data_connect_endpoint
@@ -175,6 +232,18 @@ class Collection:
 
         return self._dc
 
+    @cached_property
+    def _data_connect_endpoints_by_url(self) -> Dict[str, ServiceEndpoint]:
+        endpoints_by_url: Dict[str, ServiceEndpoint] = dict()
+        for endpoint in self._factory.all(client_class=DataConnectClient):
+            # The first registered endpoint takes precedence.
+            endpoints_by_url.setdefault(self.__normalize_url(endpoint.url), endpoint)
+        return endpoints_by_url
+
+    @staticmethod
+    def __normalize_url(url: str) -> str:
+        return url if url.endswith('/') else url + '/'
+
     def blob(self, *, id: Optional[str] = None, name: Optional[str] = None) -> Optional[Blob]:
         blobs = self.blobs(ids=[id] if id else [], names=[name] if name else [])
         if blobs:
@@ -182,52 +251,89 @@ class Collection:
         else:
             return None
 
-    def blobs(self, *, ids: Optional[List[str]] = None, names: Optional[List[str]] = None) -> Dict[str, Optional[Blob]]:
+    def blobs(self,
+              *,
+              ids: Optional[List[str]] = None,
+              names: Optional[List[str]] = None,
+              max_workers: int = 16) -> Dict[str, Optional[Blob]]:
         assert ids or names, 'One of the arguments MUST be defined.'
 
         if ids:
-            conditions: str = ' OR '.join([
-                f"(id = '{id}')"
-                for id in ids
-            ])
+            conditions: str = f"id IN ({', '.join(['?'] * len(ids))})"
+            parameters: List[str] = ids
         elif names:
-            conditions: str = ' OR '.join([
-                f"(name = '{name}')"
-                for name in names
-            ])
+            conditions: str = f"name IN ({', '.join(['?'] * len(names))})"
+            parameters: List[str] = names
         else:
             raise NotImplementedError()
 
-        id_to_name_map: Dict[str, str] = SimpleStream(
-            self.query(f"SELECT id, name FROM ({self._collection.itemsQuery}) WHERE {conditions}").load_data()
-        ).to_map(lambda row: row['id'], lambda row: row['name'])
+        id_to_name_map: Dict[str, str] = {
+            row['id']: row['name']
+            for row in self.query(f"SELECT id, name FROM ({self._items_query}) WHERE {conditions}",
+                                  parameters).load_data()
+        }
 
-        return {
-            id if ids is not None else id_to_name_map[id]: self._drs.get_blob(id)
-            for id in id_to_name_map.keys()
+        blob_id_map: Dict[str, str] = {
+            id if ids else name: id
+            for id, name in id_to_name_map.items()
         }
 
+        return self.__get_blobs(blob_id_map, max_workers)
+
     def find_blob_by_name(self, objectname: str, catalog_name: Optional[str] = "collections", table_name: Optional[str] = "_files", column_name: Optional[str] = "drs_url") -> Blob:
         # TODO Unify this method with "blobs(...)"
         # language=sql
         db_slug = self._collection.slugName.replace("-", "_")
-        q = f"SELECT {column_name} FROM \"{catalog_name}\".\"{db_slug}\".\"{table_name}\" WHERE name='{objectname}' LIMIT 1"
-        results = self.query(q)
-        return self._drs.get_blob(next(results.load_data())['drs_url'])
+        q = f"SELECT {column_name} FROM \"{catalog_name}\".\"{db_slug}\".\"{table_name}\" WHERE name = ? LIMIT 1"
+        results = self.query(q, [objectname])
+        return self._drs.get_blob(next(results.load_data())[column_name])
+
+    def find_blobs_by_names(self,
+                            objectnames: List[str],
+                            catalog_name: Optional[str] = "collections",
+                            table_name: Optional[str] = "_files",
+                            column_name: Optional[str] = "drs_url",
+                            max_workers: int = 16) -> Dict[str, Optional[Blob]]:
+        """ Find the blobs by names with a single query. Unknown names are not included in the result. """
+        assert objectnames, 'The list of names cannot be empty.'
+        # language=sql
+        db_slug = self._collection.slugName.replace("-", "_")
+        placeholders = ', '.join(['?'] * len(objectnames))
+        q = f"SELECT name, {column_name} FROM \"{catalog_name}\".\"{db_slug}\".\"{table_name}\" WHERE name IN ({placeholders})"
+        name_to_drs_url_map: Dict[str, str] = dict()
+        for row in self.query(q, objectnames).load_data():
+            # Only the first match for each name is used, similar to "find_blob_by_name".
+            name_to_drs_url_map.setdefault(row['name'], row[column_name])
+        return self.__get_blobs(name_to_drs_url_map, max_workers)
+
+    def __get_blobs(self, key_to_blob_id_map: Dict[str, str], max_workers: int) -> Dict[str, Optional[Blob]]:
+        if not key_to_blob_id_map:
+            return dict()
+
+        # The blobs are independently resolved so the requests are made concurrently.
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(key_to_blob_id_map)))) as pool:
+            key_to_future_map: Dict[str, Future] = {
+                key: pool.submit(self._drs.get_blob, blob_id)
+                for key, blob_id in key_to_blob_id_map.items()
+            }
+
+        return {
+            key: future.result()
+            for key, future in key_to_future_map.items()
+        }
 
     @staticmethod
     def __simplify_item(row: Dict[str, Any]) -> BasicSimplifiedLibraryItem:
         if row['type'] == ItemType.BLOB.value:
             return SimplifiedBlobMetadata(**row)
         elif row['type'] == ItemType.TABLE.value:
-            row_copy = deepcopy(row)
-            row_copy['name'] = (
+            name = (
                     row.get('qualified_table_name')
                     or row.get('preferred_name')
                     or row.get('display_name')
                     or row['name']
             )
-            return SimplifiedTableMetadata(**row_copy)
+            return SimplifiedTableMetadata(**{**row, 'name': name})
         else:
             return BasicSimplifiedLibraryItem(**row)
 
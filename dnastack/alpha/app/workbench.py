@@ -1,11 +1,11 @@
 import asyncio
-import json
-import datetime
+import logging
 
 import random
 import string
 from enum import Enum, unique
-from typing import Optional, List, Iterator, Callable, Iterable, Union
+from functools import cached_property
+from typing import Optional, List, Iterator, Callable, Iterable, Union, Dict
 
 import time
 import dnastack
@@ -17,7 +17,8 @@ from dnastack.client.workbench.workflow.models import Workflow, WorkflowVersion,
 
 from dnastack.client.workbench.ewes.client import EWesClient
 from dnastack.client.workbench.ewes.models import ExtendedRunListOptions, ExtendedRunStatus, RunId, ExtendedRun, \
-	ExtendedRunRequest, LogType, Log, BatchRunRequest
+	ExtendedRunRequest, LogType, Log, BatchRunRequest, BatchActionResult, Outcome
+from dnastack.client.models import ServiceEndpoint
 from dnastack.common.logger import get_logger
 
 
@@ -83,10 +84,24 @@ class RunStatus(Enum):
 
 	# returns true if the task has failed
 	def has_failed(self):
-		return self == RunStatus.EXECUTOR_ERROR or self == RunStatus.SYSTEM_ERROR
+		return self in _FAILED_RUN_STATUSES
 
 	def was_canceled(self):
-		return self == RunStatus.CANCELED or self == RunStatus.CANCELING
+		return self in _CANCELED_RUN_STATUSES
+
+
+_RUN_STATUSES_BY_VALUE = {run_status.value: run_status for run_status in RunStatus}
+_FAILED_RUN_STATUSES = frozenset({RunStatus.EXECUTOR_ERROR, RunStatus.SYSTEM_ERROR})
+_CANCELED_RUN_STATUSES = frozenset({RunStatus.CANCELED, RunStatus.CANCELING})
+
+
+# Converts a run state to RunStatus with a plain dictionary lookup, as this is done on every poll.
+def _get_run_status(state) -> RunStatus:
+	try:
+		return _RUN_STATUSES_BY_VALUE[state]
+	except KeyError:
+		# Let the enum raise the usual error for unknown states.
+		return RunStatus(state)
 
 class Workbench:
 	__CUSTOM_WORKFLOW_SOURCE_NAME = WorkflowSource.private
@@ -102,30 +117,33 @@ class Workbench:
 		alphabet = string.ascii_lowercase + string.digits
 		return ''.join(random.choices(alphabet, k=10))
 
+	@cached_property
+	def _endpoints_by_id(self) -> Dict[str, ServiceEndpoint]:
+		return {endpoint.id: endpoint for endpoint in self._ewes_client_factory.all()}
+
 	def _get_workflow_client(self) -> WorkflowClient:
 		if self._workflow_client is None:
-			for endpoint in self._ewes_client_factory.all():
-				if endpoint.id == 'workflow-service':
-					self._workflow_client = WorkflowClient.make(endpoint, namespace=None)
-					return self._workflow_client
-			raise Exception("Unable to find workflow client")
-		else:
-			return self._workflow_client
+			endpoint = self._endpoints_by_id.get('workflow-service')
+			if endpoint is None:
+				raise Exception("Unable to find workflow client")
+			self._workflow_client = WorkflowClient.make(endpoint, namespace=None)
+		return self._workflow_client
 
 	def _get_ewes_client(self) -> EWesClient:
 		if self._ewes_client is None:
-			for endpoint in self._ewes_client_factory.all():
-				if endpoint.id == 'ewes-service':
-					self._ewes_client = EWesClient.make(endpoint, namespace=None)
-					return self._ewes_client
-			raise Exception("Unable to find workflow client")
-		else:
-			return self._ewes_client
+			endpoint = self._endpoints_by_id.get('ewes-service')
+			if endpoint is None:
+				raise Exception("Unable to find workflow client")
+			self._ewes_client = EWesClient.make(endpoint, namespace=None)
+		return self._ewes_client
 
 
 	# Returns the workflow with the given name.
 	def get_workflow(self, workflow_name: str, workflow_type: Optional[WorkflowSource] = __CUSTOM_WORKFLOW_SOURCE_NAME, max_results: Optional[int] = __WORKFLOW_MAX_RESULTS) -> Workflow:
-		for workflow in self._get_workflow_client().list_workflows(list_options=WorkflowListOptions(source=workflow_type), max_results=max_results):
+		# The server-side search narrows down the candidates while the exact match is still done here as the search is
+		# not necessarily an exact match. The listed workflows are not fully populated, hence the follow-up request.
+		list_options = WorkflowListOptions(source=workflow_type, search=workflow_name)
+		for workflow in self._get_workflow_client().list_workflows(list_options=list_options, max_results=max_results):
 			if workflow.name == workflow_name:
 				return self._get_workflow_client().get_workflow(workflow.internalId)
 
@@ -137,7 +155,7 @@ class Workbench:
 		return self._get_ewes_client().list_runs(list_options, max_results)
 
 	def get_status(self, run_id: str) -> RunStatus:
-		return RunStatus(self._get_ewes_client().get_status(run_id).state)
+		return _get_run_status(self._get_ewes_client().get_status(run_id).state)
 
 	def describe_run(self, run_id: str, include_tasks: bool = True) -> ExtendedRun:
 		return self._get_ewes_client().get_run(run_id, include_tasks)
@@ -146,7 +164,8 @@ class Workbench:
 		return self._get_ewes_client().list_runs(list_options=ExtendedRunListOptions(tag=[f"batch_id:{batch_id}"]))
 
 	def submit_batch(self, batch: BatchRunRequest, batch_id:Optional[str]=None) -> str:
-		self._logger.debug("Submitting batch request: "+json.dumps(batch.dict()))
+		if self._logger.isEnabledFor(logging.DEBUG):
+			self._logger.debug("Submitting batch request: "+batch.json())
 		if batch_id is None:
 			batch_id = self._get_short_uuid()
 
@@ -161,28 +180,49 @@ class Workbench:
 
 	def submit_run(self, data: ExtendedRunRequest) -> str:
 		result = self._get_ewes_client().submit_run(data)
-		if RunStatus(result.state).has_failed():
+		if _get_run_status(result.state).has_failed():
 			raise WorkbenchRunException("Could not submit run, unexpected run state '"+result.state)
 		return result.run_id
 
-	def cancel_batch(self, batch_id: str) -> RunStatus:
-		bad_run_ids=[]
+	def cancel_batch(self, batch_id: str) -> None:
+		run_ids=[]
 		for run_status in self.describe_batch(batch_id):
-			r=RunStatus(run_status.state)
+			r=_get_run_status(run_status.state)
 			if not r.has_failed() and not r.was_canceled():
-				try:
-					self.cancel_run(run_status.run_id)
-				except Exception as rex:
-					bad_run_ids.append(run_status.run_id)
+				run_ids.append(run_status.run_id)
+		if len(run_ids) == 0:
+			return
+		# Cancel all runs with a single request instead of one request per run.
+		try:
+			result = self._get_ewes_client().cancel_runs(run_ids)
+		except Exception as rex:
+			raise WorkbenchRunException("Could not cancel all runs in batch "+batch_id+".  Run IDs: "+"\n".join(run_ids), run_ids=run_ids) from rex
+		bad_run_ids=self._get_failed_run_ids(run_ids, result)
 		if(len(bad_run_ids) > 0):
 			raise WorkbenchRunException("Could not cancel all runs in batch "+batch_id+".  Run IDs: "+"\n".join(bad_run_ids), run_ids=bad_run_ids)
 
+	# Returns the requested runs that are not confirmed to be successful by the batch action result. Each result is
+	# matched to its run with the run ID in its data. Without the run ID, the results can only be matched by position,
+	# which is only trusted when there is exactly one result per requested run.
+	@staticmethod
+	def _get_failed_run_ids(run_ids: List[str], result: BatchActionResult) -> List[str]:
+		matched_by_position = len(result.results) == len(run_ids)
+		successful_run_ids = set()
+		for index, action_result in enumerate(result.results):
+			if action_result.outcome != Outcome.SUCCESS:
+				continue
+			if isinstance(action_result.data, dict) and action_result.data.get('run_id'):
+				successful_run_ids.add(action_result.data['run_id'])
+			elif matched_by_position:
+				successful_run_ids.add(run_ids[index])
+		return [run_id for run_id in run_ids if run_id not in successful_run_ids]
+
 	def cancel_run(self, run_id) -> RunStatus:
 		result = self._get_ewes_client().cancel_run(run_id)
 		if type(result) is RunId:
-			return RunStatus(RunId.state)
+			return _get_run_status(result.state)
 		else:
-			raise WorkbenchRunException("Run "+run_id+" could not be canceled: "+json.dumps(result.dict()))
+			raise WorkbenchRunException("Run "+run_id+" could not be canceled: "+result.json())
 
 	# Returns the state that all of the runs are in unless:
 	# - If any run has a failed status, then that status is returned, otherwise
@@ -193,14 +233,14 @@ class Workbench:
 		current_unanimous_state = None
 		runs_in_batch = self.describe_batch(batch_id)
 		for run in runs_in_batch:
-			this_runs_state = RunStatus(run.state)
+			this_runs_state = _get_run_status(run.state)
 			if this_runs_state.has_failed():
 				batch_error_message = batch_error_message + "\nRun {run_id} failed with status {run_state}".format(run_id=run.run_id, run_state=run.state)
 			elif this_runs_state.was_canceled():
 				batch_error_message = batch_error_message + "\nRun {run_id} was canceled".format(run_id=run.run_id, run_state=run.state)
 			elif batch_error_message == "":
 				if current_unanimous_state is None:
-					current_unanimous_state = RunStatus(run.state);
+					current_unanimous_state = this_runs_state
 				elif current_unanimous_state != this_runs_state:
 					current_unanimous_state = RunStatus.UNKNOWN
 
@@ -209,33 +249,51 @@ class Workbench:
 
 		return current_unanimous_state
 
+	# The EWES service does not offer a status stream so the polling interval backs off exponentially (with jitter)
+	# while the state is unchanged, and is reset on every state change.
+	@staticmethod
+	def _get_poll_delay(poll_interval: float, max_poll_interval: float, attempt: int) -> float:
+		return min(max_poll_interval, poll_interval * (2 ** attempt)) * random.uniform(0.8, 1.2)
+
 	# polls a batch job until all jobs reach a desired state
-	async def poll_batch_status_until(self, batch_id: str, desired_state : RunStatus, poll_interval:Optional[int]=2, on_state_change : Optional[Callable[[RunStatus, str], None]]=None):
+	async def poll_batch_status_until(self, batch_id: str, desired_state : RunStatus, poll_interval:Optional[int]=2, on_state_change : Optional[Callable[[RunStatus, str], None]]=None, max_poll_interval: Optional[int]=30):
 
 		current_unanimous_state = None
 		last_unanimous_state = RunStatus.UNKNOWN
-		while current_unanimous_state != desired_state:
+		attempt = 0
+		while True:
 			current_unanimous_state = self._get_unanimous_state(batch_id)
 			if current_unanimous_state != last_unanimous_state:
-				on_state_change(current_unanimous_state, batch_id)
+				attempt = 0
+				if on_state_change is not None:
+					on_state_change(current_unanimous_state, batch_id)
 			last_unanimous_state = current_unanimous_state
-			await asyncio.sleep(poll_interval)
+			if current_unanimous_state == desired_state:
+				break
+			await asyncio.sleep(self._get_poll_delay(poll_interval, max_poll_interval, attempt))
+			attempt += 1
 
-	async def poll_run_status_until(self, run_id: str, desired_state : RunStatus, poll_interval:Optional[int]=2, on_state_change : Optional[Callable[[RunStatus], None]]=None):
+	async def poll_run_status_until(self, run_id: str, desired_state : RunStatus, poll_interval:Optional[int]=2, on_state_change : Optional[Callable[[RunStatus], None]]=None, max_poll_interval: Optional[int]=30):
 		last_state = None
 		current_state = RunStatus.UNKNOWN
 		run=None
-		while current_state != desired_state:
+		attempt = 0
+		while True:
 			run = self.describe_run(run_id)
-			current_state = RunStatus(run.state)
+			current_state = _get_run_status(run.state)
 			if current_state.has_failed():
 				raise WorkbenchRunException("Run "+run.run_id+" has failed with status "+run.state, [run.run_id])
 			elif current_state.was_canceled():
 				raise WorkbenchCancellationException("Run "+run.run_id+" was canceled with status "+run.state, [run.run_id])
-			elif current_state != last_state and on_state_change is not None:
-				on_state_change(current_state)
+			elif current_state != last_state:
+				attempt = 0
+				if on_state_change is not None:
+					on_state_change(current_state)
 			last_state=current_state
-			await asyncio.sleep(poll_interval)
+			if current_state == desired_state:
+				break
+			await asyncio.sleep(self._get_poll_delay(poll_interval, max_poll_interval, attempt))
+			attempt += 1
 
 	# waits for the given batch job to reach a particular status.
 	async def gather_batch(self, batch_id: str, desired_state : RunStatus, poll_interval:Optional[int]=2, on_state_change : Optional[Callable[[RunStatus, str], None]]=None):
@@ -258,8 +316,9 @@ class Workbench:
 			await asyncio.gather(*tasks)
 		except Exception as ex:
 			result = self._get_ewes_client().cancel_runs(run_ids)
-			if result.run_ids_with_failure is not None and len(result.run_ids_with_failure):
-				raise WorkbenchCancellationException(f'Unable to cancel runs after failure/cancellation of run {result.run_ids_with_failure}') from ex
+			run_ids_with_failure = self._get_failed_run_ids(run_ids, result)
+			if len(run_ids_with_failure):
+				raise WorkbenchCancellationException(f'Unable to cancel runs after failure/cancellation of run {run_ids_with_failure}', run_ids_with_failure) from ex
 			else:
 				raise ex
 
@@ -268,7 +327,7 @@ class Workbench:
 	def _get_workflow_url(self, workflow_id: str, version_id: str) -> str:
 		return "{internal_id}/{version_id}".format(internal_id=workflow_id, version_id=version_id)
 
-	def scatter(self, workflow: Workflow, version: WorkflowVersion, engines: Union[List[str], dict]=None, run_constants=None, run_variables=None, tags={}, batch_id=None) -> str:
+	def scatter(self, workflow: Workflow, version: WorkflowVersion, engines: Union[List[str], dict]=None, run_constants=None, run_variables=None, tags=None, batch_id=None) -> str:
 		# Input checks
 		if engines is None:
 			# TODO: list engines once we have library support.  Until then, raise exception.
@@ -283,19 +342,21 @@ class Workbench:
 		else:
 			raise Exception("Engine information must be given as a list of engine ids, or a dict of engine-ids -> engine configuration")
 
-		if run_constants is not None and type(run_constants) is List:
+		if run_constants is not None and isinstance(run_constants, list):
 			if(len(run_constants) !=len(engine_ids)):
-				raise Exception("Expected "+len(engine_ids)+" dicts of run constants, but only received "+len(run_constants))
+				raise Exception("Expected "+str(len(engine_ids))+" dicts of run constants, but only received "+str(len(run_constants)))
 
 		# TODO: run_variables checking
-		tags['federated_analysis'] = datetime.datetime.timestamp(datetime.datetime.now())
+		# The tags are copied so that neither the caller's dictionary nor the default value is modified.
+		tags = dict(tags or {})
+		tags['federated_analysis'] = time.time()
 		if batch_id is None:
 			batch_id = self._get_short_uuid()
-		for engine_index in range(0, len(engines)):
-			engine_id = engines[engine_index]
+		workflow_url = self._get_workflow_url(workflow.internalId, version.id)  #BAD URL!
+		for engine_index, engine_id in enumerate(engine_ids):
 			runs_in_batch = run_variables[engine_index]  # the runs in this batch.  an array of dicts.
 			batch_run_request = BatchRunRequest(
-				workflow_url=self._get_workflow_url(workflow.internalId, version.id),  #BAD URL!
+				workflow_url=workflow_url,
 				workflow_type=version.descriptorType,
 				#Always omit workflow_type_version, @patrick suggests this field is either unnecessary or read only
 				engine_id=engine_id,
@@ -311,14 +372,17 @@ class Workbench:
 
 	# Being able to stream the logs from a named task seems important, but is missing from the API.
 	def stream_task_log_by_task(self, run: Union[ExtendedRun, str], task_name: str, log_type: LogType, max_bytes: Optional[int] = None) -> Iterable[bytes]:
-		if type(run) is ExtendedRun:
-			run = run.run_id
-		for task_log in run.task_logs:
-			if task_log.name == task_name:
-				return self.stream_task_log(run_id=run, task_id=task_log.task_id, log_type=log_type, max_bytes=max_bytes)
-				return self._get_ewes_client().stream_task_logs(run_id=run, task_id=task_log.task_id, log_type=logtype, max_bytes=max_bytes)
+		# The task logs are only available on the full run description.
+		if type(run) is str:
+			run = self.describe_run(run, True)
+		task_id = next((task_log.task_id for task_log in run.task_logs or [] if task_log.name == task_name), None)
+		if task_id is None:
+			raise KeyError("Unable to find task "+task_name+" in run "+run.run_id)
+		return self.stream_task_log(run=run.run_id, task_id=task_id, log_type=log_type, max_bytes=max_bytes)
 
 	def stream_task_log(self, run: Union[ExtendedRun, str], task_id: str, log_type: LogType, max_bytes: Optional[int] = None) -> Iterable[bytes]:
+		if type(run) is ExtendedRun:
+			run = run.run_id
 		return self._get_ewes_client().stream_task_logs(run_id=run, task_id=task_id, log_type=log_type, max_bytes=max_bytes)
 
 	def stream_run_log(self, run: Union[ExtendedRun, str], log_type: LogType, max_bytes: Optional[int] = None) -> Iterable[bytes]:
@@ -332,23 +396,17 @@ class Workbench:
 		if type(run) is str:
 			run = self.describe_run(run, True)
 		for task_log in run.task_logs:
-			runstatus = RunStatus(task_log.state)
+			runstatus = _get_run_status(task_log.state)
 			if runstatus.has_failed():
 				loglist.append(task_log)
 		return loglist
 
 def _get_workflow_version(self, version_name:Optional[str]=None) -> WorkflowVersion:
 	if version_name is None:
-		max_timestamp = 0
-		max_version = None
-		for version in self.versions:
-			timestamp = time.time()
-			if (timestamp > max_timestamp):
-				max_timestamp = timestamp
-				max_version = version
-		return max_version
+		# The creation timestamps are ISO 8601 strings, which are ordered chronologically.
+		return max(self.versions or [], key=lambda version: version.createdAt or '', default=None)
 	else:
-		for version in self.versions:
+		for version in self.versions or []:
 			if version.versionName == version_name:
 				return version
 		raise Exception("Invalid workflow version "+version_name+" specified for workflow "+self.name)
@@ -1,18 +1,29 @@
-import base64
 import click
-import json
 import lzma
+import sys
 from pydantic import Field, BaseModel
-from typing import Optional, List
+from typing import Optional, List, Iterable, Iterator
 
 from dnastack.cli.auth.command import AuthCommandHandler as StableAuthCommandHandler
 from dnastack.cli.helpers.command.decorator import command
 from dnastack.cli.helpers.command.spec import MULTIPLE_ENDPOINT_ID_SPEC
-from dnastack.cli.helpers.exporter import normalize, to_json
+from dnastack.cli.helpers.exporter import normalize, to_json, to_json_bytes, from_json
 from dnastack.cli.helpers.printer import echo_result
 from dnastack.http.authenticators.abstract import AuthStateStatus
 from dnastack.http.session_info import Session
 
+try:
+    # The optional "pybase64" package provides SIMD-accelerated base64 codecs with the same interface.
+    from pybase64 import b64encode, b64decode
+except ImportError:
+    from base64 import b64encode, b64decode
+
+_LARGE_BACKUP_SIZE = 4096
+_XZ_HEADER_MAGIC = b'\xfd7zXZ\x00'
+
+# Most of the cost of compressing a small backup with the default preset is to set up its large dictionary.
+_SMALL_BACKUP_FILTERS = [{'id': lzma.FILTER_LZMA2, 'preset': 0, 'dict_size': _LARGE_BACKUP_SIZE}]
+
 
 @click.group("auth")
 def alpha_auth_command_group():
@@ -27,26 +38,56 @@ def export_backup(context: Optional[str],
     """ Export sessions """
     handler = AuthCommandHandler(context_name=context)
     endpoint_ids = endpoint_id.strip().split(',') if (endpoint_id and endpoint_id.strip()) else None
-    result = to_json(normalize(handler.create_backup(endpoint_ids)),
-                     indent=2 if pretty else None)
     if compress:
-        result = base64.b64encode(lzma.compress(result.encode('utf-8')))
+        result = b64encode(_compress_backup(handler.stream_backup(endpoint_ids)))
+    else:
+        result = to_json(normalize(handler.create_backup(endpoint_ids)), indent=2 if pretty else None)
     click.echo(result)
 
 
+def _compress_backup(chunks: Iterable[bytes]) -> bytes:
+    # The backup is always in the XZ format, which every version of the importer expects. Only a large backup is
+    # compressed with the default preset. A small one is compressed with the smallest dictionary instead.
+    buffer = bytearray()
+    compressor: Optional[lzma.LZMACompressor] = None
+
+    for chunk in chunks:
+        if compressor:
+            buffer.extend(compressor.compress(chunk))
+        else:
+            buffer.extend(chunk)
+            if len(buffer) >= _LARGE_BACKUP_SIZE:
+                compressor = lzma.LZMACompressor()
+                buffer = bytearray(compressor.compress(bytes(buffer)))
+
+    if compressor:
+        buffer.extend(compressor.flush())
+        return bytes(buffer)
+    else:
+        return lzma.compress(bytes(buffer), filters=_SMALL_BACKUP_FILTERS)
+
+
 @command(alpha_auth_command_group, 'import')
 def import_from_backup(context: Optional[str],
                        backup_content: str):
     """ Import sessions """
-    content = backup_content.strip()
-    if content[0] != r'{':
-        content = lzma.decompress(base64.b64decode(content))
-    backup = SessionBackup(**json.loads(content))
+    backup = _decode_backup(backup_content)
 
     handler = AuthCommandHandler(context_name=context)
     handler.restore_backup(backup)
 
 
+def _decode_backup(backup_content: str) -> 'SessionBackup':
+    # The backup is either the plain JSON or the base64-encoded XZ-compressed JSON. The base64-encoded JSON without
+    # compression is also accepted. The plain JSON is told from the encoded backup by its first character.
+    content = backup_content.strip()
+    if not content.startswith('{'):
+        content = b64decode(content)
+        if content.startswith(_XZ_HEADER_MAGIC):
+            content = lzma.decompress(content)
+    return SessionBackup(**from_json(content))
+
+
 class SessionEntry(BaseModel):
     id: str
     session: Optional[Session] = None
@@ -60,23 +101,41 @@ class SessionBackup(BaseModel):
 
 class AuthCommandHandler(StableAuthCommandHandler):
     def create_backup(self, endpoint_ids: List[str]) -> SessionBackup:
-        backup = SessionBackup()
+        return SessionBackup(sessions=list(self._iterate_session_entries(endpoint_ids)))
+
+    def stream_backup(self, endpoint_ids: List[str]) -> Iterator[bytes]:
+        """ Generate the backup as the consecutive chunks of a compact JSON document """
+        # The sessions are streamed in between the rest of the backup, which is encoded from an empty backup.
+        prefix, empty_sessions, suffix = to_json_bytes(normalize(SessionBackup()), indent=None) \
+            .partition(b'"sessions":[]')
+        assert empty_sessions, 'The backup must have the list of sessions.'
+
+        yield prefix + b'"sessions":['
+        for index, entry in enumerate(self._iterate_session_entries(endpoint_ids)):
+            yield (b',' if index else b'') + to_json_bytes(normalize(entry), indent=None)
+        yield b']' + suffix
+
+    def _iterate_session_entries(self, endpoint_ids: List[str]) -> Iterator[SessionEntry]:
+        # NOTE: The confirmation of every exported session is only useful to a person watching the terminal. When the
+        #       standard error is redirected, only the ignored sessions are reported.
+        report_exported_sessions = sys.stderr.isatty()
+
         for state in self._auth_manager.get_states(endpoint_ids):
             if state.status in [AuthStateStatus.READY, AuthStateStatus.REFRESH_REQUIRED]:
-                entry = SessionEntry(id=state.id,
-                                     session=state.session_info,
-                                     endpoints=state.endpoints)
-                backup.sessions.append(entry)
-                echo_result('Session',
-                            'green',
-                            'Exported',
-                            f'Session for {", ".join(state.endpoints)}')
+                # The auth state is already validated, so the entry is constructed without re-validating it.
+                yield SessionEntry.construct(id=state.id,
+                                             session=state.session_info,
+                                             endpoints=state.endpoints)
+                if report_exported_sessions:
+                    echo_result('Session',
+                                'green',
+                                'Exported',
+                                f'Session for {", ".join(state.endpoints)}')
             else:
                 echo_result('Session',
                             'red',
                             'Ignored',
                             f'Session for {", ".join(state.endpoints)} ({state.status})')
-        return backup
 
     def restore_backup(self, backup: SessionBackup):
         for entry in backup.sessions:
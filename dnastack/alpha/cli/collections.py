@@ -15,6 +15,7 @@ from dnastack.common.logger import get_logger
 from dnastack.common.tracing import Span
 
 _logger = get_logger('alpha/cli/collections')
+_FORMATTERS = {OutputFormat.YAML: to_yaml, OutputFormat.JSON: to_json}
 
 
 def _get(context: Optional[str] = None, id: Optional[str] = None) -> CollectionServiceClient:
@@ -69,7 +70,7 @@ def get(context: Optional[str],
 
     # NOTE: As returning the output is not critical, we will assume that if the output format is not recognized,
     #       the code will not raise an error on this and will use JSON as the default format.
-    click.echo((to_yaml if output == OutputFormat.YAML else to_json)(normalized_result))
+    click.echo(_FORMATTERS.get(output, to_json)(normalized_result))
 
 
 @command(alpha_collection_command_group,
@@ -117,4 +118,4 @@ def patch(context: Optional[str],
 
     # NOTE: As returning the output is not critical, we will assume that if the output format is not recognized,
     #       the code will not raise an error on this and will use JSON as the default format.
-    click.echo((to_yaml if output == OutputFormat.YAML else to_json)(normalized_result))
+    click.echo(_FORMATTERS.get(output, to_json)(normalized_result))
@@ -4,27 +4,52 @@ import click
 from click import Abort
 from imagination import container
 
-from dnastack.alpha.cli.auth import alpha_auth_command_group
-from dnastack.alpha.cli.collections import alpha_collection_command_group
-from dnastack.alpha.cli.data_connect import alpha_data_connect_command_group
-from dnastack.alpha.cli.wes import alpha_wes_command_group
-from dnastack.alpha.cli.workbench.commands import alpha_workbench_command_group
 from dnastack.cli.collections import COLLECTION_ID_CLI_ARG_SPEC, _abort_with_collection_list
 from dnastack.cli.data_connect.commands import DECIMAL_POINT_OUTPUT_SPEC
 from dnastack.cli.data_connect.helper import handle_query
+from dnastack.cli.helpers.command.group import LazyAliasedGroup
 from dnastack.cli.helpers.command.decorator import command
 from dnastack.cli.helpers.command.spec import DATA_OUTPUT_SPEC
 from dnastack.client.collections.client import CollectionServiceClient, EXPLORER_COLLECTION_SERVICE_TYPE_V1_0, \
     UnknownCollectionError
 from dnastack.client.data_connect import DataConnectClient
 from dnastack.client.models import ServiceEndpoint
-from dnastack.common.simple_stream import SimpleStream
 from dnastack.configuration.manager import ConfigurationManager
 from dnastack.configuration.models import DEFAULT_CONTEXT
 from dnastack.context.models import Context
 
 
-@click.group("alpha")
+###############
+# Subcommands #
+###############
+# NOTE: The subcommands are only imported when they are invoked.
+_LAZY_SUBCOMMANDS = {
+    'auth': 'dnastack.alpha.cli.auth:alpha_auth_command_group',
+    'collections': 'dnastack.alpha.cli.collections:alpha_collection_command_group',
+    'data-connect': 'dnastack.alpha.cli.data_connect:alpha_data_connect_command_group',
+    'wes': 'dnastack.alpha.cli.wes:alpha_wes_command_group',
+    'workbench': 'dnastack.alpha.cli.workbench.commands:alpha_workbench_command_group',
+}
+
+_LAZY_SUBCOMMAND_ALIASES = {
+    'data-connect': ['dc'],
+}
+
+# NOTE: The help of the subcommands is declared here so that the help message does not import every subcommand.
+_LAZY_SUBCOMMAND_HELP = {
+    'auth': 'Manage authentication and authorization',
+    'collections': 'Interact with Collection Service or Explorer Service.',
+    'data-connect': 'Interact with Data Connect Service (testing)',
+    'wes': 'Interact with Workflow Execution Service',
+    'workbench': 'Interact with Workbench',
+}
+
+
+@click.group("alpha",
+             cls=LazyAliasedGroup,
+             lazy_sub_commands=_LAZY_SUBCOMMANDS,
+             lazy_sub_command_help=_LAZY_SUBCOMMAND_HELP,
+             lazy_sub_aliases=_LAZY_SUBCOMMAND_ALIASES)
 def alpha_command_group():
     """
     Interact with experimental commands.
@@ -34,16 +59,6 @@ def alpha_command_group():
     """
 
 
-###############
-# Subcommands #
-###############
-alpha_command_group.add_command(alpha_auth_command_group)
-alpha_command_group.add_command(alpha_wes_command_group)
-alpha_command_group.add_command(alpha_collection_command_group)
-alpha_command_group.add_command(alpha_data_connect_command_group)
-alpha_command_group.add_command(alpha_workbench_command_group)
-
-
 #######################
 # Root-level commands #
 #######################
@@ -91,15 +106,16 @@ def run_query(context: Optional[str],
     target_context = config.contexts[context_name]
 
     # Get the service client and initiate the query.
-    client_stream = SimpleStream(target_context.endpoints) \
-        .filter(_is_data_connect_capable) \
-        .map(_convert_to_service_client)
-
-    if endpoint_id:
-        client_stream.filter(lambda e: e.id == endpoint_id)
-
-    discovery_order: List[Union[CollectionServiceClient, DataConnectClient]] = client_stream.to_list()
-    discovery_order.sort(key=lambda c: -1 if isinstance(c, CollectionServiceClient) else 1)
+    # NOTE: The sort key is computed once per client and the sort is stable, so the collection service clients come
+    #       first while the configured order is kept otherwise.
+    discovery_order: List[Union[CollectionServiceClient, DataConnectClient]] = sorted(
+        [
+            _convert_to_service_client(e)
+            for e in target_context.endpoints
+            if (not endpoint_id or e.id == endpoint_id) and _is_data_connect_capable(e)
+        ],
+        key=lambda c: 0 if isinstance(c, CollectionServiceClient) else 1
+    )
 
     if discovery_order:
         discovered_client = discovery_order[0]
@@ -132,14 +148,19 @@ def run_query(context: Optional[str],
         raise Abort('No Explorer, Publisher Data Service, or Data Connect Service configured for your client')
 
 
+# NOTE: ServiceType is not hashable, so the supported types are kept in tuples that are only built once.
+_COLLECTION_SERVICE_TYPES = tuple(CollectionServiceClient.get_supported_service_types())
+_DATA_CONNECT_SERVICE_TYPES = tuple(DataConnectClient.get_supported_service_types())
+
+
 def _is_data_connect_capable(e: ServiceEndpoint) -> bool:
-    return e.type in CollectionServiceClient.get_supported_service_types() or e.type in DataConnectClient.get_supported_service_types()
+    return e.type in _COLLECTION_SERVICE_TYPES or e.type in _DATA_CONNECT_SERVICE_TYPES
 
 
 def _convert_to_service_client(e: ServiceEndpoint) -> Union[CollectionServiceClient, DataConnectClient]:
-    if e.type in CollectionServiceClient.get_supported_service_types():
+    if e.type in _COLLECTION_SERVICE_TYPES:
         return CollectionServiceClient.make(e)
-    elif e.type in DataConnectClient.get_supported_service_types():
+    elif e.type in _DATA_CONNECT_SERVICE_TYPES:
         return DataConnectClient.make(e)
     else:
         raise RuntimeError(f'Unable to instantiate a usable service client with {e}')
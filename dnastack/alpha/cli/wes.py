@@ -3,6 +3,7 @@ import json
 import re
 import yaml
 from imagination import container
+from pathlib import Path
 from typing import Optional, List
 
 from dnastack.alpha.client.wes.client import WesClient, RunRequest
@@ -14,6 +15,15 @@ from dnastack.cli.helpers.iterator_printer import show_iterator, OutputFormat
 from dnastack.constants import __version__
 from dnastack.feature_flags import in_interactive_shell
 
+try:
+    # The libyaml-based loader is only available when PyYAML is built with libyaml.
+    from yaml import CSafeLoader as SafeYamlLoader
+except ImportError:
+    from yaml import SafeLoader as SafeYamlLoader
+
+_RE_PARAMETER = re.compile(r'([a-zA-Z0-9_.]+)(:?=@?)(.+)', re.ASCII)
+_FORMATTERS = {OutputFormat.JSON: to_json, OutputFormat.YAML: to_yaml}
+
 
 def _get(context_name: Optional[str] = None,
          endpoint_id: Optional[str] = None) -> WesClient:
@@ -101,36 +111,29 @@ def submit(context: Optional[str],
     """
     actual_params = dict()
 
-    re_parameter = re.compile(r'^(?P<key>[a-zA-Z0-9_\.]+)(?P<op>:?=@?)(?P<value>.+)$')
-
     # Parse the workflow parameters.
-    param_counter = 0
-    for param in params:
-        matches = re_parameter.search(param)
-        if matches:
-            data = matches.groupdict()
-            value = data['value']
-            if data['op'] == ':=':
-                value = json.loads(value)
-            elif data['op'] == ':=@':
-                with open(value) as fp:
-                    value = json.load(fp)
-
-            actual_params[data['key']] = value
-        else:
-            raise ValueError(f'Param #{param_counter + 1} ({param}) is invalid.')
-
-        param_counter += 1
+    for param_index, param in enumerate(params):
+        matches = _RE_PARAMETER.fullmatch(param)
+        if not matches:
+            raise ValueError(f'Param #{param_index + 1} ({param}) is invalid.')
+
+        key, op, value = matches.groups()
+        # NOTE: The user-supplied JSON is decoded with the standard library as orjson does not accept everything the
+        #       standard library does, e.g., NaN, and may lose the precision of large integers.
+        if op == ':=':
+            value = json.loads(value)
+        elif op == ':=@':
+            with open(value, 'rb') as fp:
+                value = json.load(fp)
+
+        actual_params[key] = value
 
     actual_tags = dict(agent=f'dnastack-client-library/{__version__}')
-    if tags:
-        tag_counter = 0
-        for tag in tags:
-            if '=' not in tag:
-                raise ValueError(f'Tag #{tag_counter + 1} ({tag}) is invalid. The tag format is "<key>=<value>".')
-            k, v = tag.split('=', 1)
-            actual_tags[k] = v
-            tag_counter += 1
+    for tag_index, tag in enumerate(tags or []):
+        k, separator, v = tag.partition('=')
+        if not separator:
+            raise ValueError(f'Tag #{tag_index + 1} ({tag}) is invalid. The tag format is "<key>=<value>".')
+        actual_tags[k] = v
 
     if manifest_file_path is None:
         run_request = RunRequest(
@@ -143,14 +146,15 @@ def submit(context: Optional[str],
         )
     else:
         try:
-            with open(manifest_file_path, 'r') as f:
-                content = f.read()
+            # Both the JSON and YAML parsers take the raw bytes, so the content is not decoded upfront.
+            content = Path(manifest_file_path).read_bytes()
         except FileNotFoundError:
             raise RuntimeError(f'The given manifest file (at {manifest_file_path}) does not exist.')
 
-        if re.search(r'\.ya?ml$', manifest_file_path, re.IGNORECASE):
-            raw_run_request = yaml.load(content, Loader=yaml.SafeLoader)
-        elif re.search(r'\.json$', manifest_file_path, re.IGNORECASE):
+        lowercase_manifest_file_path = manifest_file_path.lower()
+        if lowercase_manifest_file_path.endswith(('.yaml', '.yml')):
+            raw_run_request = yaml.load(content, Loader=SafeYamlLoader)
+        elif lowercase_manifest_file_path.endswith('.json'):
             raw_run_request = json.loads(content)
         else:
             raise RuntimeError('Unsupported manifest file type. Currently only support JSON and YAML.')
@@ -229,11 +233,8 @@ def get(context: Optional[str],
     info = run.info()
 
     # Get the output formatter.
-    if output == OutputFormat.JSON:
-        formatter = to_json
-    elif output == OutputFormat.YAML:
-        formatter = to_yaml
-    else:
+    formatter = _FORMATTERS.get(output)
+    if formatter is None:
         raise NotImplementedError(output)
 
     # Output the data
@@ -299,15 +300,24 @@ def logs(context: Optional[str],
             if verbose:
                 click.secho(f'{log_name}: ({len(stdout) + len(stderr)} bytes in total)', err=True, fg='blue')
 
+            # Each log is written at once instead of line by line.
             if stdout:
-                for line in stdout.split('\n'):
-                    click.secho(f'{log_name}: ', dim=True, nl=False)
-                    click.secho(line)
+                click.echo(_format_log_lines(log_name, stdout), nl=False)
 
             if stderr:
-                for line in stderr.split('\n'):
-                    click.secho(f'{log_name}: ', dim=True, nl=False)
-                    click.secho(line, fg='red')
+                click.echo(_format_log_lines(log_name, stderr, fg='red'), nl=False)
+
+
+def _format_log_lines(log_name: str, content: str, fg: Optional[str] = None) -> str:
+    # NOTE: Every line is prefixed with the log name and terminated with a line break. This is done by replacing the
+    #       line breaks in one go so that the (potentially large) log is not split into a list of lines.
+    line_start = click.style(f'{log_name}: ', dim=True)
+    line_end = '\n'
+    if fg:
+        style_start, style_end = click.style('\0', fg=fg).split('\0')
+        line_start += style_start
+        line_end = style_end + line_end
+    return line_start + content.replace('\n', line_end + line_start) + line_end
 
 
 def _show_next_step(suggestion: str,
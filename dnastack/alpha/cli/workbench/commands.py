@@ -1,13 +1,23 @@
 import click
 
-from dnastack.alpha.cli.workbench.engines_commands import alpha_engines_command_group
-from dnastack.alpha.cli.workbench.workflows_commands import alpha_workflows_command_group
+from dnastack.cli.helpers.command.group import LazyAliasedGroup
 
+# NOTE: The subcommands are only imported when they are invoked.
+_LAZY_SUBCOMMANDS = {
+    'engines': 'dnastack.alpha.cli.workbench.engines_commands:alpha_engines_command_group',
+    'workflows': 'dnastack.alpha.cli.workbench.workflows_commands:alpha_workflows_command_group',
+}
 
-@click.group('workbench')
-def alpha_workbench_command_group():
-    """ Interact with Workbench """
+# NOTE: The help of the subcommands is declared here so that the help message does not import every subcommand.
+_LAZY_SUBCOMMAND_HELP = {
+    'engines': 'Interact with execution engines',
+    'workflows': 'Create and interact with workflows',
+}
 
 
-alpha_workbench_command_group.add_command(alpha_workflows_command_group)
-alpha_workbench_command_group.add_command(alpha_engines_command_group)
+@click.group('workbench',
+             cls=LazyAliasedGroup,
+             lazy_sub_commands=_LAZY_SUBCOMMANDS,
+             lazy_sub_command_help=_LAZY_SUBCOMMAND_HELP)
+def alpha_workbench_command_group():
+    """ Interact with Workbench """
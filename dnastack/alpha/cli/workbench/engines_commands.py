@@ -1,15 +1,15 @@
-from typing import Optional
+from typing import Optional, List
 
 import click
 from click import style
 
+from dnastack.alpha.cli.workbench.utils import describe_all
 from dnastack.cli.workbench.utils import get_ewes_client
 from dnastack.client.workbench.ewes.models import ExecutionEngineListOptions
 from dnastack.cli.helpers.command.decorator import command
 from dnastack.cli.helpers.command.spec import ArgumentSpec
 from dnastack.cli.helpers.exporter import to_json, normalize
 from dnastack.cli.helpers.iterator_printer import show_iterator, OutputFormat
-from dnastack.common.json_argument_parser import *
 
 
 @click.group('engines')
@@ -47,7 +47,7 @@ def list_engines(context: Optional[str],
 
     client = get_ewes_client(context_name=context, endpoint_id=endpoint_id, namespace=namespace)
     list_options: ExecutionEngineListOptions = ExecutionEngineListOptions()
-    show_iterator(output_format=OutputFormat.JSON, iterator=client.list_engines(list_options, max_results))
+    show_iterator(output_format=OutputFormat.JSON, iterator=client.list_engines(list_options, max_results, prefetch=True))
 
 
 @command(alpha_engines_command_group,
@@ -76,5 +76,5 @@ def describe_engines(context: Optional[str],
         click.echo(style("You must specify at least one engine ID", fg='red'), err=True, color=True)
         exit(1)
 
-    described_engines = [client.get_engine(engine_id=engine) for engine in engines]
+    described_engines = describe_all(lambda engine: client.get_engine(engine_id=engine), engines)
     click.echo(to_json(normalize(described_engines)))
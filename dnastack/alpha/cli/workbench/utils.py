@@ -1,4 +1,5 @@
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable, List, TypeVar
 
 from imagination import container
 
@@ -8,13 +9,27 @@ from dnastack.cli.workbench.utils import _populate_workbench_endpoint
 
 WORKBENCH_HOSTNAME = "workbench.dnastack.com"
 
+T = TypeVar('T')
+
 
 def get_workflow_client(context_name: Optional[str] = None,
                         endpoint_id: Optional[str] = None,
                         namespace: Optional[str] = None) -> WorkflowClient:
     factory: ConfigurationBasedClientFactory = container.get(ConfigurationBasedClientFactory)
-    try:
-        return factory.get(WorkflowClient, endpoint_id=endpoint_id, context_name=context_name, namespace=namespace)
-    except AssertionError:
+    client = factory.find(WorkflowClient, endpoint_id=endpoint_id, context_name=context_name, namespace=namespace)
+    if client is None:
         _populate_workbench_endpoint()
-        return factory.get(WorkflowClient, endpoint_id=endpoint_id, context_name=context_name, namespace=namespace)
+        client = factory.get(WorkflowClient, endpoint_id=endpoint_id, context_name=context_name, namespace=namespace)
+    return client
+
+
+def describe_all(describe: Callable[[str], T], ids: List[str], max_workers: int = 16) -> List[T]:
+    """ Describe the resources with the given IDs concurrently, in the order of the IDs """
+    if len(ids) < 2:
+        return [describe(resource_id) for resource_id in ids]
+
+    # NOTE: The first resource is described alone so that any (interactive) authentication happens once before
+    #       the remaining requests are made concurrently with the stored credentials.
+    first_result = describe(ids[0])
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(ids) - 1)) as pool:
+        return [first_result, *pool.map(describe, ids[1:])]
@@ -1,17 +1,16 @@
-from typing import Optional
+from typing import Optional, List, Iterator
 
 import click
 from click import style
 
-from dnastack.alpha.cli.workbench.utils import get_workflow_client
+from dnastack.alpha.cli.workbench.utils import get_workflow_client, describe_all
 from dnastack.alpha.client.workflow.models import WorkflowCreate, WorkflowVersionCreate, WorkflowSource
 from dnastack.http.session import JsonPatch
-from dnastack.alpha.client.workflow.utils import WorkflowSourceLoader
 from dnastack.cli.helpers.command.decorator import command
 from dnastack.cli.helpers.command.spec import ArgumentSpec
 from dnastack.cli.helpers.exporter import to_json, normalize
 from dnastack.cli.helpers.iterator_printer import show_iterator, OutputFormat
-from dnastack.common.json_argument_parser import *
+from dnastack.common.json_argument_parser import FileOrValue
 
 
 @click.group('versions')
@@ -24,28 +23,24 @@ def alpha_workflows_command_group():
     """ Create and interact with  workflows"""
 
 
-def _get_author_patch(authors: str) -> Union[JsonPatch, None]:
-    if authors == "":
-        return JsonPatch(path="/authors", op="remove")
-    elif authors:
-        return JsonPatch(path="/authors", op="replace", value=authors.split(","))
-    return None
-
+def _build_patches(name_path: str,
+                   name: Optional[str],
+                   description: Optional[FileOrValue],
+                   authors: Optional[str]) -> Iterator[JsonPatch]:
+    """ Generate the patches for the given attributes, skipping the ones which are not given """
+    if name:
+        yield JsonPatch(path=name_path, op="replace", value=name)
 
-def _get_description_patch(description: Optional[FileOrValue]) -> Union[JsonPatch, None]:
-    if not description:
-        return None
-    if description.raw_value == "":
-        return JsonPatch(path="/description", op="remove")
-    elif description:
-        return JsonPatch(path="/description", op="replace", value=description.value())
-    return None
+    if description:
+        if description.raw_value == "":
+            yield JsonPatch(path="/description", op="remove")
+        else:
+            yield JsonPatch(path="/description", op="replace", value=description.value())
 
-
-def _get_replace_patch(path: str, value: str) -> Union[JsonPatch, None]:
-    if value:
-        return JsonPatch(path=path, op="replace", value=value)
-    return None
+    if authors == "":
+        yield JsonPatch(path="/authors", op="remove")
+    elif authors:
+        yield JsonPatch(path="/authors", op="replace", value=authors.split(","))
 
 
 @command(alpha_workflows_command_group,
@@ -124,8 +119,10 @@ def describe_workflows(context: Optional[str],
         click.echo(style("You must specify at least one workflow ID", fg='red'), err=True, color=True)
         exit(1)
 
-    described_workflows = [workflows_client.get_workflow(workflow_id, include_deleted=include_deleted) for workflow_id
-                           in workflows]
+    described_workflows = describe_all(
+        lambda workflow_id: workflows_client.get_workflow(workflow_id, include_deleted=include_deleted),
+        workflows
+    )
     click.echo(to_json(normalize(described_workflows)))
 
 
@@ -196,6 +193,9 @@ def create_workflow(context: Optional[str],
     docs: https://docs.dnastack.com/docs/workflows-create
     """
 
+    # NOTE: The source loader is only needed to create workflows and versions, so it is imported on demand.
+    from dnastack.alpha.client.workflow.utils import WorkflowSourceLoader
+
     workflows_client = get_workflow_client(context, endpoint_id, namespace)
     workflow_source = WorkflowSourceLoader(source_files)
 
@@ -299,12 +299,7 @@ def update_workflow(context: Optional[str],
     workflows_client = get_workflow_client(context, endpoint_id, namespace)
     workflow = workflows_client.get_workflow(workflow_id)
 
-    patch_list = [
-        _get_replace_patch("/name", name),
-        _get_description_patch(description),
-        _get_author_patch(authors)
-    ]
-    patch_list = [patch for patch in patch_list if patch]
+    patch_list = list(_build_patches("/name", name, description, authors))
 
     if patch_list:
         workflow = workflows_client.update_workflow(workflow_id, workflow.etag, patch_list)
@@ -393,10 +388,11 @@ def describe_version(context: Optional[str],
     docs: https://docs.dnastack.com/docs/workflows-versions-describe
     """
     workflows_client = get_workflow_client(context, endpoint_id, namespace)
-    click.echo(to_json(normalize(
-        [workflows_client.get_workflow_version(workflow_id=workflow, version_id=version_id,
-                                               include_deleted=include_deleted) for version_id in versions]
-    )))
+    click.echo(to_json(normalize(describe_all(
+        lambda version_id: workflows_client.get_workflow_version(workflow_id=workflow, version_id=version_id,
+                                                                 include_deleted=include_deleted),
+        versions
+    ))))
 
 
 @command(alpha_workflow_versions_command_group,
@@ -436,10 +432,10 @@ def delete_workflow_version(context: Optional[str],
     docs: https://docs.dnastack.com/docs/workflows-versions-delete
     """
     workflows_client = get_workflow_client(context, endpoint_id, namespace)
-    workflow = workflows_client.get_workflow(workflow_id)
+    # NOTE: The version already carries the name of its workflow, so the workflow itself is not fetched.
     version = workflows_client.get_workflow_version(workflow_id, version_id)
     if not force and not click.confirm(
-            f'Do you want to delete "{version.versionName}" from workflow "{workflow.name}"?'):
+            f'Do you want to delete "{version.versionName}" from workflow "{version.workflowName}"?'):
         return
 
     workflows_client.delete_workflow_version(workflow_id, version_id, version.etag)
@@ -510,6 +506,9 @@ def add_version(context: Optional[str],
 
     docs: https://docs.dnastack.com/docs/workflows-versions-create
     """
+    # NOTE: The source loader is only needed to create workflows and versions, so it is imported on demand.
+    from dnastack.alpha.client.workflow.utils import WorkflowSourceLoader
+
     workflows_client = get_workflow_client(context, endpoint_id, namespace)
     workflow_source = WorkflowSourceLoader(source_files)
 
@@ -580,12 +579,7 @@ def update_workflow_version(context: Optional[str],
     workflows_client = get_workflow_client(context, endpoint_id, namespace)
     workflow_version = workflows_client.get_workflow_version(workflow_id, version_id)
 
-    patch_list = [
-        _get_replace_patch("/versionName", version_name),
-        _get_description_patch(description),
-        _get_author_patch(authors)
-    ]
-    patch_list = [patch for patch in patch_list if patch]
+    patch_list = list(_build_patches("/versionName", version_name, description, authors))
 
     if patch_list:
         workflow_version = workflows_client.update_workflow_version(workflow_id, version_id, workflow_version.etag,
@@ -1,23 +1,36 @@
-import re
+from pathlib import Path
 from typing import Dict, Any
 
 from dnastack.common.parser import DotPropertiesParser
 
+# NOTE: This deletes the same characters as the regular expression "\s", i.e., every character where str.isspace() is
+#       true. U+3000 is the highest whitespace code point.
+_WHITESPACE_DELETION_TABLE = str.maketrans("", "", "".join(c for c in map(chr, range(0x3001)) if c.isspace()))
+
+# Parameter files are inlined into the request, so anything bigger than this is most likely a wrong path.
+_MAX_PARAM_FILE_SIZE = 16 * 1024 * 1024
+
+
+def _read_param_file(file_path: str) -> str:
+    path = Path(file_path)
+    if path.stat().st_size > _MAX_PARAM_FILE_SIZE:
+        raise ValueError(f'The param file ({file_path}) exceeds the maximum size of {_MAX_PARAM_FILE_SIZE} bytes.')
+    return path.read_text()
+
 
 class WorkflowParamParser(DotPropertiesParser):
     def parse(self, content: str) -> Dict[str, Any]:
         params_list = []
         split_params = content.split(",")
         for param in split_params:
-            if "@" in param:
-                key, value = param.split("=")
-                if re.search(r"^(.+)\/([^\/]+)$", value[1:]):
-                    with open(value[1:]) as param_file:
-                        file_content = re.sub(r'[\n\t\s]', "", param_file.read())
-                        params_list.append("=".join([key, file_content]))
+            key, separator, value = param.partition("=")
+            if separator and value.startswith("@"):
+                file_path = value[1:]
+                # The path must have a directory and a file name, i.e., "<directory>/<file name>".
+                last_slash_index = file_path.rfind("/")
+                if 0 < last_slash_index < len(file_path) - 1:
+                    file_content = _read_param_file(file_path).translate(_WHITESPACE_DELETION_TABLE)
+                    params_list.append(f"{key}={file_content}")
             else:
                 params_list.append(param)
         return DotPropertiesParser.parse(self, "\n".join(params_list))
-
-
-
@@ -5,7 +5,9 @@ from dnastack.client.collections.client import CollectionServiceClient as Standa
     STANDARD_COLLECTION_SERVICE_TYPE_V1_0
 from dnastack.client.collections.model import Collection, COLLECTION_READ_ONLY_PROPERTIES
 from dnastack.common.tracing import Span
-from dnastack.http.session import JsonPatch
+
+# The public tuple keeps the order for the error message while the set is used for the lookups.
+_READ_ONLY_PROPERTIES = frozenset(COLLECTION_READ_ONLY_PROPERTIES)
 
 
 class NoUpdateError(RuntimeError):
@@ -37,11 +39,17 @@ class CollectionServiceClient(StandardCollectionServiceClient):
 
         collection_id = collection.id if collection else id
 
-        given_overriding_properties = (collection.dict() if collection else (attrs or dict()))
+        # NOTE: The read-only properties are skipped while converting the collection. ("exclude_none" would also drop
+        #       the null values nested in the metadata.) The patches are plain dictionaries as they are only sent out.
+        given_overriding_properties = (
+            collection.dict(exclude=_READ_ONLY_PROPERTIES)
+            if collection
+            else (attrs or dict())
+        )
         update_patches = [
-            JsonPatch(op='replace', path=f'/{k}', value=v).dict()
+            dict(op='replace', path=f'/{k}', value=v)
             for k, v in given_overriding_properties.items()
-            if k not in COLLECTION_READ_ONLY_PROPERTIES and v is not None
+            if k not in _READ_ONLY_PROPERTIES and v is not None
         ]
 
         if not update_patches:
@@ -63,6 +71,6 @@ class CollectionServiceClient(StandardCollectionServiceClient):
                                                 headers={'If-Match': etag},
                                                 json=update_patches)
 
-            return Collection(**patch_response.json())
+            return Collection.parse_raw(patch_response.content)
 
 
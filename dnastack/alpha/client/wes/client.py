@@ -2,31 +2,51 @@
 import os.path
 from mimetypes import guess_type
 
+import logging
 from pprint import pformat
 
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from contextlib import ExitStack
+from copy import deepcopy
 from datetime import datetime
+from threading import Lock, local
 from pydantic import BaseModel, ValidationError, Field
-from typing import Iterator, Optional, List, Any, Dict, Union
+from typing import Iterator, Optional, List, Any, Dict, Union, Deque, Callable, Tuple
 from urllib.parse import urljoin
 
 from dnastack.client.base_client import BaseServiceClient
 from dnastack.client.base_exceptions import UnauthenticatedApiAccessError, UnauthorizedApiAccessError, DataConnectError
+from dnastack.client.models import ServiceEndpoint
 from dnastack.client.result_iterator import ResultLoader, InactiveLoaderError, ResultIterator
 from dnastack.client.service_registry.models import ServiceType, Service
 from dnastack.http.session import HttpSession, HttpError, ClientError
 
+try:
+    # The optional "orjson" package is used to encode the JSON form fields whenever it is available.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # The optional "requests-toolbelt" package streams the multipart form data instead of building it in memory.
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
 STANDARD_WES_TYPE_V1_1 = ServiceType(group='org.ga4gh', artifact='wes', version='1.1')
 STANDARD_WES_TYPE_V1_0 = ServiceType(group='org.ga4gh', artifact='wes', version='1.0')
 
+_EMPTY_JSON_OBJECT = '{}'
+_MAX_CONCURRENT_LOG_REQUESTS = 8
 
-class ErrorResponse(BaseModel):
-    ...
+# Only the most recently visited URLs are kept to be reported with the error.
+_MAX_VISITED_URLS = 128
 
 
-class _FormDataEntry(BaseModel):
-    name: str
-    value: str
+class ErrorResponse(BaseModel):
+    ...
 
 
 class RunRequest(BaseModel):
@@ -40,7 +60,14 @@ class RunRequest(BaseModel):
     # Auxiliary properties
     attachments: Optional[List[str]] = None
 
-    def to_form_data(self):
+    def to_form_data(self, exit_stack: Optional[ExitStack] = None):
+        """
+        Build the keyword arguments of the multipart request
+
+        Without the exit stack, the attachments are read into memory. With the exit stack, the attachments are opened
+        on it and only read when the request is sent. They are streamed only if "requests-toolbelt" is installed, as
+        "requests" reads the whole file to build the request body otherwise.
+        """
         multipart_data = [
             ('workflow_url', (None, self.workflow_url)),
             ('workflow_type', (None, self.workflow_type)),
@@ -52,35 +79,94 @@ class RunRequest(BaseModel):
             property_value = getattr(self, property_name)
 
             if not property_value:
-                property_value = '{}'
+                property_value = _EMPTY_JSON_OBJECT
             elif isinstance(property_value, dict):
-                property_value = json.dumps(property_value)
+                property_value = _to_json(property_value)
 
             multipart_data.append((property_name, (None, property_value, 'application/json')))
 
         # Handle file attachments.
-        if self.attachments:
-            for i in range(len(self.attachments)):
-                param_name = 'workflow_attachment'
-                attachment_url = self.attachments[i]
-                guessed = guess_type(attachment_url)
-
+        if exit_stack is None:
+            for attachment_url in (self.attachments or []):
                 with open(attachment_url, 'rb') as f:
-                    multipart_data.append((
-                        param_name,
-                        (
-                            os.path.basename(attachment_url),  # file name
-                            f.read(),  # binary
-                            guessed[0] if guessed and guessed[0] else None,
-                        )
-                    ))
+                    multipart_data.append(_create_attachment_field(attachment_url, f.read()))
+
+            return dict(files=multipart_data)
+
+        attachment_files = []
+        for attachment_url in (self.attachments or []):
+            attachment_file = exit_stack.enter_context(open(attachment_url, 'rb'))
+            attachment_files.append(attachment_file)
+            multipart_data.append(_create_attachment_field(attachment_url, attachment_file))
+
+        if MultipartEncoder is None:
+            return dict(
+                files=multipart_data,
+                hooks=dict(response=lambda *_, **__: _rewind_files(attachment_files)),
+            )
 
+        stream = _MultipartStream(multipart_data, attachment_files)
         return dict(
-            # data=form_data,
-            files=multipart_data
+            data=stream,
+            headers={'Content-Type': stream.content_type},
+            hooks=dict(response=lambda *_, **__: stream.rewind()),
         )
 
 
+def _create_attachment_field(attachment_url: str, content):
+    guessed = guess_type(attachment_url)
+    return (
+        'workflow_attachment',
+        (
+            os.path.basename(attachment_url),  # file name
+            content,  # binary
+            guessed[0] if guessed and guessed[0] else None,
+        )
+    )
+
+
+def _to_json(value: Dict[str, Any]) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode('utf-8')
+        except TypeError:
+            # Let the standard library handle (or reject) what orjson does not support, e.g., non-string keys.
+            pass
+    return json.dumps(value)
+
+
+def _rewind_files(files):
+    # NOTE: The HTTP session re-submits the same request after re-authentication, so the attachments are rewound
+    #       after every response to be read again from the beginning.
+    for file in files:
+        file.seek(0)
+
+
+class _MultipartStream:
+    """ Multipart form data which can be streamed more than once """
+
+    def __init__(self, fields, files):
+        self.__fields = fields
+        self.__files = files
+        self.__encoder = MultipartEncoder(fields=self.__fields)
+
+    @property
+    def content_type(self) -> str:
+        return self.__encoder.content_type
+
+    @property
+    def len(self) -> int:
+        return self.__encoder.len
+
+    def read(self, size: int = -1) -> bytes:
+        return self.__encoder.read(size)
+
+    def rewind(self):
+        _rewind_files(self.__files)
+        # The new encoder has to use the same boundary as the one already given in the content type.
+        self.__encoder = MultipartEncoder(fields=self.__fields, boundary=self.__encoder.boundary_value)
+
+
 class _Id(BaseModel):
     run_id: str
 
@@ -157,7 +243,7 @@ class RunListLoader(ResultLoader):
         self.__page_token = page_token
         self.__current_url: Optional[str] = None
         self.__active = True
-        self.__visited_urls: List[str] = Field(default_factory=list)
+        self.__visited_urls: Deque[str] = deque(maxlen=_MAX_VISITED_URLS)
 
     def load(self) -> List[_Status]:
         if not self.__active:
@@ -189,7 +275,7 @@ class RunListLoader(ResultLoader):
                         f'Unexpected error: {response_text}',
                         status_code,
                         response_text,
-                        urls=self.__visited_urls
+                        urls=list(self.__visited_urls)
                     )
 
             status_code = response.status_code
@@ -203,7 +289,7 @@ class RunListLoader(ResultLoader):
                     f'Unable to deserialize JSON from {response_text}.',
                     status_code,
                     response_text,
-                    urls=self.__visited_urls
+                    urls=list(self.__visited_urls)
                 )
 
             try:
@@ -213,10 +299,11 @@ class RunListLoader(ResultLoader):
                     f'Invalid Response Body: {response_body}',
                     status_code,
                     response_text,
-                    urls=self.__visited_urls
+                    urls=list(self.__visited_urls)
                 )
 
-            self.logger.debug(f'Response:\n{pformat(response_body, indent=2)}')
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f'Response:\n{pformat(response_body, indent=2)}')
 
             self.__page_token = api_response.next_page_token or None
             if not self.__page_token:
@@ -244,10 +331,21 @@ class LogOutput(BaseModel):
 
 
 class Run:
-    def __init__(self, session: Optional[HttpSession] = None, base_url: Optional[str] = None):
+    def __init__(self,
+                 session: Optional[HttpSession] = None,
+                 base_url: Optional[str] = None,
+                 session_factory: Optional[Callable[[], HttpSession]] = None):
+        """
+        :param session: The HTTP session
+        :param base_url: The URL of the run
+        :param session_factory: The factory of the extra HTTP sessions to load the logs concurrently, one per worker
+                                thread. Without it, the logs are loaded one by one with the given session.
+        """
         self.__session = session
+        self.__session_factory = session_factory
         self.__base_url = base_url if base_url.endswith('/') else (base_url + '/')
-        self.__id = None
+        # The base URL always ends with the run ID, i.e., ".../runs/{id}/".
+        self.__id = self.__base_url[:-1].rsplit('/', 1)[-1]
 
     def connect(self, session: HttpSession):
         assert self.__session is not None, 'This Run object has already been attached to a WES client.'
@@ -255,52 +353,110 @@ class Run:
 
     def info(self) -> _Run:
         # GET /runs/{id}
-        raw_data = self.__session.get(self.__base_url).json()
+        response = self.__session.get(self.__base_url)
         try:
-            return _Run(**raw_data)
+            return _Run.parse_raw(response.content)
         except ValidationError:
-            raise RuntimeError(f'Unexpected Response: {raw_data}')
+            raise RuntimeError(f'Unexpected Response: {response.text}')
 
     @property
     def id(self) -> str:
-        if not self.__id:
-            self.__id = self.info().run_id
         return self.__id
 
     @property
     def status(self) -> str:
         # GET /runs/{id}/status
-        response = self.__session.get(urljoin(self.__base_url, 'status'))
-        return _Status(**response.json()).state
+        response = self.__session.get(self.__base_url + 'status')
+        return _Status.parse_raw(response.content).state
 
     def cancel(self):
         # POST /runs/{id}/cancel
-        self.__session.post(urljoin(self.__base_url, 'cancel'))
+        self.__session.post(self.__base_url + 'cancel')
 
     def get_logs(self, include_stderr: bool = False) -> Iterator[LogOutput]:
         info = self.info()
+        log_records = info.task_logs + [info.run_log]
+        log_urls = [
+            url
+            for log_record in log_records
+            for url in (log_record.stdout, log_record.stderr if include_stderr else None)
+        ]
 
-        for log_record in info.task_logs + [info.run_log]:
-            output = LogOutput(origin=log_record)
+        if self.__session_factory:
+            log_contents = self.__get_log_contents_concurrently(log_urls)
+        else:
+            log_contents = (self.__get_log_content(self.__session, url) for url in log_urls)
+
+        for log_record in log_records:
+            stdout = next(log_contents)
+            stderr = next(log_contents)
+            yield LogOutput(origin=log_record, stdout=stdout, stderr=stderr)
+
+    def __get_log_contents_concurrently(self, urls: List[Optional[str]]) -> Iterator[Optional[str]]:
+        # All logs are requested at once while the contents are still yielded in the original order. As the session is
+        # not shared across threads, each worker thread has its own session.
+        worker_local = local()
+        worker_sessions: List[HttpSession] = []
+
+        def get_log_content(url: Optional[str]) -> Optional[str]:
+            if not url:
+                return None
+            if not hasattr(worker_local, 'session'):
+                worker_local.session = self.__session_factory()
+                worker_sessions.append(worker_local.session)
+            return self.__get_log_content(worker_local.session, url)
+
+        executor = ThreadPoolExecutor(max_workers=max(1, min(_MAX_CONCURRENT_LOG_REQUESTS, len(urls))))
+        futures = [executor.submit(get_log_content, url) for url in urls]
+        # No more requests are submitted. The worker threads exit once the submitted requests are done or cancelled.
+        executor.shutdown(wait=False)
 
-            if log_record.stdout:
-                try:
-                    output.stdout = self.__session.get(log_record.stdout).text.strip()
-                except ClientError as e:
-                    if e.response.status_code != 404:
-                        raise e
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            # When the caller stops early, the pending requests are cancelled and the requests in flight are not
+            # waited for. The sessions are closed once the last request is done.
+            for future in futures:
+                future.cancel()
+            _close_sessions_when_done(futures, worker_sessions)
 
-            if include_stderr and log_record.stderr:
-                try:
-                    output.stderr = self.__session.get(log_record.stderr).text.strip()
-                except ClientError as e:
-                    if e.response.status_code != 404:
-                        raise e
+    @staticmethod
+    def __get_log_content(session: HttpSession, url: Optional[str]) -> Optional[str]:
+        if not url:
+            return None
 
-            yield output
+        try:
+            return session.get(url).text.strip()
+        except ClientError as e:
+            if e.response.status_code != 404:
+                raise e
+            return None
+
+
+def _close_sessions_when_done(futures: List[Future], sessions: List[HttpSession]):
+    pending_futures = set(futures)
+    lock = Lock()
+
+    def on_done(future: Future):
+        with lock:
+            pending_futures.discard(future)
+            if pending_futures:
+                return
+        for session in sessions:
+            session.close()
+
+    for future in futures:
+        future.add_done_callback(on_done)
 
 
 class WesClient(BaseServiceClient):
+    def __init__(self, endpoint: ServiceEndpoint):
+        super().__init__(endpoint)
+        self.__runs_url = urljoin(self.endpoint.url, 'runs')
+        # The last known service info with its ETag, revalidated with "If-None-Match" on every request.
+        self.__service_info_cache: Optional[Tuple[str, Dict[str, Any]]] = None
+
     @staticmethod
     def get_adapter_type() -> str:
         return 'wes'
@@ -313,23 +469,35 @@ class WesClient(BaseServiceClient):
         ]
 
     def get_service_info(self):
+        etag, cached_service_info = self.__service_info_cache or (None, None)
         with self.create_http_session() as session:
-            response = session.get(urljoin(self.endpoint.url, f'service-info'))
-            return response.json()
+            response = session.get(urljoin(self.endpoint.url, f'service-info'),
+                                   headers={'If-None-Match': f'"{etag}"'} if etag else None)
+
+            if response.status_code == 304:
+                # The service info has not changed since the last request.
+                return deepcopy(cached_service_info)
+
+            service_info = response.json()
+            etag = response.headers.get('Etag')
+            self.__service_info_cache = (etag.strip('"'), deepcopy(service_info)) if etag else None
+            return service_info
 
-    def get_runs(self, page_size: Optional[int] = None, page_token: Optional[str] = None) -> Iterator[_Run]:
+    def get_runs(self,
+                 page_size: Optional[int] = None,
+                 page_token: Optional[str] = None) -> Iterator[_Run]:
         # GET /runs
-        return ResultIterator(RunListLoader(initial_url=urljoin(self.endpoint.url, f'runs'),
+        return ResultIterator(RunListLoader(initial_url=self.__runs_url,
                                             page_size=page_size,
                                             page_token=page_token,
                                             http_session=self.create_http_session()))
 
     def run(self, id: str) -> Run:
-        return Run(self.create_http_session(), urljoin(self.endpoint.url, f'runs/{id}'))
+        return Run(self.create_http_session(), f'{self.__runs_url}/{id}', session_factory=self.create_http_session)
 
     def submit(self, run: RunRequest) -> str:
         workflow_url_is_external = run.workflow_url.startswith('http://') or run.workflow_url.startswith('https://')
-        workflow_url_is_in_attachments = run.workflow_url in [os.path.basename(p) for p in (run.attachments or list())]
+        workflow_url_is_in_attachments = any(os.path.basename(p) == run.workflow_url for p in (run.attachments or []))
         if not workflow_url_is_external and not workflow_url_is_in_attachments:
             if not workflow_url_is_in_attachments:
                 raise RuntimeError('The workflow file from the local drive is defined but it is apparently not in the '
@@ -338,7 +506,7 @@ class WesClient(BaseServiceClient):
             else:
                 raise RuntimeError(f'The given workflow URL is not supported. (Given: {run.workflow_url})')
 
-        with self.create_http_session() as session:
-            response = session.post(urljoin(self.endpoint.url, 'runs'),
-                                    **run.to_form_data())
-            return _Id(**response.json()).run_id
+        with ExitStack() as exit_stack, self.create_http_session() as session:
+            response = session.post(self.__runs_url,
+                                    **run.to_form_data(exit_stack))
+            return _Id.parse_raw(response.content).run_id
@@ -1,15 +1,28 @@
-from typing import List, Iterator, Optional
+from collections import OrderedDict
+from threading import Lock
+from typing import List, Iterator, Optional, Tuple, Type, TypeVar, Union
 from urllib.parse import urljoin
 
 from dnastack.alpha.client.workbench.base_client import BaseWorkbenchClient
 from dnastack.alpha.client.workflow.models import WorkflowDescriptor, WorkflowListResult, Workflow, WorkflowCreate, \
     WorkflowVersionCreate, WorkflowVersion, WorkflowVersionListResult, WorkflowSource
-from dnastack.http.session import JsonPatch
+from dnastack.http.session import JsonPatch, HttpSession
 from dnastack.client.models import ServiceEndpoint
 from dnastack.client.service_registry.models import ServiceType
 
+T = TypeVar('T', bound=Union[Workflow, WorkflowVersion])
+
+# The least recently used resources are evicted from the ETag cache beyond this number of entries.
+_MAX_ETAG_CACHE_SIZE = 256
+
 
 class WorkflowClient(BaseWorkbenchClient):
+    def __init__(self, endpoint: ServiceEndpoint, namespace: Optional[str] = None):
+        super().__init__(endpoint, namespace)
+        # The last known representation of each resource by URL, revalidated with "If-None-Match" on every request.
+        self.__etag_cache: 'OrderedDict[str, Tuple[str, Union[Workflow, WorkflowVersion]]]' = OrderedDict()
+        self.__etag_cache_lock = Lock()
+        self.__workflows_url = urljoin(self.endpoint.url, f'{self.namespace}/workflows')
 
     @staticmethod
     def get_adapter_type() -> str:
@@ -30,93 +43,113 @@ class WorkflowClient(BaseWorkbenchClient):
         return cls(endpoint, namespace)
 
     def get_json_schema(self, workflow_id: str, version_id: str) -> WorkflowDescriptor:
-        with self.create_http_session() as session:
-            response = session.get(
-                urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}/versions/{version_id}/describe'))
-        return WorkflowDescriptor(**response.json())
+        session = self._get_http_session()
+        response = session.get(
+            f'{self.__workflows_url}/{workflow_id}/versions/{version_id}/describe')
+        return WorkflowDescriptor.parse_raw(response.content)
 
     def list_workflows(self, source: Optional[WorkflowSource], include_deleted: Optional[bool] = False) -> Iterator[
         Workflow]:
-        with self.create_http_session() as session:
-            response = session.get(
-                urljoin(self.endpoint.url, f'{self.namespace}/workflows?deleted={include_deleted}')
-            )
-            workflows = WorkflowListResult(**response.json()).workflows
-            if source:
-                workflows = [w for w in workflows if w.source == source]
+        session = self._get_http_session()
+        response = session.get(
+            self.__workflows_url,
+            # The workflow service filters the workflows by source, the same way as the stable client lists them.
+            params=dict(deleted=include_deleted, source=source.value if source else None)
+        )
+        workflows = WorkflowListResult.parse_raw(response.content).workflows
+        if source:
+            # The result is still checked in case the service ignores the filter.
+            workflows = [w for w in workflows if w.source == source]
         return iter(workflows)
 
     def list_workflow_versions(self, workflow_id: str, include_deleted: Optional[bool] = False) -> Iterator[
         WorkflowVersion]:
-        with self.create_http_session() as session:
-            response = session.get(
-                urljoin(self.endpoint.url,
-                        f'{self.namespace}/workflows/{workflow_id}/versions?deleted={include_deleted}'))
-        return iter(WorkflowVersionListResult(**response.json()).versions)
+        session = self._get_http_session()
+        response = session.get(
+            f'{self.__workflows_url}/{workflow_id}/versions?deleted={include_deleted}')
+        return iter(WorkflowVersionListResult.parse_raw(response.content).versions)
 
     def get_workflow(self, workflow_id: str, include_deleted: Optional[bool] = False) -> Workflow:
-        with self.create_http_session() as session:
-            response = session.get(
-                urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}?deleted={include_deleted}'))
-            workflow = Workflow(**response.json())
-            workflow.etag = response.headers.get("Etag").strip("\"")
-            return workflow
+        return self.__get_with_etag(
+            f'{self.__workflows_url}/{workflow_id}?deleted={include_deleted}',
+            Workflow)
 
     def get_workflow_version(self, workflow_id: str, version_id: str,
                              include_deleted: Optional[bool] = False) -> WorkflowVersion:
-        with self.create_http_session() as session:
-            response = session.get(
-                urljoin(self.endpoint.url,
-                        f'{self.namespace}/workflows/{workflow_id}/versions/{version_id}?deleted={include_deleted}'))
-            workflow_version = WorkflowVersion(**response.json())
-            workflow_version.etag = response.headers.get("Etag").strip("\"")
-            return workflow_version
+        return self.__get_with_etag(
+            f'{self.__workflows_url}/{workflow_id}/versions/{version_id}?deleted={include_deleted}',
+            WorkflowVersion)
+
+    def __get_with_etag(self, url: str, model_class: Type[T]) -> T:
+        with self.__etag_cache_lock:
+            etag, cached_resource = self.__etag_cache.get(url, (None, None))
+            if etag:
+                self.__etag_cache.move_to_end(url)
+
+        session = self._get_http_session()
+        response = session.get(url, headers={'If-None-Match': f'"{etag}"'} if etag else None)
+
+        if response.status_code == 304:
+            # The resource has not changed since the last request, so the copy of the cached resource is returned
+            # without transferring and validating the response body again.
+            return cached_resource.copy(deep=True)
+
+        resource = model_class.parse_raw(response.content)
+        resource.etag = response.headers.get("Etag").strip("\"")
+
+        with self.__etag_cache_lock:
+            self.__etag_cache[url] = (resource.etag, resource.copy(deep=True))
+            self.__etag_cache.move_to_end(url)
+            while len(self.__etag_cache) > _MAX_ETAG_CACHE_SIZE:
+                self.__etag_cache.popitem(last=False)
+
+        return resource
 
     def create_workflow(self, workflow_create_request: WorkflowCreate) -> Workflow:
-        with self.create_http_session() as session:
-            response = session.post(
-                urljoin(self.endpoint.url, f'{self.namespace}/workflows'), json=workflow_create_request.dict())
-        return Workflow(**response.json())
+        session = self._get_http_session()
+        response = session.post(
+            self.__workflows_url, json=workflow_create_request.dict(exclude_none=True))
+        return Workflow.parse_raw(response.content)
 
     def create_version(self, workflow_id: str,
                        workflow_version_create_request: WorkflowVersionCreate) -> WorkflowVersion:
-        with self.create_http_session() as session:
-            response = session.post(
-                urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}/versions'),
-                json=workflow_version_create_request.dict())
-        return WorkflowVersion(**response.json())
+        session = self._get_http_session()
+        response = session.post(
+            f'{self.__workflows_url}/{workflow_id}/versions',
+            json=workflow_version_create_request.dict(exclude_none=True))
+        return WorkflowVersion.parse_raw(response.content)
 
     def delete_workflow(self, workflow_id: str, etag: str):
-        with self.create_http_session() as session:
-            session.delete(
-                urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}'),
-                headers={'If-Match': etag}
-            )
+        session = self._get_http_session()
+        session.delete(
+            f'{self.__workflows_url}/{workflow_id}',
+            headers={'If-Match': etag}
+        )
 
     def delete_workflow_version(self, workflow_id: str, version_id: str, etag: str):
-        with self.create_http_session() as session:
-            session.delete(
-                urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}/versions/{version_id}'),
-                headers={'If-Match': etag}
-            )
+        session = self._get_http_session()
+        session.delete(
+            f'{self.__workflows_url}/{workflow_id}/versions/{version_id}',
+            headers={'If-Match': etag}
+        )
 
     def update_workflow(self, workflow_id: str, etag: str, updates: List[JsonPatch]) -> Workflow:
-        with self.create_http_session() as session:
-            updates = [update.dict() for update in updates]
-            response = session.json_patch(
-                urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}'),
-                headers={'If-Match': etag},
-                json=updates
-            )
-            return Workflow(**response.json())
+        session = self._get_http_session()
+        updates = [update.dict() for update in updates]
+        response = session.json_patch(
+            f'{self.__workflows_url}/{workflow_id}',
+            headers={'If-Match': etag},
+            json=updates
+        )
+        return Workflow.parse_raw(response.content)
 
     def update_workflow_version(self, workflow_id: str, version_id: str, etag: str,
                                 updates: List[JsonPatch]) -> WorkflowVersion:
-        with self.create_http_session() as session:
-            updates = [update.dict() for update in updates]
-            response = session.json_patch(
-                urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}/versions/{version_id}'),
-                headers={'If-Match': etag},
-                json=updates
-            )
-            return WorkflowVersion(**response.json())
+        session = self._get_http_session()
+        updates = [update.dict() for update in updates]
+        response = session.json_patch(
+            f'{self.__workflows_url}/{workflow_id}/versions/{version_id}',
+            headers={'If-Match': etag},
+            json=updates
+        )
+        return WorkflowVersion.parse_raw(response.content)
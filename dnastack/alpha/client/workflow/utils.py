@@ -1,10 +1,16 @@
 import os
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Set
 import re
 
 from dnastack.alpha.client.workflow.models import WorkflowFile, WorkflowFileType
 
+_IMPORT_PATTERN = re.compile(r'^\s*import\s["\'](?!http)(.+)["\'].*$', re.MULTILINE)
+_WDL_FILE_EXTENSION = ".wdl"
+_NON_WDL_FILE_TYPES_BY_EXTENSION = {
+    ".json": WorkflowFileType.test_file,
+}
+
 
 class WorkflowSourceLoaderError(Exception):
     pass
@@ -17,78 +23,68 @@ class WorkflowSourceLoader(object):
         self.source_files = source_files
         self._load_files()
 
-    def _resolve_content(self, uri: Optional[Path], path: Path, _visited: List[Path]) -> List[Tuple[Path, str]]:
-        cwd = Path.cwd().resolve()
+    def _resolve_content(self, uri: Optional[Path], path: Path, _visited: Set[Path]) -> List[Tuple[Path, str]]:
+        # NOTE: The imports are resolved against the absolute path of the importing file's directory instead of
+        #       changing the working directory, which is shared by every thread in the process.
+        import_path = path.resolve() if not uri else (uri / path).resolve()
+
+        if import_path not in _visited:
+            _visited.add(import_path)
+        else:
+            return list()
+
+        # NOTE: Opening the file right away tells whether it is readable without checking its existence upfront.
         try:
-            if not uri:
-                import_path = path.resolve()
-            else:
-                os.chdir(uri)
-                import_path = Path(os.path.join(uri, path)).resolve()
+            fp = import_path.open()
+        except OSError as e:
+            raise IOError(
+                f"Could not open file {import_path}. Caller does not have permission or it does not not exist or is") from e
 
-            if not import_path.exists():
-                raise IOError(
-                    f"Could not open file {import_path}. Caller does not have permission or it does not not exist or is")
+        with fp:
+            content = fp.read()
 
-            if import_path not in _visited:
-                _visited.append(import_path)
-            else:
-                return list()
-
-            pattern = re.compile(r'^\s*import\s["\'](?!http)(.+)["\'].*$')
-            resolved_content = list()
-            all_imported_contents = list()
-            with import_path.open() as fp:
-                content = ""
-                for line in fp.readlines():
-                    content += line
-                    match = pattern.match(line)
-                    if match:
-                        import_statement = Path(match.group(1))
-                        imported_contents = self._resolve_content(import_path.parent, import_statement, _visited)
-                        all_imported_contents.extend(imported_contents)
-                resolved_content.append((import_path, content))
-                resolved_content.extend(all_imported_contents)
-            return resolved_content
-        finally:
-            os.chdir(cwd)
+        # The imports are located in one scan over the whole content.
+        resolved_content = [(import_path, content)]
+        for match in _IMPORT_PATTERN.finditer(content):
+            import_statement = Path(match.group(1))
+            resolved_content.extend(self._resolve_content(import_path.parent, import_statement, _visited))
+        return resolved_content
 
     def _load_files(self):
         path_and_contents: List[Tuple[Path, str]] = list()
-        _visited = list()
+        _visited: Set[Path] = set()
         for path in self.source_files:
             path_and_contents.extend(self._resolve_content(None, Path(path), _visited))
-        wdl_files = [wdl_file for wdl_file in path_and_contents if wdl_file[0].name.endswith(".wdl")]
-        if len(wdl_files) == 0:
-            raise ValueError("No WDL files defined")
-        primary_path = wdl_files[0][0]
-        primary_set = False
-        files = list()
+        # The file types are assigned in the same pass that finds the primary (first) WDL file.
+        primary_path: Optional[Path] = None
+        typed_files: List[Tuple[Path, WorkflowFileType, str]] = list()
         for (file, content) in path_and_contents:
-            if file.name.endswith(".wdl"):
-                if primary_set:
-                    file_type = WorkflowFileType.secondary
-                else:
+            if file.suffix == _WDL_FILE_EXTENSION:
+                if primary_path is None:
+                    primary_path = file
                     file_type = WorkflowFileType.primary
-                    primary_set = True
-            elif file.name.endswith(".json"):
-                file_type = WorkflowFileType.test_file
+                else:
+                    file_type = WorkflowFileType.secondary
             else:
-                file_type = WorkflowFileType.other
+                file_type = _NON_WDL_FILE_TYPES_BY_EXTENSION.get(file.suffix, WorkflowFileType.other)
+            typed_files.append((file, file_type, content))
 
-            files.append(WorkflowFile(
-                path=str(file),
-                file_type=file_type,
-                content=content
-            ))
+        if primary_path is None:
+            raise ValueError("No WDL files defined")
 
         # Add the parent of the primary path
         # Given the list of absolute paths, strip the common leading path off of the set of paths
         # and the relativize each file path to the common leading path
-        common_path = Path(os.path.commonpath([file.path for file in files] + [primary_path.parent]))
-        for file in files:
-            file.path = str(Path(file.path).relative_to(common_path))
-        self._loaded_files = files
+        common_path = Path(os.path.commonpath([file for (file, _) in path_and_contents] + [primary_path.parent]))
+
+        self._loaded_files = [
+            WorkflowFile(
+                path=str(file.relative_to(common_path)),
+                file_type=file_type,
+                content=content
+            )
+            for (file, file_type, content) in typed_files
+        ]
 
     @property
     def loaded_files(self) -> List[WorkflowFile]:
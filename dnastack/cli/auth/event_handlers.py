@@ -1,4 +1,3 @@
-from copy import deepcopy
 from time import time
 from math import floor
 from typing import Any, Dict
@@ -30,16 +29,18 @@ def handle_auth_begin(event: Event):
 def handle_auth_end(event: Event):
     session_id = event.details['session_id']
     state: AuthState = event.details['state']
-    feedback: Dict[str, Any] = deepcopy(state.auth_info)
-    if state.status == AuthStateStatus.READY:
+    # Only a few top-level entries are added to the feedback, so the nested auth info is not copied.
+    feedback: Dict[str, Any] = dict(state.auth_info)
+    status = state.status
+    status_color = _status_color_map[status]
+    if status == AuthStateStatus.READY:
         is_refreshable = bool(state.session_info.get('refresh_token'))
         access_grant_duration_in_seconds = floor(state.session_info['valid_until'] - time())
 
         if not is_refreshable:
             duration_label = f'{access_grant_duration_in_seconds} seconds.'
             if access_grant_duration_in_seconds > 60:
-                minutes = floor(access_grant_duration_in_seconds / 60)
-                seconds = access_grant_duration_in_seconds % 60
+                minutes, seconds = divmod(access_grant_duration_in_seconds, 60)
                 duration_label = f'{minutes} minute{"s" if minutes > 1 else ""}'
                 if seconds:
                     duration_label += f' {seconds} second{"s" if seconds > 1 else ""}'
@@ -48,8 +49,8 @@ def handle_auth_end(event: Event):
                         bg='yellow')
 
         echo_result('Session',
-                    _status_color_map[state.status],
-                    state.status,
+                    status_color,
+                    status,
                     f'Session {session_id}',
                     '●')
 
@@ -57,8 +58,8 @@ def handle_auth_end(event: Event):
         feedback['access_expires_in_seconds'] = access_grant_duration_in_seconds
     else:
         echo_result('Session',
-                    _status_color_map[state.status],
-                    state.status,
+                    status_color,
+                    status,
                     f'Session {session_id}',
                     'x')
 
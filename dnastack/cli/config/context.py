@@ -1,6 +1,5 @@
 import click
 import logging
-import re
 from imagination import container
 from typing import Optional
 
@@ -97,8 +96,6 @@ def list_context_names(output: Optional[str] = None):
 
 @Service()
 class ContextCommandHandler:
-    _re_http_scheme = re.compile(r'^https?://')
-
     __emoji_map = {
         'add': '+',
         'update': '●',
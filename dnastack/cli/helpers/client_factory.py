@@ -1,4 +1,4 @@
-from typing import Optional, Type, List, Iterable
+from typing import Optional, Type, List, Iterable, Dict
 
 from imagination.decorator import service
 
@@ -61,6 +61,48 @@ class ConfigurationBasedClientFactory:
         context = self._get_context(context_name)
         return cls.make(self._get_endpoint(context, cls, endpoint_id), **kwargs)
 
+    def find(self,
+             cls: Type[SERVICE_CLIENT_CLASS],
+             endpoint_id: Optional[str] = None,
+             context_name: Optional[str] = None,
+             **kwargs) -> Optional[SERVICE_CLIENT_CLASS]:
+        """
+        Same as "get" but return None if the service endpoint cannot be resolved from the configuration.
+
+        Any error raised while instantiating the service client is not suppressed.
+        """
+        endpoint = self._find_endpoint(cls, endpoint_id, context_name)
+        return cls.make(endpoint, **kwargs) if endpoint else None
+
+    def has_endpoint(self,
+                     cls: Type[SERVICE_CLIENT_CLASS],
+                     endpoint_id: Optional[str] = None,
+                     context_name: Optional[str] = None) -> bool:
+        """ Check if the service endpoint for the given class can be resolved from the configuration """
+        return self._find_endpoint(cls, endpoint_id, context_name) is not None
+
+    def _find_endpoint(self,
+                       cls: Type[SERVICE_CLIENT_CLASS],
+                       endpoint_id: Optional[str],
+                       context_name: Optional[str]) -> Optional[ServiceEndpoint]:
+        context = self._find_context(context_name)
+        if context is None:
+            return None
+
+        endpoints = self._get_supported_endpoints(context, cls)
+        endpoint_id = endpoint_id or context.defaults.get(cls.get_adapter_type())
+        return endpoints.get(endpoint_id) if endpoint_id else None
+
+    def _find_context(self, context_name: Optional[str]) -> Optional[Context]:
+        config = self._config_manager.load()
+        context_name = context_name or config.current_context
+
+        # NOTE: The default context is always available as "_get_context" creates it on demand.
+        if context_name is None or (context_name not in config.contexts and context_name != DEFAULT_CONTEXT):
+            return None
+
+        return self._get_context(context_name)
+
     def _get_context(self, context_name: Optional[str]):
         config = self._config_manager.load()
         context_name = context_name or config.current_context
@@ -80,6 +122,15 @@ class ConfigurationBasedClientFactory:
 
         return config.contexts[context_name]
 
+    @staticmethod
+    def _get_supported_endpoints(context: Context, cls: Type[SERVICE_CLIENT_CLASS]) -> Dict[str, ServiceEndpoint]:
+        supported_service_types = cls.get_supported_service_types()
+        return {
+            endpoint.id: endpoint
+            for endpoint in context.endpoints
+            if endpoint.type in supported_service_types
+        }
+
     def _get_endpoint(self,
                       context: Context,
                       cls: Type[SERVICE_CLIENT_CLASS],
@@ -87,11 +138,7 @@ class ConfigurationBasedClientFactory:
         supported_service_types = cls.get_supported_service_types()
         supported_service_type_list_in_string = " or ".join([str(t) for t in supported_service_types])
 
-        endpoints = {
-            endpoint.id: endpoint
-            for endpoint in context.endpoints
-            if endpoint.type in supported_service_types
-        }
+        endpoints = self._get_supported_endpoints(context, cls)
 
         if not endpoints:
             self._logger.error(f'Unable to find endpoints of type {supported_service_types} from {len(context.endpoints)} registered endpoint(s)')
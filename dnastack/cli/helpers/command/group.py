@@ -1,4 +1,5 @@
-from typing import Optional
+from importlib import import_module
+from typing import Optional, Dict, List
 
 from click import Group, Command, Context, HelpFormatter
 
@@ -41,19 +42,66 @@ class AliasedGroup(Group):
         limit = formatter.width - 6 - max_len
 
         for sub_command in sub_commands:
-            cmd = self.get_command(ctx, sub_command)
-            if cmd is None:
-                continue
-            if hasattr(cmd, 'hidden') and cmd.hidden:
+            cmd_help = self._get_short_help(ctx, sub_command, limit)
+            if cmd_help is None:
                 continue
             if sub_command in self.sub_commands:
                 aliases = self.sub_commands[sub_command]
                 if len(aliases) > 0:
                     aliases = ",".join(sorted(aliases))
                     sub_command = "{0} ({1})".format(sub_command, aliases)
-            cmd_help = cmd.get_short_help_str(limit)
             rows.append((sub_command, cmd_help))
 
         if rows:
             with formatter.section('Commands'):
-                formatter.write_dl(rows)
\ No newline at end of file
+                formatter.write_dl(rows)
+
+    def _get_short_help(self, ctx: Context, cmd_name: str, limit: int) -> Optional[str]:
+        """ Get the short help of the sub-command or None if the sub-command is not listed """
+        cmd = self.get_command(ctx, cmd_name)
+        if cmd is None:
+            return None
+        if hasattr(cmd, 'hidden') and cmd.hidden:
+            return None
+        return cmd.get_short_help_str(limit)
+
+
+class LazyAliasedGroup(AliasedGroup):
+    """
+    An aliased group which only imports its sub-commands when they are requested
+
+    The sub-commands are declared as a map from the command name to the import path in the form of
+    "<module>:<attribute>". As the aliases of the lazy sub-commands are only known after the import, they have to be
+    declared upfront in order to resolve the command name without importing every sub-command.
+
+    Likewise, the help of the lazy sub-commands is declared upfront so that the help message of this group does not
+    import every sub-command. It is a map from the command name to the help of the sub-command, where None marks a
+    hidden sub-command. Any lazy sub-command without the declared help is imported to show its help.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.lazy_sub_commands: Dict[str, str] = kwargs.pop('lazy_sub_commands', {})
+        self.lazy_sub_command_help: Dict[str, Optional[str]] = kwargs.pop('lazy_sub_command_help', {})
+        self.lazy_sub_aliases: Dict[str, List[str]] = kwargs.pop('lazy_sub_aliases', {})
+        super(LazyAliasedGroup, self).__init__(*args, **kwargs)
+        for cmd_name, aliases in self.lazy_sub_aliases.items():
+            self.sub_commands[cmd_name] = aliases
+            for sub_alias in aliases:
+                self.sub_aliases[sub_alias] = cmd_name
+
+    def list_commands(self, ctx: Context) -> List[str]:
+        return sorted(set(super(LazyAliasedGroup, self).list_commands(ctx)) | set(self.lazy_sub_commands))
+
+    def get_command(self, ctx: Context, cmd_name: str) -> Optional[Command]:
+        cmd_name = self.resolve_alias(cmd_name)
+        if cmd_name not in self.commands and cmd_name in self.lazy_sub_commands:
+            module_name, attribute_name = self.lazy_sub_commands[cmd_name].split(':', 1)
+            self.add_command(getattr(import_module(module_name), attribute_name), cmd_name)
+        return super(LazyAliasedGroup, self).get_command(ctx, cmd_name)
+
+    def _get_short_help(self, ctx: Context, cmd_name: str, limit: int) -> Optional[str]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_sub_command_help:
+            cmd_help = self.lazy_sub_command_help[cmd_name]
+            # The declared help is rendered the same way as the help of the imported sub-command.
+            return Command(cmd_name, help=cmd_help).get_short_help_str(limit) if cmd_help is not None else None
+        return super(LazyAliasedGroup, self)._get_short_help(ctx, cmd_name, limit)
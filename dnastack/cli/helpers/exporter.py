@@ -1,5 +1,5 @@
 import csv
-from json import dumps
+from json import dumps, loads
 
 import csv
 import datetime
@@ -7,15 +7,35 @@ import io
 import yaml
 from decimal import Decimal
 from pydantic import BaseModel
-from typing import Any, List, Type, Optional
+from typing import Any, List, Type, Optional, Union
 
 from dnastack.client.result_iterator import ResultIterator
 
+try:
+    # The optional "orjson" package is used to decode JSON and to encode JSON for machine consumption whenever it is
+    # available.
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class ConversionError(RuntimeError):
     """ Raised when the data conversion fails """
 
 
+_DEFAULT_PROPERTY_WEIGHT = 99999
+_FIXED_PROPERTY_WEIGHTS = {
+    'id': 0,
+    'name': 2,
+    'slugName': 2,
+    'run_id': 1,
+}
+
+
+def _get_property_sort_key(property_name: Any):
+    return _FIXED_PROPERTY_WEIGHTS.get(property_name, _DEFAULT_PROPERTY_WEIGHT), f'{property_name}'
+
+
 def normalize(content: Any, map_decimal: Type = str, sort_keys: bool = True) -> Any:
     """
     Normalize the content for data export
@@ -28,20 +48,7 @@ def normalize(content: Any, map_decimal: Type = str, sort_keys: bool = True) ->
         return normalize(content.dict(), map_decimal=map_decimal)
     elif isinstance(content, dict):
         # Handle a dictionary
-        DEFAULT_WEIGHT = 99999
-        FIXED_WEIGHTS = {
-            'id': 0,
-            'name': 2,
-            'slugName': 2,
-            'run_id': 1,
-        }
-
-        properties = (
-            sorted(content.keys(),
-                   key=lambda k: f'{FIXED_WEIGHTS.get(k) if k in FIXED_WEIGHTS else DEFAULT_WEIGHT:0>8}//{k}')
-            if sort_keys
-            else list(content.keys())
-        )
+        properties = sorted(content.keys(), key=_get_property_sort_key) if sort_keys else list(content.keys())
 
         return {
             p_name: normalize(content[p_name], map_decimal=map_decimal)
@@ -65,6 +72,53 @@ def to_json(content: Any, indent: Optional[int] = 2):
         raise ConversionError(f'Failed to convert:\n\n{content}\n\nas JSON string')
 
 
+def to_json_bytes(content: Any, indent: Optional[int] = None) -> bytes:
+    """
+    Encode the content as UTF-8-encoded JSON for machine consumption
+
+    Unlike "to_json", the non-ASCII characters are not escaped and the compact output has no whitespace. The output is
+    the same whether the optional "orjson" package is available or not.
+    """
+    encoded_content = _to_json_with_orjson(content, indent)
+    if encoded_content is not None:
+        return encoded_content
+
+    try:
+        return dumps(content,
+                     indent=indent,
+                     ensure_ascii=False,
+                     separators=None if indent else (',', ':')).encode('utf-8')
+    except Exception:
+        raise ConversionError(f'Failed to convert:\n\n{content}\n\nas JSON string')
+
+
+def from_json(content: Union[str, bytes]) -> Any:
+    """
+    Decode the JSON content produced by this library, e.g., with "to_json_bytes"
+
+    Whatever orjson rejects, e.g., NaN, is decoded by the standard library. As orjson may still decode some content
+    differently, e.g., the integers beyond 64 bits, the user-supplied JSON is decoded with the standard library instead.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return loads(content)
+
+
+def _to_json_with_orjson(content: Any, indent: Optional[int]) -> Optional[bytes]:
+    # orjson only supports the two-space indentation.
+    if orjson is None or indent not in (None, 2):
+        return None
+
+    try:
+        return orjson.dumps(content, option=orjson.OPT_INDENT_2 if indent else 0)
+    except TypeError:
+        # Let the standard library handle (or reject) what orjson does not support, e.g., non-string keys.
+        return None
+
+
 def to_yaml(content: Any, indent: Optional[int] = 2):
     try:
         return yaml.dump(content, Dumper=yaml.SafeDumper, indent=indent)
@@ -2,14 +2,13 @@ from shutil import get_terminal_size
 import sys
 
 import csv
-from json import dumps as to_json_string
 
 import click
 from pydantic import BaseModel
 from typing import TypeVar, Any, Iterable, Optional, Callable
 from yaml import dump as to_yaml_string, SafeDumper
 
-from dnastack.cli.helpers.exporter import normalize
+from dnastack.cli.helpers.exporter import normalize, to_json
 from dnastack.feature_flags import in_interactive_shell, cli_show_list_item_index
 
 I = TypeVar('I')
@@ -142,15 +141,10 @@ class JsonIteratorPrinter(BaseIteratorPrinter):
 
             entry = transform(row) if transform else row
             normalized = normalize(entry, map_decimal=str if decimal_as == 'string' else float, sort_keys=sort_keys)
-            encoded = to_json_string(normalized, indent=2, sort_keys=False)
+            encoded = to_json(normalized, indent=2)
 
-            click.echo(
-                '\n'.join([
-                    f'  {line}'
-                    for line in encoded.split('\n')
-                ]),
-                nl=False
-            )
+            # Indent the whole item at once instead of splitting it into lines.
+            click.echo('  ' + encoded.replace('\n', '\n  '), nl=False)
 
             row_count += 1
 
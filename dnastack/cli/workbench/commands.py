@@ -1,13 +1,23 @@
 import click
 
-from dnastack.cli.workbench.runs_commands import runs_command_group
-from dnastack.cli.workbench.workflows_commands import workflows_command_group
+from dnastack.cli.helpers.command.group import LazyAliasedGroup
 
+# NOTE: The subcommands are only imported when they are invoked.
+_LAZY_SUBCOMMANDS = {
+    'runs': 'dnastack.cli.workbench.runs_commands:runs_command_group',
+    'workflows': 'dnastack.cli.workbench.workflows_commands:workflows_command_group',
+}
 
-@click.group('workbench')
-def workbench_command_group():
-    """ Interact with Workbench """
+# NOTE: The help of the subcommands is declared here so that the help message does not import every subcommand.
+_LAZY_SUBCOMMAND_HELP = {
+    'runs': 'Submit workflows for execution or interact with existing runs',
+    'workflows': 'Create and interact with workflows',
+}
 
 
-workbench_command_group.add_command(runs_command_group)
-workbench_command_group.add_command(workflows_command_group)
+@click.group('workbench',
+             cls=LazyAliasedGroup,
+             lazy_sub_commands=_LAZY_SUBCOMMANDS,
+             lazy_sub_command_help=_LAZY_SUBCOMMAND_HELP)
+def workbench_command_group():
+    """ Interact with Workbench """
@@ -170,7 +170,7 @@ def list_runs(context: Optional[str],
         search=search,
         tag=tags
     )
-    show_iterator(output_format=OutputFormat.JSON, iterator=client.list_runs(list_options, max_results))
+    show_iterator(output_format=OutputFormat.JSON, iterator=client.list_runs(list_options, max_results, prefetch=True))
 
 
 @command(runs_command_group,
@@ -590,7 +590,7 @@ def list_tasks(context: Optional[str],
     """
     client = get_ewes_client(context_name=context, endpoint_id=endpoint_id, namespace=namespace)
     list_options = TaskListOptions(page=page, page_size=page_size)
-    show_iterator(output_format=OutputFormat.JSON, iterator=client.list_tasks(run, list_options, max_results))
+    show_iterator(output_format=OutputFormat.JSON, iterator=client.list_tasks(run, list_options, max_results, prefetch=True))
 
 
 runs_command_group.add_command(tasks_command_group)
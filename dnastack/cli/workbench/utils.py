@@ -20,22 +20,22 @@ def get_ewes_client(context_name: Optional[str] = None,
                     endpoint_id: Optional[str] = None,
                     namespace: Optional[str] = None) -> EWesClient:
     factory: ConfigurationBasedClientFactory = container.get(ConfigurationBasedClientFactory)
-    try:
-        return factory.get(EWesClient, endpoint_id=endpoint_id, context_name=context_name, namespace=namespace)
-    except AssertionError:
+    client = factory.find(EWesClient, endpoint_id=endpoint_id, context_name=context_name, namespace=namespace)
+    if client is None:
         _populate_workbench_endpoint()
-        return factory.get(EWesClient, endpoint_id=endpoint_id, context_name=context_name, namespace=namespace)
+        client = factory.get(EWesClient, endpoint_id=endpoint_id, context_name=context_name, namespace=namespace)
+    return client
 
 
 def get_workflow_client(context_name: Optional[str] = None,
                         endpoint_id: Optional[str] = None,
                         namespace: Optional[str] = None) -> WorkflowClient:
     factory: ConfigurationBasedClientFactory = container.get(ConfigurationBasedClientFactory)
-    try:
-        return factory.get(WorkflowClient, endpoint_id=endpoint_id, context_name=context_name, namespace=namespace)
-    except AssertionError:
+    client = factory.find(WorkflowClient, endpoint_id=endpoint_id, context_name=context_name, namespace=namespace)
+    if client is None:
         _populate_workbench_endpoint()
-        return factory.get(WorkflowClient, endpoint_id=endpoint_id, context_name=context_name, namespace=namespace)
+        client = factory.get(WorkflowClient, endpoint_id=endpoint_id, context_name=context_name, namespace=namespace)
+    return client
 
 
 class UnableToMergeJsonError(RuntimeError):
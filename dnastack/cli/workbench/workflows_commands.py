@@ -7,7 +7,6 @@ from dnastack.cli.workbench.utils import get_workflow_client
 from dnastack.client.workbench.workflow.models import WorkflowCreate, WorkflowVersionCreate, WorkflowSource, \
     WorkflowListOptions, WorkflowVersionListOptions
 from dnastack.http.session import JsonPatch
-from dnastack.client.workbench.workflow.utils import WorkflowSourceLoader
 from dnastack.cli.helpers.command.decorator import command
 from dnastack.cli.helpers.command.spec import ArgumentSpec
 from dnastack.cli.helpers.exporter import to_json, normalize
@@ -153,7 +152,9 @@ def list_workflows(context: Optional[str],
         deleted=include_deleted
     )
     show_iterator(output_format=OutputFormat.JSON,
-                  iterator=workflows_client.list_workflows(list_options=list_options, max_results=max_results))
+                  iterator=workflows_client.list_workflows(list_options=list_options,
+                                                          max_results=max_results,
+                                                          prefetch=True))
 
 
 @command(workflows_command_group,
@@ -255,6 +256,9 @@ def create_workflow(context: Optional[str],
     docs: https://docs.omics.ai/docs/workflows-create
     """
 
+    # NOTE: The source loader is only needed to create workflows and versions, so it is imported on demand.
+    from dnastack.client.workbench.workflow.utils import WorkflowSourceLoader
+
     workflows_client = get_workflow_client(context, endpoint_id, namespace)
     workflow_source = WorkflowSourceLoader(source_files)
 
@@ -421,7 +425,8 @@ def list_versions(context: Optional[str],
     show_iterator(output_format=OutputFormat.JSON,
                   iterator=workflows_client.list_workflow_versions(workflow_id=workflow,
                                                                    list_options=list_options,
-                                                                   max_results=max_results))
+                                                                   max_results=max_results,
+                                                                   prefetch=True))
 
 
 @command(workflow_versions_command_group,
@@ -571,6 +576,9 @@ def add_version(context: Optional[str],
 
     docs: https://docs.omics.ai/docs/workflows-versions-create
     """
+    # NOTE: The source loader is only needed to create workflows and versions, so it is imported on demand.
+    from dnastack.client.workbench.workflow.utils import WorkflowSourceLoader
+
     workflows_client = get_workflow_client(context, endpoint_id, namespace)
     workflow_source = WorkflowSourceLoader(source_files)
 
@@ -360,10 +360,12 @@ class QueryLoader(PaginableResultLoader):
     def __init__(self,
                  initial_url: str,
                  query: Optional[str] = None,
-                 http_session: Optional[HttpSession] = None):
+                 http_session: Optional[HttpSession] = None,
+                 parameters: Optional[List[Any]] = None):
         super(QueryLoader, self).__init__(initial_url=initial_url, http_session=http_session)
 
         self.__query = query
+        self.__parameters = parameters
         self.__schema: Dict[str, Any] = dict()
 
     def load(self) -> List[Dict[str, Any]]:
@@ -377,8 +379,11 @@ class QueryLoader(PaginableResultLoader):
                     if self.__query:
                         # Send a search request
                         self.logger.debug(f'Initial Page: QUERY: {self._initial_url}: {self.__query}')
+                        request_body = dict(query=self.__query)
+                        if self.__parameters:
+                            request_body['parameters'] = self.__parameters
                         try:
-                            response = session.post(self._initial_url, json=dict(query=self.__query))
+                            response = session.post(self._initial_url, json=request_body)
                         except ClientError as e:
                             if e.response.status_code == 400:
                                 feedback = e.response.text
@@ -570,11 +575,18 @@ class DataConnectClient(BaseServiceClient):
             DATA_CONNECT_TYPE_V1_0,
         ]
 
-    def query(self, query: str, no_auth: bool = False) -> Iterator[Dict[str, Any]]:
-        """ Run an SQL query """
+    def query(self,
+              query: str,
+              no_auth: bool = False,
+              parameters: Optional[List[Any]] = None) -> Iterator[Dict[str, Any]]:
+        """ Run an SQL query
+
+            The values of the positional placeholders (`?`) in the query can be given as `parameters`.
+        """
         return ResultIterator(QueryLoader(http_session=self.create_http_session(no_auth=no_auth),
                                           initial_url=urljoin(self.url, r'search'),
-                                          query=query))
+                                          query=query,
+                                          parameters=parameters))
 
     def iterate_tables(self, no_auth: bool = False) -> Iterator[TableInfo]:
         """ Iterate the list of tables """
@@ -1,6 +1,7 @@
 from logging import Logger
 
 from abc import ABC
+from concurrent.futures import Future, ThreadPoolExecutor
 from threading import Lock
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
@@ -16,6 +17,11 @@ class ResultLoader(ABC):
     __uuid__: Optional[str] = None
     __logger__: Optional[Logger] = None
 
+    # When enabled, the iterator may load the next page in the background while the current page is being consumed,
+    # if the caller asks for it. This is only safe for the loaders whose "load" method has no side effect other than
+    # advancing to the next page.
+    prefetchable: bool = False
+
     @property
     def uuid(self):
         if not self.__uuid__:
@@ -36,11 +42,20 @@ class ResultLoader(ABC):
 
 
 class ResultIterator:
-    def __init__(self, loader: ResultLoader):
+    def __init__(self, loader: ResultLoader, prefetch: bool = False):
+        """
+        :param loader: The result loader
+        :param prefetch: Load the next page in the background while the current page is being consumed. This only
+                         applies to a prefetchable loader and only pays off when the caller consumes every page, as
+                         the next page is requested whether it is needed or not.
+        """
         self.__read_lock = Lock()
         self.__loader = loader
         self.__buffer: List[Dict[str, Any]] = []
         self.__depleted = False
+        self.__prefetch = prefetch and loader.prefetchable
+        self.__prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self.__next_page: Optional[Future] = None
 
     def __iter__(self):
         return self
@@ -53,9 +68,11 @@ class ResultIterator:
             while not self.__buffer:
                 # Refill the buffer
                 if not self.__buffer and not self.__depleted:
-                    if self.__loader.has_more():
+                    # NOTE: While the next page is being prefetched, the state of the loader is not checked as it is
+                    #       being changed by the background thread.
+                    if self.__next_page or self.__loader.has_more():
                         try:
-                            self.__buffer.extend(self.__loader.load())
+                            self.__buffer.extend(self.__load())
                         except StopIteration as e:
                             self.__depleted = True
                             raise e
@@ -67,3 +84,36 @@ class ResultIterator:
             item = self.__buffer.pop(0)
 
         return item
+
+    def __load(self) -> List[Any]:
+        if self.__next_page:
+            next_page, self.__next_page = self.__next_page, None
+            items = next_page.result()
+        else:
+            items = self.__loader.load()
+
+        if self.__prefetch and self.__loader.has_more():
+            if not self.__prefetch_executor:
+                self.__prefetch_executor = ThreadPoolExecutor(max_workers=1)
+            self.__next_page = self.__prefetch_executor.submit(self.__loader.load)
+        else:
+            self.__shut_down_prefetch()
+
+        return items
+
+    def close(self):
+        """ Stop the iteration and discard the page being prefetched, if any """
+        self.__depleted = True
+        self.__buffer.clear()
+        self.__shut_down_prefetch()
+
+    def __shut_down_prefetch(self):
+        self.__next_page = None
+        if self.__prefetch_executor:
+            # NOTE: A request already in flight cannot be interrupted. Its result is discarded and the thread exits
+            #       as soon as the request is done.
+            self.__prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self.__prefetch_executor = None
+
+    def __del__(self):
+        self.__shut_down_prefetch()
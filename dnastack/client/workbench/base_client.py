@@ -1,6 +1,9 @@
 from abc import ABC
+from collections import deque
+import logging
 from pprint import pformat
-from typing import Optional, List
+from threading import Lock, local
+from typing import Optional, List, Deque
 
 from pydantic import ValidationError
 from requests import Response
@@ -15,6 +18,9 @@ from dnastack.http.authenticators.factory import HttpAuthenticatorFactory
 from dnastack.http.authenticators.oauth2 import OAuth2Authenticator
 from dnastack.http.session import HttpSession, HttpError, ServerError
 
+# Only the most recently visited URLs are kept to be reported with the error.
+_MAX_VISITED_URLS = 128
+
 
 class ApiError(Exception):
     def __init__(self, message, status_code, text):
@@ -49,10 +55,43 @@ class BaseWorkbenchClient(BaseServiceClient, ABC):
 
         self._logger.debug(f"Authenticated workbench services for namespace {self.__namespace}")
 
+        # Each thread keeps its own HTTP session between requests to reuse the connections. The sessions are not shared
+        # across threads.
+        self._thread_local = local()
+        self._http_sessions: List[HttpSession] = []
+        self._http_sessions_lock = Lock()
+
     @property
     def namespace(self):
         return self.__namespace
 
+    def close(self):
+        super().close()
+        if not hasattr(self, '_http_sessions_lock'):
+            return
+        with self._http_sessions_lock:
+            http_sessions = self._http_sessions
+            self._http_sessions = []
+            self._thread_local = local()
+        for http_session in http_sessions:
+            http_session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _get_http_session(self) -> HttpSession:
+        """ Get the HTTP session of the current thread, which is kept until the client is closed """
+        http_session = getattr(self._thread_local, 'http_session', None)
+        if http_session is None:
+            http_session = self.create_http_session()
+            with self._http_sessions_lock:
+                self._thread_local.http_session = http_session
+                self._http_sessions.append(http_session)
+        return http_session
+
     @classmethod
     def __extract_namespace_from_auth(cls, endpoint: ServiceEndpoint) -> str:
         for authenticator in HttpAuthenticatorFactory.create_multiple_from(endpoint=endpoint):
@@ -63,6 +102,8 @@ class BaseWorkbenchClient(BaseServiceClient, ABC):
 
 
 class WorkbenchResultLoader(ResultLoader):
+    prefetchable = True
+
     def __init__(self,
                  service_url: str,
                  http_session: HttpSession,
@@ -75,7 +116,7 @@ class WorkbenchResultLoader(ResultLoader):
         self.__max_results = int(max_results) if max_results else None
         self.__loaded_results = 0
         self.__active = True
-        self.__visited_urls: List[str] = list()
+        self.__visited_urls: Deque[str] = deque(maxlen=_MAX_VISITED_URLS)
         self.__trace = trace
 
         if not self.__list_options:
@@ -122,7 +163,7 @@ class WorkbenchResultLoader(ResultLoader):
                         f'Unexpected error: {response_text}',
                         status_code,
                         response_text,
-                        urls=self.__visited_urls
+                        urls=list(self.__visited_urls)
                     )
 
             status_code = response.status_code
@@ -136,7 +177,7 @@ class WorkbenchResultLoader(ResultLoader):
                     f'Unable to deserialize JSON from {response_text}.',
                     status_code,
                     response_text,
-                    urls=self.__visited_urls
+                    urls=list(self.__visited_urls)
                 )
 
             try:
@@ -146,10 +187,11 @@ class WorkbenchResultLoader(ResultLoader):
                     f'Invalid Response Body: {response_body}',
                     status_code,
                     response_text,
-                    urls=self.__visited_urls
+                    urls=list(self.__visited_urls)
                 )
 
-            self.logger.debug(f'Response:\n{pformat(response_body, indent=2)}')
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f'Response:\n{pformat(response_body, indent=2)}')
 
             self.__list_options.page_token = api_response.next_page_token or None
             if not self.__list_options.page_token:
@@ -97,15 +97,16 @@ class EWesClient(BaseWorkbenchClient):
 
     def get_service_info(self, trace: Optional[Span] = None) -> WesServiceInfo:
         trace = trace or Span(origin=self)
-        with self.create_http_session() as session:
-            response = session.get(urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/service-info'),
-                                   trace_context=trace)
-            return WesServiceInfo(**response.json())
+        session = self._get_http_session()
+        response = session.get(urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/service-info'),
+                               trace_context=trace)
+        return WesServiceInfo(**response.json())
 
     def list_runs(self,
                   list_options: Optional[ExtendedRunListOptions] = None,
                   max_results: int = None,
-                  trace: Optional[Span] = None) -> Iterator[ExtendedRunStatus]:
+                  trace: Optional[Span] = None,
+                  prefetch: bool = False) -> Iterator[ExtendedRunStatus]:
         trace = trace or Span(origin=self)
         return ResultIterator(ExtendedRunListResultLoader(
             service_url=urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/runs'),
@@ -113,58 +114,58 @@ class EWesClient(BaseWorkbenchClient):
             list_options=list_options,
             max_results=max_results,
             trace=trace,
-        ))
+        ), prefetch=prefetch)
 
     def get_status(self, run_id: str, trace: Optional[Span] = None) -> MinimalExtendedRun:
         trace = trace or Span(origin=self)
-        with self.create_http_session() as session:
-            response = session.get(urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/runs/{run_id}/status'),
-                                   trace_context=trace)
-            return MinimalExtendedRun(**response.json())
+        session = self._get_http_session()
+        response = session.get(urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/runs/{run_id}/status'),
+                               trace_context=trace)
+        return MinimalExtendedRun(**response.json())
 
     def get_run(self, run_id: str, include_tasks: bool = False, trace: Optional[Span] = None) -> ExtendedRun:
         trace = trace or Span(origin=self)
-        with self.create_http_session() as session:
-            response = session.get(urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/runs/{run_id}'
-                                                              f'?exclude_tasks={not include_tasks}'),
-                                   trace_context=trace)
-            return ExtendedRun(**response.json())
+        session = self._get_http_session()
+        response = session.get(urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/runs/{run_id}'
+                                                          f'?exclude_tasks={not include_tasks}'),
+                               trace_context=trace)
+        return ExtendedRun(**response.json())
 
     def cancel_run(self, run_id: str, trace: Optional[Span] = None) -> Union[RunId, WorkbenchApiError]:
-        with self.create_http_session() as session:
-            response = session.post(urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/runs/{run_id}/cancel'),
-                                    trace_context=trace)
-            return RunId(**response.json())
+        session = self._get_http_session()
+        response = session.post(urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/runs/{run_id}/cancel'),
+                                trace_context=trace)
+        return RunId(**response.json())
 
     def cancel_runs(self, run_ids: List[str], trace: Optional[Span] = None) -> BatchActionResult:
         trace = trace or Span(origin=self)
-        with self.create_http_session() as session:
-            response = session.post(urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/runs/cancel'),
-                                    json=run_ids,
-                                    trace_context=trace)
-            return BatchActionResult(**response.json())
+        session = self._get_http_session()
+        response = session.post(urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/runs/cancel'),
+                                json=run_ids,
+                                trace_context=trace)
+        return BatchActionResult(**response.json())
 
     def delete_runs(self, run_ids: List[str], trace: Optional[Span] = None) -> BatchActionResult:
         trace = trace or Span(origin=self)
-        with self.create_http_session() as session:
-            response = session.post(urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/runs/delete'),
-                                    json=run_ids,
-                                    trace_context=trace)
-            return BatchActionResult(**response.json())
+        session = self._get_http_session()
+        response = session.post(urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/runs/delete'),
+                                json=run_ids,
+                                trace_context=trace)
+        return BatchActionResult(**response.json())
 
     def submit_run(self, data: ExtendedRunRequest, trace: Optional[Span] = None) -> MinimalExtendedRun:
         trace = trace or Span(origin=self)
-        with self.create_http_session() as session:
-            response = session.post(urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/runs'),
-                                    json=data.dict(),
-                                    trace_context=trace)
+        session = self._get_http_session()
+        response = session.post(urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/runs'),
+                                json=data.dict(),
+                                trace_context=trace)
         return MinimalExtendedRun(**response.json())
 
     def submit_batch(self, data: BatchRunRequest, trace: Optional[Span] = None) -> BatchRunResponse:
-        with self.create_http_session() as session:
-            response = session.post(urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/batch'),
-                                    json=data.dict(),
-                                    trace_context=trace)
+        session = self._get_http_session()
+        response = session.post(urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/batch'),
+                                json=data.dict(),
+                                trace_context=trace)
         return BatchRunResponse(**response.json())
 
     def stream_run_logs(self,
@@ -208,22 +209,23 @@ class EWesClient(BaseWorkbenchClient):
         if offset:
             params['offset'] = offset
 
-        with self.create_http_session() as session:
-            with session.get(urljoin(self.endpoint.url, log_url),
-                             params=params,
-                             stream=True,
-                             trace_context=trace) as response:
-                if int(response.headers['Content-Length']) == 0:
-                    yield None
-                    return
-                for chunk in response.iter_content(chunk_size=None):
-                    yield chunk
+        session = self._get_http_session()
+        with session.get(urljoin(self.endpoint.url, log_url),
+                         params=params,
+                         stream=True,
+                         trace_context=trace) as response:
+            if int(response.headers['Content-Length']) == 0:
+                yield None
+                return
+            for chunk in response.iter_content(chunk_size=None):
+                yield chunk
 
     def list_tasks(self,
                    run_id: str,
                    list_options: Optional[TaskListOptions] = None,
                    max_results: int = None,
-                   trace: Optional[Span] = None) -> Iterator[Log]:
+                   trace: Optional[Span] = None,
+                   prefetch: bool = False) -> Iterator[Log]:
         trace = trace or Span(origin=self)
         return ResultIterator(TaskListResultLoader(
             service_url=urljoin(self.endpoint.url, f'{self.namespace}/ga4gh/wes/v1/runs/{run_id}/tasks'),
@@ -231,12 +233,13 @@ class EWesClient(BaseWorkbenchClient):
             list_options=list_options,
             max_results=max_results,
             trace=trace,
-        ))
+        ), prefetch=prefetch)
 
     def list_engines(self,
                      list_options: ExecutionEngineListOptions,
                      max_results: int = None,
-                     trace: Optional[Span] = None) -> Iterable[ExecutionEngine]:
+                     trace: Optional[Span] = None,
+                     prefetch: bool = False) -> Iterable[ExecutionEngine]:
         trace = trace or Span(origin=self)
         return ResultIterator(EngineListResultLoader(
             service_url=urljoin(self.endpoint.url, f'{self.namespace}/engines'),
@@ -244,12 +247,12 @@ class EWesClient(BaseWorkbenchClient):
             list_options=list_options,
             max_results=max_results,
             trace=trace,
-        ))
+        ), prefetch=prefetch)
 
     def get_engine(self,
                    engine_id: str,
                    trace: Optional[Span] = None) -> ExecutionEngine:
-        with self.create_http_session() as session:
-            response = session.get(urljoin(self.endpoint.url, f'{self.namespace}/engines/{engine_id}'),
-                                   trace_context=trace)
-            return ExecutionEngine(**response.json())
+        session = self._get_http_session()
+        response = session.get(urljoin(self.endpoint.url, f'{self.namespace}/engines/{engine_id}'),
+                               trace_context=trace)
+        return ExecutionEngine(**response.json())
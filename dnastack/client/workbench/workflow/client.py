@@ -75,96 +75,98 @@ class WorkflowClient(BaseWorkbenchClient):
 
     def get_json_schema(self, workflow_id: str, version_id: str) -> WorkflowDescriptor:
         print(workflow_id,version_id)
-        with self.create_http_session() as session:
-            response = session.get(
-                urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}/versions/{version_id}/describe'))
+        session = self._get_http_session()
+        response = session.get(
+            urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}/versions/{version_id}/describe'))
         return WorkflowDescriptor(**response.json())
 
     def list_workflows(self,
                        list_options: Optional[WorkflowListOptions] = None,
-                       max_results: int = None) -> Iterator[Workflow]:
+                       max_results: int = None,
+                       prefetch: bool = False) -> Iterator[Workflow]:
         return ResultIterator(WorkflowsListResultLoader(
             service_url=urljoin(self.endpoint.url, f'{self.namespace}/workflows'),
             http_session=self.create_http_session(),
             list_options=list_options,
             max_results=max_results,
             trace=None
-        ))
+        ), prefetch=prefetch)
 
     def list_workflow_versions(self,
                                workflow_id: str,
                                list_options: Optional[WorkflowVersionListOptions] = None,
-                               max_results: int = None) -> Iterator[WorkflowVersion]:
+                               max_results: int = None,
+                               prefetch: bool = False) -> Iterator[WorkflowVersion]:
         return ResultIterator(WorkflowVersionsListResultLoader(
             service_url=urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}/versions'),
             http_session=self.create_http_session(),
             list_options=list_options,
             trace=None,
-            max_results=max_results))
+            max_results=max_results), prefetch=prefetch)
 
     def get_workflow(self, workflow_id: str, include_deleted: Optional[bool] = False) -> Workflow:
-        with self.create_http_session() as session:
-            response = session.get(
-                urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}?deleted={include_deleted}'))
-            workflow = Workflow(**response.json())
-            workflow.etag = response.headers.get("Etag").strip("\"")
-            return workflow
+        session = self._get_http_session()
+        response = session.get(
+            urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}?deleted={include_deleted}'))
+        workflow = Workflow(**response.json())
+        workflow.etag = response.headers.get("Etag").strip("\"")
+        return workflow
 
     def get_workflow_version(self, workflow_id: str, version_id: str,
                              include_deleted: Optional[bool] = False) -> WorkflowVersion:
-        with self.create_http_session() as session:
-            response = session.get(
-                urljoin(self.endpoint.url,
-                        f'{self.namespace}/workflows/{workflow_id}/versions/{version_id}?deleted={include_deleted}'))
-            workflow_version = WorkflowVersion(**response.json())
-            workflow_version.etag = response.headers.get("Etag").strip("\"")
-            return workflow_version
+        session = self._get_http_session()
+        response = session.get(
+            urljoin(self.endpoint.url,
+                    f'{self.namespace}/workflows/{workflow_id}/versions/{version_id}?deleted={include_deleted}'))
+        workflow_version = WorkflowVersion(**response.json())
+        workflow_version.etag = response.headers.get("Etag").strip("\"")
+        return workflow_version
 
     def create_workflow(self, workflow_create_request: WorkflowCreate) -> Workflow:
-        with self.create_http_session() as session:
-            response = session.post(
-                urljoin(self.endpoint.url, f'{self.namespace}/workflows'), json=workflow_create_request.dict())
+        session = self._get_http_session()
+        response = session.post(
+            urljoin(self.endpoint.url, f'{self.namespace}/workflows'), json=workflow_create_request.dict())
         return Workflow(**response.json())
 
     def create_version(self, workflow_id: str,
                        workflow_version_create_request: WorkflowVersionCreate) -> WorkflowVersion:
-        with self.create_http_session() as session:
-            response = session.post(
-                urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}/versions'),
-                json=workflow_version_create_request.dict())
+        session = self._get_http_session()
+        response = session.post(
+            urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}/versions'),
+            json=workflow_version_create_request.dict())
         return WorkflowVersion(**response.json())
 
     def delete_workflow(self, workflow_id: str, etag: str):
-        with self.create_http_session() as session:
-            session.delete(
-                urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}'),
-                headers={'If-Match': etag}
-            )
+        session = self._get_http_session()
+        session.delete(
+            urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}'),
+            headers={'If-Match': etag}
+        )
 
     def delete_workflow_version(self, workflow_id: str, version_id: str, etag: str):
-        with self.create_http_session() as session:
-            session.delete(
-                urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}/versions/{version_id}'),
-                headers={'If-Match': etag}
-            )
+        session = self._get_http_session()
+        session.delete(
+            urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}/versions/{version_id}'),
+            headers={'If-Match': etag}
+        )
 
     def update_workflow(self, workflow_id: str, etag: str, updates: List[JsonPatch]) -> Workflow:
-        with self.create_http_session() as session:
-            updates = [update.dict() for update in updates]
-            response = session.json_patch(
-                urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}'),
-                headers={'If-Match': etag},
-                json=updates
-            )
-            return Workflow(**response.json())
+        session = self._get_http_session()
+        updates = [update.dict() for update in updates]
+        response = session.json_patch(
+            urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}'),
+            headers={'If-Match': etag},
+            json=updates
+        )
+        return Workflow(**response.json())
 
     def update_workflow_version(self, workflow_id: str, version_id: str, etag: str,
                                 updates: List[JsonPatch]) -> WorkflowVersion:
-        with self.create_http_session() as session:
-            updates = [update.dict() for update in updates]
-            response = session.json_patch(
-                urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}/versions/{version_id}'),
-                headers={'If-Match': etag},
-                json=updates
-            )
-            return WorkflowVersion(**response.json())
+        session = self._get_http_session()
+        updates = [update.dict() for update in updates]
+        response = session.json_patch(
+            urljoin(self.endpoint.url, f'{self.namespace}/workflows/{workflow_id}/versions/{version_id}'),
+            headers={'If-Match': etag},
+            json=updates
+        )
+        return WorkflowVersion(**response.json())
@@ -4,6 +4,9 @@ from typing import Any, Dict, List
 
 from dnastack.common.logger import get_logger
 
+_LINE_BREAK_PATTERN = re.compile(r'\r\n|\r|\n')
+_ARRAY_INDEX_PATTERN = re.compile(r'\[.*?\]')
+
 
 class DotPropertiesSyntaxError(RuntimeError):
     def __init__(self, given_path):
@@ -29,7 +32,7 @@ class DotPropertiesParser:
     def parse(self, content: str) -> Dict[str, Any]:
         data: Dict[str, Any] = dict()
 
-        for line in re.split(r'\r\n|\r|\n', content):
+        for line in _LINE_BREAK_PATTERN.split(content):
             truncated_line = line.strip()
 
             if not truncated_line:
@@ -69,8 +72,8 @@ class DotPropertiesParser:
             last_depth = max_depth - 1
             for depth in range(max_depth):
                 p_name = path[depth]
-                is_array = re.search(r'\[.*?\]', p_name)
-                p_name_without_array = re.sub(r'\[.*?\]', '', p_name)
+                is_array = _ARRAY_INDEX_PATTERN.search(p_name)
+                p_name_without_array = _ARRAY_INDEX_PATTERN.sub('', p_name) if is_array else p_name
                 if depth == last_depth:
                     # The end of the path
                     if p_name in node:
@@ -1,5 +1,6 @@
 import os
 import shutil
+from typing import Optional, Tuple
 
 import yaml
 from imagination.decorator import service, EnvironmentVariable
@@ -31,11 +32,14 @@ class ConfigurationManager:
         self.__logger = get_logger(f'{type(self).__name__}')
         self.__file_path = file_path
         self.__swap_file_path = f'{self.__file_path}.swp'
+        # The last loaded configuration with the modification time and size of the file when it was loaded
+        self.__cached_configuration: Optional[Tuple[Tuple[int, int], Configuration]] = None
 
     def hard_reset(self):
         if os.path.exists(self.__file_path):
             self.__logger.warning('Resetting the configuration')
             os.unlink(self.__file_path)
+            self.__cached_configuration = None
             self.__logger.warning('Successfully reset the configuration')
         else:
             self.__logger.warning('No configuration to reset')
@@ -49,16 +53,33 @@ class ConfigurationManager:
 
     def load(self) -> Configuration:
         """ Load the configuration object """
+        # NOTE: The configuration is loaded many times while handling a single command. The file is only parsed again
+        #       when it has been changed since the last time. Every caller gets its own copy as it may modify it.
+        file_signature = self.__get_file_signature()
+        if file_signature and self.__cached_configuration and self.__cached_configuration[0] == file_signature:
+            return self.__cached_configuration[1].copy(deep=True)
+
         self.__logger.debug(f'Reading the configuration from {self.__file_path}...')
         raw_config = self.load_raw()
         if not raw_config:
             return Configuration()
         try:
-            config = Configuration(**yaml.load(raw_config, Loader=yaml.SafeLoader))
-            return self.migrate(config)
+            config = self.migrate(Configuration(**yaml.load(raw_config, Loader=yaml.SafeLoader)))
         except ValidationError as e:
             raise InvalidExistingConfigurationError(f'The existing configuration file at {self.__file_path} is invalid.') from e
 
+        if file_signature:
+            self.__cached_configuration = (file_signature, config.copy(deep=True))
+
+        return config
+
+    def __get_file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.__file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def save(self, configuration: Configuration):
         """ Save the configuration object """
         # Note (1): This is designed to have file operation done as quickly as possible to reduce race conditions.
@@ -87,6 +108,7 @@ class ConfigurationManager:
             f.write(new_content)
         shutil.copyfile(self.__swap_file_path, self.__file_path)
         os.unlink(self.__swap_file_path)
+        self.__cached_configuration = None
 
     @classmethod
     def migrate(cls, configuration: Configuration) -> Configuration:
@@ -0,0 +1,257 @@
+import threading
+from datetime import datetime
+from typing import List, Optional
+from unittest import TestCase, skipUnless
+from unittest.mock import MagicMock
+
+from dnastack.alpha.app.explorer import _SearchOperation, Collection, ItemType, SimplifiedBlobMetadata
+from dnastack.client.collections.model import Collection as CollectionModel
+
+try:
+    import pandas
+    from pandas.testing import assert_frame_equal
+except ImportError:
+    pandas = None
+
+
+class TestSearchOperation(TestCase):
+    @staticmethod
+    def _create_search_operation(rows):
+        dc = MagicMock()
+        dc.query.return_value = iter(rows)
+        return _SearchOperation(dc, False, 'SELECT * FROM collections.sample.table')
+
+    def test_to_list(self):
+        rows = [dict(id=1), dict(id=2)]
+        self.assertEqual(rows, self._create_search_operation(rows).to_list())
+
+    @skipUnless(pandas, 'pandas is not installed')
+    def test_to_data_frame_with_heterogeneous_rows(self):
+        rows = [
+            dict(id=1, name='alpha'),
+            dict(id=2, size=20),
+            dict(name='charlie', id=3),
+        ]
+
+        df = self._create_search_operation(rows).to_data_frame()
+
+        # Same as with a list of dictionaries, the columns are the union of the keys in the order of first appearance.
+        self.assertEqual(['id', 'name', 'size'], list(df.columns))
+        assert_frame_equal(pandas.DataFrame(rows), df)
+
+    @skipUnless(pandas, 'pandas is not installed')
+    def test_to_data_frame_without_rows(self):
+        self.assertTrue(self._create_search_operation([]).to_data_frame().empty)
+
+
+def _create_blob_row(index: int) -> dict:
+    return dict(id=f'blob-{index}',
+                name=f'blob-{index}.txt',
+                type='blob',
+                size=index,
+                size_unit='bytes',
+                item_updated_time=datetime(2022, 1, 1).isoformat())
+
+
+class TestCollection(TestCase):
+    def setUp(self):
+        self.dc = MagicMock()
+        self.drs = MagicMock()
+
+        factory = MagicMock()
+        factory.get_one_of.return_value = self.drs
+
+        self.collection = Collection(factory,
+                                     MagicMock(),
+                                     CollectionModel(name='Sample',
+                                                     slugName='sample',
+                                                     itemsQuery=' SELECT * FROM collections.sample._files ',
+                                                     createdAt=datetime(2022, 1, 1)),
+                                     no_auth=False)
+        self.collection._dc = self.dc
+
+    def _respond_with(self, row_count: int):
+        self.dc.query.side_effect = lambda *args, **kwargs: iter([_create_blob_row(i) for i in range(row_count)])
+
+    def _list_items(self, limit: int, **kwargs) -> List[SimplifiedBlobMetadata]:
+        self.has_more_row_count: Optional[int] = None
+
+        def on_has_more_result(row_count: int):
+            self.has_more_row_count = row_count
+
+        return self.collection.list_items(limit=limit, on_has_more_result=on_has_more_result, **kwargs)
+
+    def test_list_items_returns_at_most_limit_items(self):
+        # The service returns the extra row that indicates more results.
+        self._respond_with(3)
+
+        items = self._list_items(2)
+
+        self.assertEqual(['blob-0', 'blob-1'], [item.id for item in items])
+        self.assertEqual(3, self.has_more_row_count)
+        self.dc.query.assert_called_once_with('SELECT * FROM (SELECT * FROM collections.sample._files) LIMIT 3',
+                                              no_auth=False,
+                                              parameters=None)
+
+    def test_list_items_with_limit_of_one(self):
+        self._respond_with(2)
+
+        items = self._list_items(1)
+
+        self.assertEqual(['blob-0'], [item.id for item in items])
+        self.assertEqual(2, self.has_more_row_count)
+        self.assertTrue(self.dc.query.call_args.args[0].endswith(' LIMIT 2'))
+
+    def test_list_items_without_more_results(self):
+        self._respond_with(2)
+
+        self.assertEqual(2, len(self._list_items(5)))
+        self.assertIsNone(self.has_more_row_count)
+
+    def test_list_items_without_limit(self):
+        self._respond_with(20)
+
+        self.assertEqual(20, len(self._list_items(0)))
+        self.assertIsNone(self.has_more_row_count)
+        self.assertNotIn('LIMIT', self.dc.query.call_args.args[0])
+
+    def test_list_items_binds_item_types_as_parameters(self):
+        self._respond_with(1)
+
+        self._list_items(0, kind=ItemType.BLOB, kinds=[ItemType.TABLE])
+
+        self.dc.query.assert_called_once_with(
+            'SELECT * FROM (SELECT * FROM collections.sample._files) WHERE type IN (?, ?)',
+            no_auth=False,
+            parameters=['blob', 'table']
+        )
+
+    def test_iter_items_rejects_negative_limit_on_call(self):
+        with self.assertRaises(AssertionError):
+            self.collection.iter_items(limit=-1)
+
+        self.dc.query.assert_not_called()
+
+    def test_iter_items_loads_on_iteration(self):
+        self._respond_with(3)
+
+        items = self.collection.iter_items(limit=0)
+        self.dc.query.assert_not_called()
+
+        self.assertEqual(['blob-0', 'blob-1', 'blob-2'], [item.id for item in items])
+
+
+def _resolve_all_but_second_blob(blob_id: str) -> str:
+    if blob_id == 'blob-2':
+        raise RuntimeError(f'Unable to resolve {blob_id}')
+    return f'resolved:{blob_id}'
+
+
+class TestCollectionBlobs(TestCase):
+    def setUp(self):
+        self.dc = MagicMock()
+        self.drs = MagicMock()
+        self.drs.get_blob.side_effect = lambda blob_id: f'resolved:{blob_id}'
+
+        factory = MagicMock()
+        factory.get_one_of.return_value = self.drs
+
+        self.collection = Collection(factory,
+                                     MagicMock(),
+                                     CollectionModel(name='Sample',
+                                                     slugName='sample-data',
+                                                     itemsQuery='SELECT * FROM collections.sample_data._files',
+                                                     createdAt=datetime(2022, 1, 1)),
+                                     no_auth=False)
+        self.collection._dc = self.dc
+
+    def _respond_with(self, rows: List[dict]):
+        self.dc.query.side_effect = lambda *args, **kwargs: iter(rows)
+
+    def test_blobs_by_ids_binds_ids_as_parameters(self):
+        self._respond_with([dict(id='blob-1', name='a.txt'), dict(id='blob-2', name='b.txt')])
+
+        blobs = self.collection.blobs(ids=['blob-1', 'blob-2', 'blob-3'])
+
+        self.assertEqual({'blob-1': 'resolved:blob-1', 'blob-2': 'resolved:blob-2'}, blobs)
+        self.dc.query.assert_called_once_with(
+            'SELECT id, name FROM (SELECT * FROM collections.sample_data._files) WHERE id IN (?, ?, ?)',
+            no_auth=False,
+            parameters=['blob-1', 'blob-2', 'blob-3']
+        )
+
+    def test_blobs_by_names_binds_names_as_parameters(self):
+        self._respond_with([dict(id='blob-1', name="it's.txt")])
+
+        blobs = self.collection.blobs(names=["it's.txt"])
+
+        self.assertEqual({"it's.txt": 'resolved:blob-1'}, blobs)
+        self.dc.query.assert_called_once_with(
+            'SELECT id, name FROM (SELECT * FROM collections.sample_data._files) WHERE name IN (?)',
+            no_auth=False,
+            parameters=["it's.txt"]
+        )
+
+    def test_blobs_without_matches(self):
+        self._respond_with([])
+
+        self.assertEqual(dict(), self.collection.blobs(ids=['blob-1']))
+        self.assertIsNone(self.collection.blob(id='blob-1'))
+        self.drs.get_blob.assert_not_called()
+
+    def test_find_blob_by_name_binds_name_as_parameter(self):
+        self._respond_with([dict(drs_url='drs://example.com/blob-1')])
+
+        self.assertEqual('resolved:drs://example.com/blob-1', self.collection.find_blob_by_name('a.txt'))
+        self.dc.query.assert_called_once_with(
+            'SELECT drs_url FROM "collections"."sample_data"."_files" WHERE name = ? LIMIT 1',
+            no_auth=False,
+            parameters=['a.txt']
+        )
+
+    def test_find_blobs_by_names_with_single_query(self):
+        self._respond_with([
+            dict(name='a.txt', drs_url='drs://example.com/blob-1'),
+            dict(name='b.txt', drs_url='drs://example.com/blob-2'),
+            # Only the first match for each name is used.
+            dict(name='a.txt', drs_url='drs://example.com/blob-3'),
+        ])
+
+        blobs = self.collection.find_blobs_by_names(['a.txt', 'b.txt', 'c.txt'])
+
+        self.assertEqual({'a.txt': 'resolved:drs://example.com/blob-1', 'b.txt': 'resolved:drs://example.com/blob-2'},
+                         blobs)
+        self.dc.query.assert_called_once_with(
+            'SELECT name, drs_url FROM "collections"."sample_data"."_files" WHERE name IN (?, ?, ?)',
+            no_auth=False,
+            parameters=['a.txt', 'b.txt', 'c.txt']
+        )
+
+    def test_find_blobs_by_names_rejects_empty_list(self):
+        with self.assertRaises(AssertionError):
+            self.collection.find_blobs_by_names([])
+
+        self.dc.query.assert_not_called()
+
+    def test_blobs_are_resolved_concurrently(self):
+        self._respond_with([dict(id=f'blob-{i}', name=f'{i}.txt') for i in range(3)])
+        # Every resolution waits for the others, so this only passes when all of them run at the same time.
+        barrier = threading.Barrier(3, timeout=5)
+
+        def get_blob(blob_id: str):
+            barrier.wait()
+            return f'resolved:{blob_id}'
+
+        self.drs.get_blob.side_effect = get_blob
+
+        blobs = self.collection.blobs(ids=['blob-0', 'blob-1', 'blob-2'], max_workers=3)
+
+        self.assertEqual(['blob-0', 'blob-1', 'blob-2'], list(blobs.keys()))
+        self.assertEqual(['resolved:blob-0', 'resolved:blob-1', 'resolved:blob-2'], list(blobs.values()))
+
+    def test_blob_resolution_error_is_raised(self):
+        self._respond_with([dict(id='blob-1', name='a.txt'), dict(id='blob-2', name='b.txt')])
+        self.drs.get_blob.side_effect = _resolve_all_but_second_blob
+
+        with self.assertRaisesRegex(RuntimeError, 'blob-2'):
+            self.collection.blobs(ids=['blob-1', 'blob-2'])
@@ -0,0 +1,157 @@
+import asyncio
+from datetime import datetime
+from typing import List
+from unittest import TestCase
+from unittest.mock import MagicMock, patch, AsyncMock
+
+from dnastack.alpha.app.workbench import Workbench, WorkbenchRunException, RunStatus
+from dnastack.client.workbench.ewes.models import BatchActionResult, ExtendedRunStatus, ExtendedRun, Log, LogType
+
+
+def _create_workbench(ewes_client: MagicMock) -> Workbench:
+    with patch('dnastack.use'):
+        workbench = Workbench('https://workbench.dnastack.com')
+    workbench._ewes_client = ewes_client
+    return workbench
+
+
+def _create_run_status(run_id: str, state: str) -> ExtendedRunStatus:
+    return ExtendedRunStatus(run_id=run_id, state=state, start_time=datetime.now())
+
+
+def _create_batch_action_result(*results: dict) -> BatchActionResult:
+    return BatchActionResult(results=list(results))
+
+
+class TestWorkbenchCancelBatch(TestCase):
+    def _cancel_batch(self, batch_action_result: BatchActionResult, run_ids: List[str]):
+        ewes_client = MagicMock()
+        ewes_client.list_runs.return_value = [_create_run_status(run_id, 'RUNNING') for run_id in run_ids] + [
+            _create_run_status('failed-run', 'EXECUTOR_ERROR'),
+            _create_run_status('canceled-run', 'CANCELED'),
+        ]
+        ewes_client.cancel_runs.return_value = batch_action_result
+
+        _create_workbench(ewes_client).cancel_batch('batch-1')
+
+        ewes_client.cancel_runs.assert_called_once_with(run_ids)
+
+    def test_successful_cancellation(self):
+        self._cancel_batch(_create_batch_action_result(dict(outcome='SUCCESS'), dict(outcome='SUCCESS')),
+                           ['run-1', 'run-2'])
+
+    def test_failures_are_matched_by_the_run_id_in_the_result(self):
+        with self.assertRaises(WorkbenchRunException) as context:
+            # The results are not in the same order as the requested runs.
+            self._cancel_batch(_create_batch_action_result(dict(outcome='FAILURE', data=dict(run_id='run-2')),
+                                                           dict(outcome='SUCCESS', data=dict(run_id='run-1'))),
+                               ['run-1', 'run-2'])
+
+        self.assertEqual(['run-2'], context.exception.failed_runs)
+
+    def test_unconfirmed_runs_are_reported_as_failed(self):
+        with self.assertRaises(WorkbenchRunException) as context:
+            # Without the run IDs, a short response cannot be matched to the requested runs.
+            self._cancel_batch(_create_batch_action_result(dict(outcome='SUCCESS')),
+                               ['run-1', 'run-2'])
+
+        self.assertEqual(['run-1', 'run-2'], context.exception.failed_runs)
+
+    def test_request_error_is_chained(self):
+        ewes_client = MagicMock()
+        ewes_client.list_runs.return_value = [_create_run_status('run-1', 'QUEUED')]
+        ewes_client.cancel_runs.side_effect = ConnectionError('Connection refused')
+
+        with self.assertRaises(WorkbenchRunException) as context:
+            _create_workbench(ewes_client).cancel_batch('batch-1')
+
+        self.assertEqual(['run-1'], context.exception.failed_runs)
+        self.assertIsInstance(context.exception.__cause__, ConnectionError)
+
+    def test_nothing_to_cancel(self):
+        ewes_client = MagicMock()
+        ewes_client.list_runs.return_value = [_create_run_status('run-1', 'CANCELED')]
+
+        self.assertIsNone(_create_workbench(ewes_client).cancel_batch('batch-1'))
+        ewes_client.cancel_runs.assert_not_called()
+
+
+class TestWorkbenchTaskLogs(TestCase):
+    def setUp(self):
+        self.ewes_client = MagicMock()
+        self.workbench = _create_workbench(self.ewes_client)
+        self.run = ExtendedRun(run_id='run-1', task_logs=[Log(task_id='task-1', name='alpha'),
+                                                          Log(task_id='task-2', name='bravo')])
+
+    def test_stream_task_log_by_task_name(self):
+        self.workbench.stream_task_log_by_task(self.run, 'bravo', LogType.STDOUT)
+
+        self.ewes_client.stream_task_logs.assert_called_once_with(run_id='run-1',
+                                                                  task_id='task-2',
+                                                                  log_type=LogType.STDOUT,
+                                                                  max_bytes=None)
+
+    def test_unknown_task_raises_key_error(self):
+        with self.assertRaises(KeyError):
+            self.workbench.stream_task_log_by_task(self.run, 'charlie', LogType.STDOUT)
+
+        self.ewes_client.stream_task_logs.assert_not_called()
+
+
+class TestWorkbenchPolling(TestCase):
+    def setUp(self):
+        self.ewes_client = MagicMock()
+        self.workbench = _create_workbench(self.ewes_client)
+
+    def _poll(self, poll_coroutine) -> List[float]:
+        # The jitter is disabled to make the delays predictable.
+        with patch('dnastack.alpha.app.workbench.asyncio.sleep', new_callable=AsyncMock) as sleep, \
+                patch('dnastack.alpha.app.workbench.random.uniform', return_value=1.0):
+            asyncio.run(poll_coroutine)
+        return [c.args[0] for c in sleep.call_args_list]
+
+    def test_poll_delay_backs_off_exponentially_up_to_the_maximum(self):
+        for attempt, expected_delay in enumerate([2, 4, 8, 16, 30, 30]):
+            delay = Workbench._get_poll_delay(2, 30, attempt)
+            self.assertGreaterEqual(delay, expected_delay * 0.8)
+            self.assertLessEqual(delay, expected_delay * 1.2)
+
+        # A large number of attempts is still capped.
+        self.assertLessEqual(Workbench._get_poll_delay(2, 30, 1000), 30 * 1.2)
+
+    def test_poll_run_status_resets_the_delay_on_state_change(self):
+        self.ewes_client.get_run.side_effect = [
+            ExtendedRun(run_id='run-1', state=state)
+            for state in ['QUEUED', 'QUEUED', 'RUNNING', 'RUNNING', 'RUNNING', 'COMPLETE']
+        ]
+        state_changes = []
+
+        delays = self._poll(self.workbench.poll_run_status_until('run-1',
+                                                                 RunStatus.COMPLETE,
+                                                                 poll_interval=2,
+                                                                 on_state_change=state_changes.append,
+                                                                 max_poll_interval=5))
+
+        self.assertEqual([2, 4, 2, 4, 5], delays)
+        self.assertEqual([RunStatus.QUEUED, RunStatus.RUNNING, RunStatus.COMPLETE], state_changes)
+
+    def test_poll_run_status_stops_on_failure(self):
+        self.ewes_client.get_run.side_effect = [
+            ExtendedRun(run_id='run-1', state=state)
+            for state in ['RUNNING', 'EXECUTOR_ERROR']
+        ]
+
+        with self.assertRaises(WorkbenchRunException):
+            self._poll(self.workbench.poll_run_status_until('run-1', RunStatus.COMPLETE))
+
+        self.assertEqual(2, self.ewes_client.get_run.call_count)
+
+    def test_poll_batch_status_resets_the_delay_on_state_change(self):
+        self.ewes_client.list_runs.side_effect = [
+            [_create_run_status('run-1', state), _create_run_status('run-2', state)]
+            for state in ['RUNNING', 'RUNNING', 'RUNNING', 'COMPLETE']
+        ]
+
+        delays = self._poll(self.workbench.poll_batch_status_until('batch-1', RunStatus.COMPLETE, poll_interval=1))
+
+        self.assertEqual([1, 2, 4], delays)
@@ -0,0 +1,110 @@
+import json
+import lzma
+from base64 import b64encode, b64decode
+from typing import List
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from dnastack.alpha.cli.auth import AuthCommandHandler, SessionBackup, SessionEntry, _compress_backup, \
+    _decode_backup, _XZ_HEADER_MAGIC, _LARGE_BACKUP_SIZE
+from dnastack.cli.helpers.exporter import normalize, to_json
+from dnastack.common.auth_manager import ExtendedAuthState
+from dnastack.http.authenticators.abstract import AuthStateStatus
+from dnastack.http.session_info import Session
+
+
+def _create_state(index: int, status: str = AuthStateStatus.READY) -> ExtendedAuthState:
+    return ExtendedAuthState(authenticator='oauth2',
+                             id=f'session-{index}',
+                             auth_info=dict(client_id='sample-client'),
+                             session_info=dict(access_token=f'access-token-{index}-é',
+                                               token_type='Bearer',
+                                               issued_at=1000 + index,
+                                               valid_until=2000 + index),
+                             status=status,
+                             endpoints=[f'endpoint-{index}'])
+
+
+def _create_handler(states: List[ExtendedAuthState]) -> AuthCommandHandler:
+    # NOTE: The handler is not initialized with the configuration as only the auth manager is used here.
+    handler = AuthCommandHandler.__new__(AuthCommandHandler)
+    handler._auth_manager = MagicMock()
+    handler._auth_manager.get_states.side_effect = lambda endpoint_ids: iter(states)
+    return handler
+
+
+def _create_expected_backup(states: List[ExtendedAuthState]) -> SessionBackup:
+    return SessionBackup(sessions=[
+        SessionEntry(id=state.id, session=Session(**state.session_info), endpoints=state.endpoints)
+        for state in states
+        if state.status == AuthStateStatus.READY
+    ])
+
+
+class TestSessionBackup(TestCase):
+    def _export_compressed_backup(self, states: List[ExtendedAuthState]) -> str:
+        # This is what "dnastack alpha auth export --compress" prints.
+        return b64encode(_compress_backup(_create_handler(states).stream_backup(None))).decode('ascii')
+
+    def test_streamed_backup_is_the_same_as_the_created_backup(self):
+        states = [_create_state(i) for i in range(3)] + [_create_state(3, AuthStateStatus.REAUTH_REQUIRED)]
+        handler = _create_handler(states)
+
+        self.assertEqual(json.loads(to_json(normalize(handler.create_backup(None)))),
+                         json.loads(b''.join(handler.stream_backup(None))))
+
+    def _assert_compressed_backup_round_trip(self, states: List[ExtendedAuthState]):
+        exported_backup = self._export_compressed_backup(states)
+        expected_backup = _create_expected_backup(states)
+
+        self.assertTrue(b64decode(exported_backup).startswith(_XZ_HEADER_MAGIC))
+        self.assertEqual(expected_backup, _decode_backup(exported_backup))
+
+        # The earlier versions of the importer always decompress the backup.
+        legacy_content = json.loads(lzma.decompress(b64decode(exported_backup)))
+        self.assertEqual(expected_backup, SessionBackup(**legacy_content))
+
+    def test_round_trip_of_small_compressed_backup(self):
+        states = [_create_state(0)]
+        self.assertLess(sum(len(chunk) for chunk in _create_handler(states).stream_backup(None)), _LARGE_BACKUP_SIZE)
+        self._assert_compressed_backup_round_trip(states)
+
+    def test_round_trip_of_large_compressed_backup(self):
+        states = [_create_state(i) for i in range(100)]
+        self.assertGreater(sum(len(chunk) for chunk in _create_handler(states).stream_backup(None)), _LARGE_BACKUP_SIZE)
+        self._assert_compressed_backup_round_trip(states)
+
+    def test_round_trip_of_uncompressed_backup(self):
+        states = [_create_state(i) for i in range(3)]
+        backup = _create_handler(states).create_backup(None)
+
+        for indent in [None, 2]:
+            self.assertEqual(_create_expected_backup(states), _decode_backup(to_json(normalize(backup), indent=indent)))
+
+        # Any amount of the leading whitespaces is ignored.
+        self.assertEqual(_create_expected_backup(states), _decode_backup(' \n' * 1000 + to_json(normalize(backup))))
+
+    def test_streamed_backup_without_sessions(self):
+        self.assertEqual(json.loads(to_json(normalize(SessionBackup()))),
+                         json.loads(b''.join(_create_handler([]).stream_backup(None))))
+
+    def test_import_of_backups_from_earlier_versions(self):
+        states = [_create_state(i) for i in range(3)]
+        expected_backup = _create_expected_backup(states)
+        legacy_json = json.dumps(normalize(expected_backup))
+
+        # The earlier versions always compressed the backup with XZ, regardless of its size.
+        self.assertEqual(expected_backup, _decode_backup(b64encode(lzma.compress(legacy_json.encode('utf-8'))).decode()))
+        self.assertEqual(expected_backup, _decode_backup(legacy_json))
+        self.assertEqual(expected_backup, _decode_backup(f'\n  {json.dumps(normalize(expected_backup), indent=2)}\n'))
+
+    def test_exported_sessions_are_only_reported_to_terminal(self):
+        states = [_create_state(0), _create_state(1, AuthStateStatus.REAUTH_REQUIRED)]
+
+        for is_terminal, expected_results in [(True, ['Exported', 'Ignored']), (False, ['Ignored'])]:
+            with patch('dnastack.alpha.cli.auth.sys.stderr') as stderr, \
+                    patch('dnastack.alpha.cli.auth.echo_result') as echo_result:
+                stderr.isatty.return_value = is_terminal
+                b''.join(_create_handler(states).stream_backup(None))
+
+            self.assertEqual(expected_results, [c.args[2] for c in echo_result.call_args_list])
@@ -0,0 +1,31 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from dnastack.alpha.cli import workflow_param_parser
+from dnastack.alpha.cli.workflow_param_parser import WorkflowParamParser
+
+
+class TestWorkflowParamParser(TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.param_file_path = os.path.join(self.temp_dir.name, 'params.json')
+        with open(self.param_file_path, 'w') as f:
+            f.write('{\n  "alpha": 1,\n  "bravo": [1, 2]\n}\n')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_value_with_at_sign_is_not_a_file_reference(self):
+        self.assertEqual({'email': 'someone@example.com', 'name': 'alpha'},
+                         WorkflowParamParser().parse('email=someone@example.com,name=alpha'))
+
+    def test_file_reference_is_inlined_without_whitespaces(self):
+        self.assertEqual({'params': '{"alpha":1,"bravo":[1,2]}', 'name': 'alpha'},
+                         WorkflowParamParser().parse(f'params=@{self.param_file_path},name=alpha'))
+
+    def test_file_reference_exceeding_maximum_size(self):
+        with patch.object(workflow_param_parser, '_MAX_PARAM_FILE_SIZE', 8):
+            with self.assertRaises(ValueError):
+                WorkflowParamParser().parse(f'params=@{self.param_file_path}')
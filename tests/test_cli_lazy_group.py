@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+from importlib import import_module
+from unittest import TestCase
+
+from click import Context, Command
+
+from dnastack.__main__ import dnastack
+from dnastack.alpha.cli.commands import alpha_command_group
+from dnastack.alpha.cli.workbench.commands import alpha_workbench_command_group
+from dnastack.cli.helpers.command.group import LazyAliasedGroup
+from dnastack.cli.workbench.commands import workbench_command_group
+
+_LAZY_GROUPS = [dnastack, alpha_command_group, alpha_workbench_command_group, workbench_command_group]
+
+
+def _run_python(script: str, dev_mode: bool) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, '-c', script],
+                          capture_output=True,
+                          text=True,
+                          env={**os.environ, 'DNASTACK_DEV': 'true' if dev_mode else 'false'})
+
+
+class TestLazyAliasedGroup(TestCase):
+    def test_declared_help_and_aliases_match_the_sub_commands(self):
+        for group in _LAZY_GROUPS:
+            self.assertIsInstance(group, LazyAliasedGroup)
+            self.assertEqual(set(group.lazy_sub_commands), set(group.lazy_sub_command_help), group.name)
+            self.assertLessEqual(set(group.lazy_sub_aliases), set(group.lazy_sub_commands), group.name)
+
+            for cmd_name, import_path in group.lazy_sub_commands.items():
+                module_name, attribute_name = import_path.split(':', 1)
+                cmd = getattr(import_module(module_name), attribute_name)
+                declared_help = group.lazy_sub_command_help[cmd_name]
+
+                self.assertEqual(sorted(getattr(cmd, 'aliases', [])),
+                                 sorted(group.lazy_sub_aliases.get(cmd_name, [])),
+                                 f'{group.name} {cmd_name}')
+
+                if cmd.hidden:
+                    self.assertIsNone(declared_help, f'{group.name} {cmd_name}')
+                else:
+                    self.assertIsNotNone(declared_help, f'{group.name} {cmd_name}')
+                    for limit in [20, 45, 80]:
+                        self.assertEqual(cmd.get_short_help_str(limit),
+                                         Command(cmd_name, help=declared_help).get_short_help_str(limit),
+                                         f'{group.name} {cmd_name}')
+
+    def test_declared_help_and_aliases_match_the_sub_commands_in_every_mode(self):
+        # The visibility of some groups depends on the dev mode, which is only read when the groups are imported.
+        test_name = f'{__name__}.{type(self).__name__}.test_declared_help_and_aliases_match_the_sub_commands'
+        for dev_mode in [True, False]:
+            completed_process = _run_python(f'import unittest; unittest.main(module=None, argv=["", "{test_name}"])',
+                                            dev_mode)
+            self.assertEqual(0, completed_process.returncode, completed_process.stderr)
+
+    def test_help_does_not_import_the_sub_commands(self):
+        script = '\n'.join([
+            'import sys',
+            'from click.testing import CliRunner',
+            'from dnastack.__main__ import dnastack, _LAZY_SUBCOMMANDS',
+            'from dnastack.feature_flags import dev_mode',
+            'result = CliRunner().invoke(dnastack, ["--help"])',
+            'assert result.exit_code == 0, result.output',
+            'assert "collections (cs)" in result.output, result.output',
+            'assert ("contexts" in result.output) == dev_mode, result.output',
+            'imported = [p for p in _LAZY_SUBCOMMANDS.values() if p.split(":")[0] in sys.modules]',
+            'assert not imported, imported',
+        ])
+        for dev_mode in [True, False]:
+            completed_process = _run_python(script, dev_mode)
+            self.assertEqual(0, completed_process.returncode, completed_process.stderr)
+
+    def test_lazy_sub_command_is_imported_on_request(self):
+        with Context(workbench_command_group) as ctx:
+            self.assertEqual('runs', workbench_command_group.get_command(ctx, 'runs').name)
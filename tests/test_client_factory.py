@@ -0,0 +1,75 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from dnastack.cli.helpers.client_factory import ConfigurationBasedClientFactory
+from dnastack.client.data_connect import DataConnectClient, DATA_CONNECT_TYPE_V1_0
+from dnastack.client.models import ServiceEndpoint
+from dnastack.configuration.manager import ConfigurationManager
+from dnastack.configuration.models import Configuration
+from dnastack.context.models import Context
+
+
+class TestConfigurationBasedClientFactory(TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.config_manager = ConfigurationManager(os.path.join(self.temp_dir.name, 'config.yaml'))
+        self.factory = ConfigurationBasedClientFactory(self.config_manager)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _save_context(self, context: Context):
+        configuration = Configuration()
+        configuration.contexts['sample'] = context
+        configuration.current_context = 'sample'
+        self.config_manager.save(configuration)
+
+    def _save_context_with_data_connect_endpoint(self, is_default: bool = True):
+        self._save_context(Context(
+            endpoints=[ServiceEndpoint(id='dc', url='https://dc.example.com/', type=DATA_CONNECT_TYPE_V1_0)],
+            defaults={'data_connect': 'dc'} if is_default else dict(),
+        ))
+
+    def test_find_returns_the_same_client_as_get(self):
+        self._save_context_with_data_connect_endpoint()
+
+        client = self.factory.find(DataConnectClient)
+
+        self.assertIsInstance(client, DataConnectClient)
+        self.assertEqual(self.factory.get(DataConnectClient).endpoint, client.endpoint)
+        self.assertEqual('dc', self.factory.find(DataConnectClient, endpoint_id='dc').endpoint.id)
+
+    def test_find_returns_none_without_endpoint(self):
+        self._save_context(Context())
+        self.assertIsNone(self.factory.find(DataConnectClient))
+
+        self._save_context_with_data_connect_endpoint(is_default=False)
+        self.assertIsNone(self.factory.find(DataConnectClient))
+        self.assertIsNone(self.factory.find(DataConnectClient, endpoint_id='unknown'))
+
+    def test_find_returns_none_without_context(self):
+        self._save_context_with_data_connect_endpoint()
+        self.assertIsNone(self.factory.find(DataConnectClient, context_name='unknown'))
+        self.assertFalse(self.factory.has_endpoint(DataConnectClient, context_name='unknown'))
+
+    def test_has_endpoint(self):
+        self._save_context_with_data_connect_endpoint(is_default=False)
+        self.assertTrue(self.factory.has_endpoint(DataConnectClient, endpoint_id='dc'))
+        self.assertFalse(self.factory.has_endpoint(DataConnectClient))
+        self.assertFalse(self.factory.has_endpoint(DataConnectClient, endpoint_id='unknown'))
+
+    def test_find_does_not_suppress_assertion_error_from_configuration(self):
+        self._save_context_with_data_connect_endpoint()
+
+        with patch.object(DataConnectClient, 'get_supported_service_types', side_effect=AssertionError('invalid')):
+            with self.assertRaisesRegex(AssertionError, 'invalid'):
+                self.factory.find(DataConnectClient)
+
+    def test_find_does_not_suppress_error_from_client_instantiation(self):
+        self._save_context_with_data_connect_endpoint()
+
+        with patch.object(DataConnectClient, 'make', side_effect=AssertionError('invalid client')):
+            with self.assertRaisesRegex(AssertionError, 'invalid client'):
+                self.factory.find(DataConnectClient)
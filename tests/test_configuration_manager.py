@@ -0,0 +1,72 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from dnastack.configuration.manager import ConfigurationManager
+from dnastack.configuration.models import Configuration
+from dnastack.context.models import Context
+
+
+class TestConfigurationManager(TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, 'config.yaml')
+        self.manager = ConfigurationManager(self.file_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _save_with_current_context(self, context_name: str):
+        configuration = Configuration()
+        configuration.contexts[context_name] = Context()
+        configuration.current_context = context_name
+        self.manager.save(configuration)
+
+    def test_load_returns_independent_copies(self):
+        self._save_with_current_context('alpha')
+
+        first_configuration = self.manager.load()
+        first_configuration.current_context = 'modified'
+        first_configuration.contexts['alpha'].defaults['data_connect'] = 'modified'
+
+        second_configuration = self.manager.load()
+        self.assertEqual('alpha', second_configuration.current_context)
+        self.assertEqual(dict(), second_configuration.contexts['alpha'].defaults)
+        self.assertIsNot(second_configuration, self.manager.load())
+
+    def test_save_invalidates_the_cached_configuration(self):
+        self._save_with_current_context('alpha')
+        self.assertEqual('alpha', self.manager.load().current_context)
+
+        self._save_with_current_context('bravo')
+        self.assertEqual('bravo', self.manager.load().current_context)
+
+    def test_hard_reset_invalidates_the_cached_configuration(self):
+        self._save_with_current_context('alpha')
+        self.assertEqual('alpha', self.manager.load().current_context)
+
+        self.manager.hard_reset()
+
+        self.assertFalse(os.path.exists(self.file_path))
+        self.assertEqual(Configuration().current_context, self.manager.load().current_context)
+
+    def test_external_edit_invalidates_the_cached_configuration(self):
+        self._save_with_current_context('alpha')
+        self.assertEqual('alpha', self.manager.load().current_context)
+        original_stat = os.stat(self.file_path)
+
+        # Another process (or another manager) changes the file. The modification time is set explicitly to be newer
+        # as the file system may not tell both writes apart otherwise.
+        ConfigurationManager(self.file_path).save(self.manager.load().copy(update=dict(current_context='default')))
+        os.utime(self.file_path, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns + 1_000_000))
+        self.assertEqual('default', self.manager.load().current_context)
+
+    def test_external_edit_with_different_size_and_same_modification_time(self):
+        self._save_with_current_context('alpha')
+        self.assertEqual('alpha', self.manager.load().current_context)
+        original_stat = os.stat(self.file_path)
+
+        ConfigurationManager(self.file_path).save(self.manager.load().copy(update=dict(current_context='default')))
+        os.utime(self.file_path, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns))
+        self.assertNotEqual(original_stat.st_size, os.stat(self.file_path).st_size)
+        self.assertEqual('default', self.manager.load().current_context)
@@ -0,0 +1,43 @@
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+from dnastack.cli.helpers import exporter
+from dnastack.cli.helpers.exporter import to_json, to_json_bytes, from_json
+
+_SAMPLE_CONTENT = {'a': 'é', 'b': [1, 2], 'c': {'d': None, 'e': 1.5, 'f': True}}
+
+
+class TestExporter(TestCase):
+    def test_to_json_is_the_same_as_the_standard_library(self):
+        for indent in [None, 2, 4]:
+            self.assertEqual(json.dumps(_SAMPLE_CONTENT, indent=indent), to_json(_SAMPLE_CONTENT, indent=indent))
+
+        # The non-ASCII characters are escaped and the items are separated with spaces.
+        self.assertEqual('{"a": "\\u00e9", "b": [1, 2]}', to_json({'a': 'é', 'b': [1, 2]}, indent=None))
+
+    def test_to_json_bytes_is_the_same_with_or_without_orjson(self):
+        for indent in [None, 2]:
+            encoded_content = to_json_bytes(_SAMPLE_CONTENT, indent=indent)
+
+            with patch.object(exporter, 'orjson', None):
+                self.assertEqual(encoded_content, to_json_bytes(_SAMPLE_CONTENT, indent=indent))
+
+            self.assertEqual(_SAMPLE_CONTENT, from_json(encoded_content))
+
+        self.assertEqual('{"a":"é","b":[1,2]}'.encode('utf-8'), to_json_bytes({'a': 'é', 'b': [1, 2]}))
+
+    def test_to_json_bytes_with_non_string_keys(self):
+        self.assertEqual(b'{"1":"x"}', to_json_bytes({1: 'x'}))
+
+    def test_from_json_decodes_what_orjson_rejects(self):
+        for content in ['{"a": NaN, "b": Infinity, "c": -Infinity}', '[1, 2.5, "é", null]']:
+            expected_content = json.loads(content)
+            self.assertEqual(json.dumps(expected_content), json.dumps(from_json(content)))
+            self.assertEqual(json.dumps(expected_content), json.dumps(from_json(content.encode('utf-8'))))
+
+    def test_from_json_rejects_invalid_content(self):
+        for decoder in [exporter.orjson, None]:
+            with patch.object(exporter, 'orjson', decoder):
+                with self.assertRaises(ValueError):
+                    from_json('{"a": ')
@@ -0,0 +1,37 @@
+import json
+from typing import Iterator, List
+from unittest import TestCase
+from unittest.mock import patch
+
+from dnastack.cli.helpers import iterator_printer
+from dnastack.cli.helpers.iterator_printer import JsonIteratorPrinter
+
+_SAMPLE_ITEMS = [{'id': 'a', 'name': 'é', 'tags': [1, 2]}, {'id': 'b', 'name': None, 'tags': []}]
+
+
+class TestJsonIteratorPrinter(TestCase):
+    def setUp(self):
+        self.echoed_text: List[str] = []
+        echo_patcher = patch.object(iterator_printer.click, 'echo', side_effect=self._echo)
+        echo_patcher.start()
+        self.addCleanup(echo_patcher.stop)
+
+    def _echo(self, text: str = '', nl: bool = True):
+        self.echoed_text.append(text + ('\n' if nl else ''))
+
+    def test_output_is_the_same_as_the_standard_library(self):
+        self.assertEqual(2, JsonIteratorPrinter().print(iter(_SAMPLE_ITEMS)))
+        self.assertEqual(json.dumps(_SAMPLE_ITEMS, indent=2) + '\n', ''.join(self.echoed_text))
+
+    def test_empty_iterator(self):
+        self.assertEqual(0, JsonIteratorPrinter().print(iter([])))
+        self.assertEqual('[]\n', ''.join(self.echoed_text))
+
+    def test_each_item_is_printed_before_the_next_one_is_read(self):
+        def generate_items() -> Iterator[dict]:
+            for index, item in enumerate(_SAMPLE_ITEMS):
+                if index > 0:
+                    self.assertIn('"id": "a"', ''.join(self.echoed_text))
+                yield item
+
+        JsonIteratorPrinter().print(generate_items())
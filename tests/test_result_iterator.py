@@ -0,0 +1,77 @@
+from typing import List, Optional
+from unittest import TestCase
+
+from dnastack.client.result_iterator import ResultLoader, ResultIterator, InactiveLoaderError
+
+
+class _PageLoader(ResultLoader):
+    prefetchable = True
+
+    def __init__(self, pages: List[List[int]], failing_page: Optional[int] = None):
+        self.pages = pages
+        self.failing_page = failing_page
+        self.load_count = 0
+
+    def has_more(self) -> bool:
+        return self.load_count < len(self.pages)
+
+    def load(self) -> List[int]:
+        if not self.has_more():
+            raise InactiveLoaderError()
+
+        page_index = self.load_count
+        self.load_count += 1
+
+        if page_index == self.failing_page:
+            raise RuntimeError(f'Failed to load page #{page_index}')
+
+        return list(self.pages[page_index])
+
+
+class TestResultIterator(TestCase):
+    def test_pages_are_loaded_on_demand_by_default(self):
+        loader = _PageLoader([[1, 2], [3, 4], [5]])
+        iterator = ResultIterator(loader)
+
+        self.assertEqual(1, next(iterator))
+        self.assertEqual(2, next(iterator))
+        self.assertEqual(1, loader.load_count)
+
+        self.assertEqual([3, 4, 5], list(iterator))
+        self.assertEqual(3, loader.load_count)
+
+    def test_prefetch_yields_every_item_in_order(self):
+        loader = _PageLoader([[1, 2], [3, 4], [5]])
+        self.assertEqual([1, 2, 3, 4, 5], list(ResultIterator(loader, prefetch=True)))
+        self.assertEqual(3, loader.load_count)
+
+    def test_prefetch_is_ignored_for_non_prefetchable_loaders(self):
+        loader = _PageLoader([[1, 2], [3, 4]])
+        loader.prefetchable = False
+        iterator = ResultIterator(loader, prefetch=True)
+
+        self.assertEqual(1, next(iterator))
+        self.assertEqual(1, loader.load_count)
+
+    def test_early_termination_stops_prefetching(self):
+        loader = _PageLoader([[1, 2], [3, 4], [5]])
+        iterator = ResultIterator(loader, prefetch=True)
+
+        self.assertEqual(1, next(iterator))
+        iterator.close()
+
+        with self.assertRaises(StopIteration):
+            next(iterator)
+
+        # Only the page following the consumed one may have been requested.
+        self.assertLessEqual(loader.load_count, 2)
+
+    def test_errors_from_prefetched_pages_are_raised_when_the_page_is_reached(self):
+        loader = _PageLoader([[1, 2], [3, 4], [5]], failing_page=1)
+        iterator = ResultIterator(loader, prefetch=True)
+
+        self.assertEqual(1, next(iterator))
+        self.assertEqual(2, next(iterator))
+
+        with self.assertRaisesRegex(RuntimeError, 'page #1'):
+            next(iterator)
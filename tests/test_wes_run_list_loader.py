@@ -0,0 +1,26 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from dnastack.alpha.client.wes.client import RunListLoader
+from dnastack.client.base_exceptions import DataConnectError
+from dnastack.http.session import ClientError
+
+
+class TestRunListLoader(TestCase):
+    def test_failed_requests_are_reported_with_the_recently_visited_urls(self):
+        error_response = MagicMock()
+        error_response.status_code = 400
+        error_response.text = 'Bad request'
+
+        http_session = MagicMock()
+        http_session.__enter__.return_value.get.side_effect = ClientError(error_response)
+
+        loader = RunListLoader(initial_url='https://wes.dnastack.com/runs', http_session=http_session)
+
+        for attempt in range(200):
+            with self.assertRaises(DataConnectError) as context:
+                loader.load()
+
+            self.assertEqual(400, context.exception.status)
+            self.assertEqual(min(attempt + 1, 128), len(context.exception.urls))
+            self.assertTrue(all(url == 'https://wes.dnastack.com/runs' for url in context.exception.urls))
@@ -0,0 +1,91 @@
+import json
+import threading
+import time
+from typing import List, Dict, Set
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from dnastack.alpha.client.wes.client import Run
+
+_RUN_URL = 'https://wes.example.com/runs/run-1'
+
+
+def _create_log(name: str) -> dict:
+    return dict(name=name, stdout=f'{_RUN_URL}/logs/{name}/stdout', stderr=f'{_RUN_URL}/logs/{name}/stderr')
+
+
+class TestRunLogs(TestCase):
+    def setUp(self):
+        run_info = MagicMock()
+        run_info.content = json.dumps(dict(run_id='run-1',
+                                           request=dict(workflow_url='main.wdl'),
+                                           state='COMPLETE',
+                                           run_log=_create_log('run'),
+                                           task_logs=[_create_log(f'task-{i}') for i in range(5)]))
+        self.session = MagicMock()
+        self.session.get.side_effect = lambda url: run_info if url == f'{_RUN_URL}/' else self._get_log(url)
+
+        self.worker_sessions: List[MagicMock] = []
+        self.threads_by_session: Dict[int, Set[int]] = dict()
+        self.blocked_log_release = threading.Event()
+        self.blocked_log_release.set()
+
+    def _get_log(self, url: str) -> MagicMock:
+        if not url.endswith('/task-0/stdout'):
+            self.assertTrue(self.blocked_log_release.wait(timeout=5))
+        response = MagicMock()
+        response.text = f'content of {url}\n'
+        return response
+
+    def _create_session(self) -> MagicMock:
+        session = MagicMock()
+        session.get.side_effect = lambda url: self._record_thread(session) or self._get_log(url)
+        self.worker_sessions.append(session)
+        return session
+
+    def _record_thread(self, session: MagicMock):
+        self.threads_by_session.setdefault(id(session), set()).add(threading.get_ident())
+
+    def _assert_log_outputs(self, run: Run, include_stderr: bool):
+        outputs = list(run.get_logs(include_stderr=include_stderr))
+
+        self.assertEqual([f'task-{i}' for i in range(5)] + ['run'], [output.origin.name for output in outputs])
+        for output in outputs:
+            log_url = f'{_RUN_URL}/logs/{output.origin.name}'
+            self.assertEqual(f'content of {log_url}/stdout', output.stdout)
+            self.assertEqual(f'content of {log_url}/stderr' if include_stderr else None, output.stderr)
+
+    def test_logs_are_loaded_concurrently_with_one_session_per_worker(self):
+        for include_stderr in [True, False]:
+            self.worker_sessions.clear()
+            self._assert_log_outputs(Run(self.session, _RUN_URL, session_factory=self._create_session), include_stderr)
+
+            self.assertTrue(self.worker_sessions)
+            for session in self.worker_sessions:
+                self.assertEqual(1, len(self.threads_by_session[id(session)]))
+                session.close.assert_called_once()
+
+        # The given session is only used to get the run.
+        self.assertEqual(2, self.session.get.call_count)
+
+    def test_logs_are_loaded_with_the_given_session_without_session_factory(self):
+        self._assert_log_outputs(Run(self.session, _RUN_URL), include_stderr=True)
+        self.assertEqual(1 + 12, self.session.get.call_count)
+
+    def test_early_termination_does_not_wait_for_requests_in_flight(self):
+        self.blocked_log_release.clear()
+        logs = Run(self.session, _RUN_URL, session_factory=self._create_session).get_logs()
+
+        self.assertEqual('task-0', next(logs).origin.name)
+
+        started_at = time.monotonic()
+        logs.close()
+        self.assertLess(time.monotonic() - started_at, 1)
+
+        # The sessions are closed once the requests in flight are done.
+        self.blocked_log_release.set()
+        deadline = time.monotonic() + 5
+        while not all(session.close.called for session in self.worker_sessions) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        for session in self.worker_sessions:
+            session.close.assert_called_once()
@@ -0,0 +1,102 @@
+import os
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from tempfile import TemporaryDirectory
+from typing import List, Tuple
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from dnastack.alpha.client.wes import client as wes_client_module
+from dnastack.alpha.client.wes.client import WesClient, RunRequest
+from dnastack.client.models import ServiceEndpoint
+from dnastack.http.authenticators.abstract import Authenticator
+from dnastack.http.session import HttpSession
+
+
+class _RunSubmissionHandler(BaseHTTPRequestHandler):
+    """ Reject the first submission as unauthenticated and accept the following ones """
+    received_requests: List[Tuple[str, bytes]] = []
+
+    # An incomplete body fails the test instead of blocking it.
+    timeout = 5
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.received_requests.append((self.headers['Content-Type'], body))
+
+        if len(self.received_requests) == 1:
+            self.send_response(401)
+            self.end_headers()
+        else:
+            response_body = b'{"run_id": "run-1"}'
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(response_body)))
+            self.end_headers()
+            self.wfile.write(response_body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestWesClientSubmission(TestCase):
+    def setUp(self):
+        _RunSubmissionHandler.received_requests = []
+        self.server = HTTPServer(('localhost', 0), _RunSubmissionHandler)
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+
+        self.temp_dir = TemporaryDirectory()
+        self.workflow_path = os.path.join(self.temp_dir.name, 'main.wdl')
+        self.workflow_content = b'version 1.0\n' + b'# padding\n' * 100000
+        with open(self.workflow_path, 'wb') as f:
+            f.write(self.workflow_content)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.server_thread.join()
+        self.temp_dir.cleanup()
+
+    def _submit(self) -> str:
+        authenticator = MagicMock(Authenticator)
+        authenticator.session_id = 1
+
+        client = WesClient(ServiceEndpoint(id='wes', url=f'http://localhost:{self.server.server_port}/'))
+        with patch.object(client,
+                          'create_http_session',
+                          return_value=HttpSession(authenticators=[authenticator], suppress_error=False)):
+            run_id = client.submit(RunRequest(workflow_url='main.wdl',
+                                              workflow_params=dict(alpha='é'),
+                                              attachments=[self.workflow_path]))
+
+        # The first request is rejected and the same request is sent again after the re-authentication.
+        authenticator.revoke.assert_called_once()
+
+        return run_id
+
+    def _assert_identical_requests(self):
+        self.assertEqual(2, len(_RunSubmissionHandler.received_requests))
+
+        bodies = []
+        for content_type, body in _RunSubmissionHandler.received_requests:
+            boundary = content_type.split('boundary=', 1)[1].encode()
+            bodies.append(body.replace(boundary, b'BOUNDARY'))
+
+        self.assertEqual(bodies[0], bodies[1])
+        self.assertIn(self.workflow_content, bodies[1])
+
+    def test_retried_submission_streams_the_whole_body_again(self):
+        self.assertEqual('run-1', self._submit())
+        self._assert_identical_requests()
+
+    def test_retried_submission_without_requests_toolbelt(self):
+        with patch.object(wes_client_module, 'MultipartEncoder', None):
+            self.assertEqual('run-1', self._submit())
+        self._assert_identical_requests()
+
+    def test_form_data_without_exit_stack_reads_attachments_into_memory(self):
+        form_data = RunRequest(workflow_url='main.wdl', attachments=[self.workflow_path]).to_form_data()
+
+        self.assertEqual({'files'}, set(form_data))
+        self.assertIn(('workflow_attachment', ('main.wdl', self.workflow_content, None)), form_data['files'])
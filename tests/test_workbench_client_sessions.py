@@ -0,0 +1,37 @@
+from threading import Thread
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from dnastack.client.models import ServiceEndpoint
+from dnastack.client.workbench.workflow.client import WorkflowClient
+
+
+class TestWorkbenchClientSessions(TestCase):
+    def setUp(self):
+        self.client = WorkflowClient(ServiceEndpoint(id='wf', url='https://workbench.example.com/'), namespace='ns')
+        self.client.create_http_session = MagicMock(side_effect=lambda: MagicMock())
+
+    def test_session_is_reused_within_a_thread(self):
+        self.assertIs(self.client._get_http_session(), self.client._get_http_session())
+        self.assertEqual(1, self.client.create_http_session.call_count)
+
+    def test_each_thread_has_its_own_session(self):
+        thread_sessions = []
+        thread = Thread(target=lambda: thread_sessions.append(self.client._get_http_session()))
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(thread_sessions[0], self.client._get_http_session())
+
+    def test_close_closes_every_session(self):
+        thread_sessions = []
+        thread = Thread(target=lambda: thread_sessions.append(self.client._get_http_session()))
+        thread.start()
+        thread.join()
+        main_session = self.client._get_http_session()
+
+        self.client.close()
+
+        thread_sessions[0].close.assert_called_once()
+        main_session.close.assert_called_once()
+        self.assertIsNot(main_session, self.client._get_http_session())
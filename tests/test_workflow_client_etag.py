@@ -0,0 +1,116 @@
+import json
+from typing import Optional
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from dnastack.alpha.client.wes.client import WesClient
+from dnastack.alpha.client.workflow import client as workflow_client_module
+from dnastack.alpha.client.workflow.client import WorkflowClient
+from dnastack.alpha.client.workflow.models import Workflow
+from dnastack.client.models import ServiceEndpoint
+
+
+def _create_response(status_code: int, workflow_id: str = 'wf-1', etag: str = 'v1') -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    if status_code == 200:
+        response.content = json.dumps(dict(internalId=workflow_id,
+                                           source='CUSTOM',
+                                           name=f'Workflow {workflow_id}',
+                                           latestVersion='1.0')).encode()
+        response.headers = {'Etag': f'"{etag}"'}
+    else:
+        response.content = b''
+        response.headers = dict()
+    return response
+
+
+class TestWorkflowClientEtagCache(TestCase):
+    def setUp(self):
+        self.session = MagicMock()
+        self.client = WorkflowClient(ServiceEndpoint(id='wf', url='https://workbench.example.com/'), namespace='ns')
+        self.client._get_http_session = MagicMock(return_value=self.session)
+
+    def test_not_modified_resource_is_a_copy_from_the_cache(self):
+        self.session.get.side_effect = [_create_response(200), _create_response(304), _create_response(304)]
+
+        first_workflow = self.client.get_workflow('wf-1')
+        self.assertEqual('v1', first_workflow.etag)
+        self.assertIsNone(self.session.get.call_args.kwargs['headers'])
+
+        # Changes made by the caller do not leak into the cache.
+        first_workflow.name = 'modified'
+
+        second_workflow = self.client.get_workflow('wf-1')
+        self.assertEqual({'If-None-Match': '"v1"'}, self.session.get.call_args.kwargs['headers'])
+        self.assertIsInstance(second_workflow, Workflow)
+        self.assertEqual('Workflow wf-1', second_workflow.name)
+        self.assertEqual('v1', second_workflow.etag)
+
+        third_workflow = self.client.get_workflow('wf-1')
+        self.assertEqual(second_workflow, third_workflow)
+        self.assertIsNot(second_workflow, third_workflow)
+
+    def test_modified_resource_replaces_the_cached_resource(self):
+        self.session.get.side_effect = [_create_response(200, etag='v1'),
+                                        _create_response(200, etag='v2'),
+                                        _create_response(304)]
+
+        self.client.get_workflow('wf-1')
+        self.assertEqual('v2', self.client.get_workflow('wf-1').etag)
+        self.assertEqual('v2', self.client.get_workflow('wf-1').etag)
+        self.assertEqual({'If-None-Match': '"v2"'}, self.session.get.call_args.kwargs['headers'])
+
+    def test_least_recently_used_resource_is_evicted(self):
+        self.session.get.side_effect = lambda url, headers: _create_response(200, url.split('/')[-1].split('?')[0])
+
+        with patch.object(workflow_client_module, '_MAX_ETAG_CACHE_SIZE', 2):
+            self.client.get_workflow('wf-1')
+            self.client.get_workflow('wf-2')
+            self.client.get_workflow('wf-1')
+            self.client.get_workflow('wf-3')
+
+            self.client.get_workflow('wf-1')
+            self.assertEqual({'If-None-Match': '"v1"'}, self.session.get.call_args.kwargs['headers'])
+
+            # "wf-2" was the least recently used resource when "wf-3" was added.
+            self.client.get_workflow('wf-2')
+            self.assertIsNone(self.session.get.call_args.kwargs['headers'])
+
+
+class TestWesServiceInfoEtagCache(TestCase):
+    def setUp(self):
+        self.session = MagicMock()
+        self.client = WesClient(ServiceEndpoint(id='wes', url='https://wes.example.com/ga4gh/wes/v1/'))
+        self.client.create_http_session = MagicMock()
+        self.client.create_http_session.return_value.__enter__.return_value = self.session
+
+    @staticmethod
+    def _create_response(status_code: int, etag: Optional[str] = 'v1') -> MagicMock:
+        response = MagicMock()
+        response.status_code = status_code
+        response.json.return_value = dict(workflow_engine_versions=dict(cromwell='1.0'))
+        response.headers = {'Etag': f'"{etag}"'} if status_code == 200 and etag else dict()
+        return response
+
+    def test_not_modified_service_info_is_a_copy_from_the_cache(self):
+        self.session.get.side_effect = [self._create_response(200), self._create_response(304)]
+
+        first_service_info = self.client.get_service_info()
+        self.assertIsNone(self.session.get.call_args.kwargs['headers'])
+
+        # Changes made by the caller do not leak into the cache.
+        first_service_info['workflow_engine_versions']['cromwell'] = 'modified'
+
+        second_service_info = self.client.get_service_info()
+        self.assertEqual({'If-None-Match': '"v1"'}, self.session.get.call_args.kwargs['headers'])
+        self.assertEqual(dict(workflow_engine_versions=dict(cromwell='1.0')), second_service_info)
+
+    def test_service_info_without_etag_is_not_cached(self):
+        self.session.get.side_effect = [self._create_response(200), self._create_response(200, etag=None),
+                                        self._create_response(200)]
+
+        self.client.get_service_info()
+        self.client.get_service_info()
+        self.client.get_service_info()
+        self.assertIsNone(self.session.get.call_args.kwargs['headers'])